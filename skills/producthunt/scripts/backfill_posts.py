@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Backfill posts for a date range into a local store, one day window at a time
+Usage: python3 scripts/backfill_posts.py --start 2025-01-01 --end 2025-12-31 --featured
+       python3 scripts/backfill_posts.py --start 2025-06-01 --end 2025-06-30 --topic ai --workers 4
+       python3 scripts/backfill_posts.py --start 2025-01-01 --fields votes,comments,created_at,topics
+"""
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta, timezone
+from producthunt_api import graphql, register_query, parse_fields, build_selection, POST_FIELDS
+from post_store import DEFAULT_STORE, check_filters, load_manifest, save_day
+from warehouse import connect, upsert_post
+
+QUERY_TEMPLATE = """
+query BackfillPosts($first: Int, $after: String, $featured: Boolean, $topic: String, $postedAfter: DateTime, $postedBefore: DateTime) {
+  posts(first: $first, after: $after, featured: $featured, topic: $topic, postedAfter: $postedAfter, postedBefore: $postedBefore) {
+    pageInfo { hasNextPage endCursor }
+    edges {
+      node {
+        FIELDS
+      }
+    }
+  }
+}
+"""
+
+DEFAULT_FIELDS = ["name", "tagline", "slug", "votes", "comments", "url", "website",
+                  "featured_at", "created_at", "makers", "topics"]
+
+
+def day_windows(start: date, end: date):
+    """Yield each day from start to end inclusive as YYYY-MM-DD"""
+    day = start
+    while day <= end:
+        yield day.isoformat()
+        day += timedelta(days=1)
+
+
+def fetch_day(query, day: str, featured: bool, topic: str, page_size: int) -> dict:
+    """Page one day window to completion; returns {post_id: post}"""
+    start = date.fromisoformat(day)
+    variables = {
+        "first": page_size,
+        "featured": True if featured else None,
+        "topic": topic,
+        "postedAfter": f"{day}T00:00:00Z",
+        "postedBefore": f"{(start + timedelta(days=1)).isoformat()}T00:00:00Z",
+    }
+    posts = {}
+    while True:
+        data = graphql(query, variables)
+        posts_data = data.get("posts") or {}
+        for edge in posts_data.get("edges", []):
+            node = edge["node"]
+            posts[node["id"]] = node
+        page_info = posts_data.get("pageInfo") or {}
+        if not page_info.get("hasNextPage") or not page_info.get("endCursor"):
+            return posts
+        variables["after"] = page_info["endCursor"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill ProductHunt posts by day")
+    parser.add_argument("--start", required=True, help="First day (YYYY-MM-DD)")
+    parser.add_argument("--end", help="Last day (YYYY-MM-DD, default: yesterday)")
+    parser.add_argument("--featured", "-f", action="store_true", help="Featured posts only")
+    parser.add_argument("--topic", "-t", help="Filter by topic slug")
+    parser.add_argument("--store", "-s", default=DEFAULT_STORE, help=f"Store directory (default: {DEFAULT_STORE})")
+    parser.add_argument("--workers", "-w", type=int, default=4, help="Day windows fetched concurrently")
+    parser.add_argument("--page-size", type=int, default=50, help="Posts per request (max 50)")
+    parser.add_argument("--redo", action="store_true", help="Refetch days already in the manifest")
+    parser.add_argument("--db", help="Also upsert posts into this SQLite warehouse")
+    parser.add_argument("--fields", help=f"Comma-separated post fields to store ({','.join(POST_FIELDS)})")
+    args = parser.parse_args()
+
+    try:
+        fields = parse_fields(args.fields, POST_FIELDS)
+    except ValueError as e:
+        parser.error(str(e))
+    # Fewer fields per post -> fewer complexity points per page
+    query = register_query(QUERY_TEMPLATE.replace("FIELDS", build_selection(fields or DEFAULT_FIELDS)))
+
+    today = datetime.now(timezone.utc).date()
+    start = date.fromisoformat(args.start)
+    end = date.fromisoformat(args.end) if args.end else today - timedelta(days=1)
+
+    filters = {"featured": args.featured, "topic": args.topic}
+    if fields:
+        filters["fields"] = fields
+    try:
+        check_filters(args.store, filters)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    manifest = {} if args.redo else load_manifest(args.store)
+    pending = [d for d in day_windows(start, end) if d not in manifest]
+    print(f"store: {args.store}")
+    print(f"days: {(end - start).days + 1} ({len(pending)} pending)")
+
+    conn = connect(args.db) if args.db else None
+    total = 0
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = {
+            pool.submit(fetch_day, query, day, args.featured, args.topic, min(args.page_size, 50)): day
+            for day in pending
+        }
+        for future in as_completed(futures):
+            day = futures[future]
+            posts = future.result()
+            # Today's window is still filling up, so it is never marked complete
+            save_day(args.store, day, posts, complete=date.fromisoformat(day) < today)
+            if conn:
+                with conn:
+                    for post in posts.values():
+                        upsert_post(conn, post)
+            total += len(posts)
+            print(f"  {day},{len(posts)}", file=sys.stderr)
+
+    print(f"posts_fetched: {total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Crawl the maker <-> product graph outward from seed makers
+Usage: python3 scripts/crawl_makers.py rrhoover chrismessina --depth 2
+       python3 scripts/crawl_makers.py --graph ./producthunt-makers      # Resume an interrupted crawl
+"""
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from producthunt_api import graphql_batch, iter_connection, register_query
+from maker_graph import DEFAULT_GRAPH, MakerGraph
+
+POST_SELECTION = "id name makers { id username }"
+
+# Remaining made posts of prolific makers, after the first batched page
+QUERY = register_query(f"""
+query MakerPosts($id: ID, $first: Int, $after: String) {{
+  user(id: $id) {{
+    madePosts(first: $first, after: $after) {{
+      pageInfo {{ hasNextPage endCursor }}
+      edges {{ node {{ {POST_SELECTION} }} }}
+    }}
+  }}
+}}
+""", ttl=3600)
+
+
+def fetch_makers(identifiers: list, first: int) -> dict:
+    """{identifier: (user, made posts)} via aliased batches, paging prolific makers"""
+    selection = f"""
+        id
+        username
+        madePosts(first: {first}) {{
+          pageInfo {{ hasNextPage endCursor }}
+          edges {{ node {{ {POST_SELECTION} }} }}
+        }}
+    """
+    users = graphql_batch("user", selection, identifiers, name_arg="username",
+                          max_complexity=1000, ttl=3600)
+    results = {}
+    for identifier, user in users.items():
+        if not user:
+            results[identifier] = (None, [])
+            continue
+        made = user.get("madePosts") or {}
+        posts = [e["node"] for e in made.get("edges", [])]
+        page_info = made.get("pageInfo") or {}
+        if page_info.get("hasNextPage") and page_info.get("endCursor"):
+            posts.extend(iter_connection(QUERY, {"id": user["id"], "after": page_info["endCursor"]},
+                                         ("user", "madePosts")))
+        results[identifier] = (user, posts)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crawl the ProductHunt maker graph")
+    parser.add_argument("seeds", nargs="*", help="Seed usernames or user IDs (omit to resume)")
+    parser.add_argument("--depth", "-d", type=int, help="Co-maker hops beyond the seeds (default: 1)")
+    parser.add_argument("--graph", "-g", default=DEFAULT_GRAPH, help=f"Graph directory (default: {DEFAULT_GRAPH})")
+    parser.add_argument("--posts-per-user", type=int, default=20, help="Made posts per user in the batched page")
+    parser.add_argument("--chunk", type=int, default=20, help="Users per request batch and checkpoint")
+    parser.add_argument("--workers", "-w", type=int, default=4, help="Batches fetched concurrently")
+    parser.add_argument("--max-users", type=int, help="Stop after expanding N users")
+    args = parser.parse_args()
+
+    graph = MakerGraph.load(args.graph)
+    state = graph.state
+    if state["frontier"]:
+        if args.seeds:
+            print(f"note: resuming the crawl in {args.graph}; seeds ignored", file=sys.stderr)
+    elif args.seeds:
+        state.update(depth=0, frontier=list(dict.fromkeys(args.seeds)), done=[])
+    elif args.depth is not None and graph.users and args.depth > state["depth"]:
+        # Extend a finished crawl by more hops
+        expanded = set(state["expanded"])
+        state.update(depth=state["depth"] + 1, frontier=[u for u in graph.users if u not in expanded], done=[])
+    else:
+        parser.error("seeds are required to start a crawl")
+    if args.depth is not None or "max_depth" not in state:
+        state["max_depth"] = 1 if args.depth is None else args.depth
+
+    expanded = set(state["expanded"])
+    done = set(state.get("done", []))
+    print(f"graph: {args.graph}")
+
+    while state["frontier"]:
+        pending = [x for x in state["frontier"] if x not in done and x not in expanded]
+        if args.max_users is not None:
+            pending = pending[:max(0, args.max_users - len(expanded))]
+        print(f"  depth {state['depth']}: {len(pending)} users", file=sys.stderr)
+
+        chunks = [pending[i:i + args.chunk] for i in range(0, len(pending), args.chunk)]
+        with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+            futures = [pool.submit(fetch_makers, chunk, min(args.posts_per_user, 50)) for chunk in chunks]
+            for future in as_completed(futures):
+                for identifier, (user, posts) in future.result().items():
+                    done.add(identifier)
+                    if not user:
+                        print(f"  not found: {identifier}", file=sys.stderr)
+                        continue
+                    u = graph.user(user)
+                    expanded.add(user["id"])
+                    for post in posts:
+                        graph.add_post(post)
+                        graph.add_edge(u, graph.post(post))
+                state.update(done=sorted(done), expanded=sorted(expanded))
+                graph.save()
+
+        if args.max_users is not None and len(expanded) >= args.max_users:
+            print(f"note: stopped at --max-users {args.max_users}; rerun to continue", file=sys.stderr)
+            break
+        # Every discovered user not yet expanded is exactly one hop further out
+        frontier = [uid for uid in graph.users if uid not in expanded]
+        if frontier and state["depth"] < state["max_depth"]:
+            state.update(depth=state["depth"] + 1, frontier=frontier, done=[])
+            done = set()
+        else:
+            state.update(frontier=[], done=[])
+        graph.save()
+
+    print(f"depth: {state['depth']}")
+    print(f"users: {len(graph.users)} ({len(expanded)} expanded)")
+    print(f"posts: {len(graph.posts)}")
+    print(f"edges: {len(graph.edge_users)}")
+
+
+if __name__ == "__main__":
+    main()
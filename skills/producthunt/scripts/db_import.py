@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Import a backfill store into the SQLite warehouse
+Usage: python3 scripts/db_import.py --store ./producthunt-posts --db ./producthunt.db
+"""
+import argparse
+from post_store import DEFAULT_STORE, iter_posts
+from warehouse import DEFAULT_DB, connect, upsert_post
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import backfilled posts into SQLite")
+    parser.add_argument("--store", "-s", default=DEFAULT_STORE, help=f"Backfill store (default: {DEFAULT_STORE})")
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"SQLite database (default: {DEFAULT_DB})")
+    parser.add_argument("--start", help="First day (YYYY-MM-DD)")
+    parser.add_argument("--end", help="Last day (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    count = 0
+    with conn:
+        for post in iter_posts(args.store, args.start, args.end):
+            upsert_post(conn, post)
+            count += 1
+
+    totals = {t: conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0]
+              for t in ("posts", "users", "topics", "collections", "comments")}
+    print(f"db: {args.db}")
+    print(f"imported: {count}")
+    print(f"totals: {', '.join(f'{t}={n}' for t, n in totals.items())}")
+
+
+if __name__ == "__main__":
+    main()
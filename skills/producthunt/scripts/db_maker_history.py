@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+A maker's launch history from the local warehouse
+Usage: python3 scripts/db_maker_history.py rrhoover
+"""
+import argparse
+from producthunt_api import format_count
+from warehouse import DEFAULT_DB, connect
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maker launch history from the local warehouse")
+    parser.add_argument("identifier", help="Username or user ID")
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"SQLite database (default: {DEFAULT_DB})")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    user = conn.execute("SELECT * FROM users WHERE id = ? OR username = ?",
+                        (args.identifier, args.identifier)).fetchone()
+    if not user:
+        print(f"User not found in warehouse: {args.identifier}")
+        return
+
+    posts = conn.execute(
+        "SELECT p.name, p.votes, p.comments, COALESCE(p.featured_at, p.created_at) AS day"
+        " FROM post_makers pm JOIN posts p ON p.id = pm.post_id"
+        " WHERE pm.user_id = ? ORDER BY day",
+        (user["id"],),
+    ).fetchall()
+
+    print(f"user: @{user['username']} ({user['name']})")
+    print(f"launches: {len(posts)}")
+    if posts:
+        print(f"total_votes: {format_count(sum(p['votes'] or 0 for p in posts))}")
+        print(f"first_launch: {(posts[0]['day'] or '')[:10]}")
+        print(f"latest_launch: {(posts[-1]['day'] or '')[:10]}")
+        print(f"---")
+        print(f"made_posts[{len(posts)}]{{name,votes,comments,date}}:")
+        for p in posts:
+            print(f"  {p['name']},{format_count(p['votes'])},{format_count(p['comments'])},{(p['day'] or '')[:10]}")
+
+
+if __name__ == "__main__":
+    main()
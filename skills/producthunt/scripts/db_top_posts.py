@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Top posts from the local warehouse, by topic and week
+Usage: python3 scripts/db_top_posts.py --topic artificial-intelligence --week 2025-W10
+       python3 scripts/db_top_posts.py --week 2025-03-05 --limit 10
+"""
+import argparse
+from datetime import date, timedelta
+from producthunt_api import format_count
+from warehouse import DEFAULT_DB, connect
+
+
+def week_range(value: str) -> tuple:
+    """ISO week ('2025-W10') or any date in the week -> (monday, next monday)"""
+    if "-W" in value:
+        year, week = value.split("-W")
+        monday = date.fromisocalendar(int(year), int(week), 1)
+    else:
+        day = date.fromisoformat(value)
+        monday = day - timedelta(days=day.weekday())
+    return monday.isoformat(), (monday + timedelta(days=7)).isoformat()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Top posts from the local warehouse")
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"SQLite database (default: {DEFAULT_DB})")
+    parser.add_argument("--topic", "-t", help="Topic slug")
+    parser.add_argument("--week", "-w", help="ISO week (2025-W10) or a date within the week")
+    parser.add_argument("--limit", "-l", type=int, default=20, help="Max posts")
+    args = parser.parse_args()
+
+    sql = "SELECT p.name, p.tagline, p.votes, p.comments, COALESCE(p.featured_at, p.created_at) AS day FROM posts p"
+    where, params = [], []
+    if args.topic:
+        sql += " JOIN post_topics pt ON pt.post_id = p.id JOIN topics t ON t.id = pt.topic_id"
+        where.append("t.slug = ?")
+        params.append(args.topic)
+    if args.week:
+        start, end = week_range(args.week)
+        where.append("COALESCE(p.featured_at, p.created_at) >= ? AND COALESCE(p.featured_at, p.created_at) < ?")
+        params += [start, end]
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY p.votes DESC LIMIT ?"
+    params.append(args.limit)
+
+    rows = connect(args.db).execute(sql, params).fetchall()
+
+    filters = []
+    if args.topic:
+        filters.append(f"topic:{args.topic}")
+    if args.week:
+        filters.append(f"week:{args.week}")
+    label = f"top_posts({','.join(filters)})" if filters else "top_posts"
+    print(f"{label}[{len(rows)}]{{name,tagline,votes,comments,date}}:")
+    for r in rows:
+        tagline = (r["tagline"] or "")[:50]
+        print(f"  {r['name']},{tagline},{format_count(r['votes'])},{format_count(r['comments'])},{(r['day'] or '')[:10]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,15 @@
 """
 Get collection by ID or slug
 Usage: python3 scripts/get_collection.py COLLECTION_SLUG
+       python3 scripts/get_collection.py COLLECTION_SLUG --all --db ./producthunt.db
 """
 import argparse
 import json
-from producthunt_api import graphql, clean_collection, format_count
+from producthunt_api import graphql, register_query, follow_connection, clean_collection, format_count
+from warehouse import connect, upsert_collection
 
-QUERY = """
-query GetCollection($id: ID, $slug: String) {
+QUERY = register_query("""
+query GetCollection($id: ID, $slug: String, $first: Int, $after: String) {
   collection(id: $id, slug: $slug) {
     id
     name
@@ -18,9 +20,10 @@ query GetCollection($id: ID, $slug: String) {
     followersCount
     featuredAt
     createdAt
-    user { name username }
-    posts(first: 10) {
+    user { id name username }
+    posts(first: $first, after: $after) {
       totalCount
+      pageInfo { hasNextPage endCursor }
       edges {
         node {
           id
@@ -32,16 +35,20 @@ query GetCollection($id: ID, $slug: String) {
     }
   }
 }
-"""
+""", ttl=3600)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Get ProductHunt collection")
     parser.add_argument("identifier", help="Collection ID or slug")
     parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
+    parser.add_argument("--all", "-a", action="store_true", help="Follow pagination to the end")
+    parser.add_argument("--max-items", type=int, help="Stop after N items (implies --all)")
+    parser.add_argument("--db", help="Also upsert the collection and its posts into this SQLite warehouse")
     args = parser.parse_args()
+    follow = args.all or args.max_items is not None
 
-    variables = {}
+    variables = {"first": 50 if follow else 10}
     if args.identifier.isdigit():
         variables["id"] = args.identifier
     else:
@@ -54,6 +61,17 @@ def main():
         print(f"Collection not found: {args.identifier}")
         return
 
+    if follow:
+        posts_data = collection.get("posts") or {}
+        nodes = follow_connection(QUERY, variables, ("collection", "posts"), posts_data, args.max_items)
+        posts_data["edges"] = [{"node": n} for n in nodes]
+        posts_data["pageInfo"] = {"hasNextPage": False, "endCursor": None}
+
+    if args.db:
+        conn = connect(args.db)
+        with conn:
+            upsert_collection(conn, collection)
+
     if args.json:
         print(json.dumps(collection, indent=2))
         return
@@ -2,11 +2,13 @@
 """
 Get collections with filters
 Usage: python3 scripts/get_collections.py --featured --limit 20
+       python3 scripts/get_collections.py --featured --all --db ./producthunt.db
 """
 import argparse
-from producthunt_api import graphql, clean_collection, format_count, print_pagination
+from producthunt_api import graphql, register_query, follow_connection, clean_collection, format_count, print_pagination
+from warehouse import connect, upsert_collection
 
-QUERY = """
+QUERY = register_query("""
 query GetCollections($first: Int, $after: String, $featured: Boolean, $userId: ID) {
   collections(first: $first, after: $after, featured: $featured, userId: $userId, order: FOLLOWERS_COUNT) {
     totalCount
@@ -23,7 +25,7 @@ query GetCollections($first: Int, $after: String, $featured: Boolean, $userId: I
     }
   }
 }
-"""
+""", ttl=3600)
 
 
 def main():
@@ -32,10 +34,14 @@ def main():
     parser.add_argument("--featured", "-f", action="store_true", help="Featured collections only")
     parser.add_argument("--user", "-u", help="Filter by user ID")
     parser.add_argument("--cursor", "-c", help="Pagination cursor")
+    parser.add_argument("--all", "-a", action="store_true", help="Follow pagination to the end")
+    parser.add_argument("--max-items", type=int, help="Stop after N items (implies --all)")
+    parser.add_argument("--db", help="Also upsert the collections into this SQLite warehouse")
     args = parser.parse_args()
+    follow = args.all or args.max_items is not None
 
     variables = {
-        "first": min(args.limit, 50),
+        "first": 50 if follow else min(args.limit, 50),
         "after": args.cursor,
         "featured": True if args.featured else None,
         "userId": args.user,
@@ -45,6 +51,14 @@ def main():
     collections_data = data.get("collections", {})
     edges = collections_data.get("edges", [])
     collections = [e["node"] for e in edges]
+    if follow:
+        collections = follow_connection(QUERY, variables, ("collections",), collections_data, args.max_items)
+
+    if args.db:
+        conn = connect(args.db)
+        with conn:
+            for c in collections:
+                upsert_collection(conn, c)
 
     filters = []
     if args.featured:
@@ -58,7 +72,11 @@ def main():
         tagline = (c.get('tagline') or '')[:40]
         print(f"  {c['name']},{tagline},{format_count(c['followersCount'])}")
     
-    print_pagination(collections_data.get("pageInfo"), collections_data.get("totalCount"))
+    if follow:
+        print(f"---")
+        print(f"total: {collections_data.get('totalCount')}")
+    else:
+        print_pagination(collections_data.get("pageInfo"), collections_data.get("totalCount"))
 
 
 if __name__ == "__main__":
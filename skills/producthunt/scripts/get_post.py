@@ -1,15 +1,16 @@
 #!/usr/bin/env python3
 """
-Get post by ID or slug
-Usage: python3 scripts/get_post.py POST_ID_OR_SLUG
+Get posts by ID or slug
+Usage: python3 scripts/get_post.py POST_ID_OR_SLUG [POST_ID_OR_SLUG ...]
+       python3 scripts/get_post.py SLUG_A SLUG_B --fields name,votes,created_at
 """
 import argparse
 import json
-from producthunt_api import graphql, clean_post, print_post
+import sys
+from producthunt_api import (graphql_batch, parse_fields, build_selection, clean_post, print_post,
+                             POST_FIELDS)
 
-QUERY = """
-query GetPost($id: ID, $slug: String) {
-  post(id: $id, slug: $slug) {
+FIELDS = """
     id
     name
     tagline
@@ -23,46 +24,61 @@ query GetPost($id: ID, $slug: String) {
     createdAt
     makers { name username }
     topics(first: 5) { edges { node { name slug } } }
-  }
-}
 """
 
 
 def main():
     parser = argparse.ArgumentParser(description="Get ProductHunt post")
-    parser.add_argument("identifier", help="Post ID or slug")
+    parser.add_argument("identifiers", nargs="+", help="Post IDs or slugs")
+    parser.add_argument("--fields", help=f"Comma-separated fields to fetch and print ({','.join(POST_FIELDS)})")
     parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
     args = parser.parse_args()
 
-    variables = {}
-    if args.identifier.isdigit():
-        variables["id"] = args.identifier
-    else:
-        variables["slug"] = args.identifier
+    try:
+        fields = parse_fields(args.fields, POST_FIELDS)
+    except ValueError as e:
+        parser.error(str(e))
 
-    data = graphql(QUERY, variables)
-    post = data.get("post")
+    selection = build_selection(fields) if fields else FIELDS
+    posts = graphql_batch("post", selection, args.identifiers, ttl=600)
 
-    if not post:
-        print(f"Post not found: {args.identifier}")
-        return
+    if len(posts) == 1 and not next(iter(posts.values())):
+        print(f"Post not found: {args.identifiers[0]}")
+        sys.exit(1)
 
     if args.json:
-        print(json.dumps(post, indent=2))
+        if len(posts) == 1:
+            print(json.dumps(next(iter(posts.values())), indent=2))
+        else:
+            print(json.dumps(posts, indent=2))
         return
 
-    cleaned = clean_post(post)
-    print_post(cleaned)
-    
-    if post.get("description"):
-        print(f"---")
-        desc = post["description"][:500]
-        print(f"description: {desc}")
-    
-    topics = post.get("topics", {}).get("edges", [])
-    if topics:
-        topic_names = [e["node"]["slug"] for e in topics]
-        print(f"topics: {', '.join(topic_names)}")
+    for i, (identifier, post) in enumerate(posts.items()):
+        if i:
+            print(f"===")
+        if not post:
+            print(f"Post not found: {identifier}")
+            continue
+
+        if fields:
+            for name, value in clean_post(post, fields).items():
+                if isinstance(value, list):
+                    value = ", ".join(value)
+                print(f"{name}: {'' if value is None else value}")
+            continue
+
+        cleaned = clean_post(post)
+        print_post(cleaned)
+        
+        if post.get("description"):
+            print(f"---")
+            desc = post["description"][:500]
+            print(f"description: {desc}")
+        
+        topics = post.get("topics", {}).get("edges", [])
+        if topics:
+            topic_names = [e["node"]["slug"] for e in topics]
+            print(f"topics: {', '.join(topic_names)}")
 
 
 if __name__ == "__main__":
@@ -2,11 +2,16 @@
 """
 Get comments on a post
 Usage: python3 scripts/get_post_comments.py POST_ID --limit 20
+       python3 scripts/get_post_comments.py POST_ID --all > thread.ndjson
+       python3 scripts/get_post_comments.py POST_ID --all --db ./producthunt.db
 """
 import argparse
-from producthunt_api import graphql, print_comments_list, print_pagination
+import json
+import sys
+from producthunt_api import graphql, register_query, graphql_batch, clean_comment, print_comments_list, print_pagination
+from warehouse import connect, upsert_comment, upsert_post
 
-QUERY = """
+QUERY = register_query("""
 query GetPostComments($id: ID, $slug: String, $first: Int, $after: String) {
   post(id: $id, slug: $slug) {
     id
@@ -21,21 +26,139 @@ query GetPostComments($id: ID, $slug: String, $first: Int, $after: String) {
           body
           votesCount
           createdAt
-          user { name username }
+          user { id name username }
         }
       }
     }
   }
 }
+""", ttl=300)
+
+COMMENT_FIELDS = "id body votesCount createdAt user { id name username }"
+
+# Nested replies only report whether they have replies of their own; those
+# are resolved afterwards in aliased batches
+REPLY_NODE = f"{COMMENT_FIELDS} replies(first: 1) {{ totalCount }}"
+
+THREAD_QUERY = register_query(f"""
+query GetPostThread($id: ID, $slug: String, $first: Int, $after: String, $replies: Int) {{
+  post(id: $id, slug: $slug) {{
+    id
+    name
+    commentsCount
+    comments(first: $first, after: $after) {{
+      pageInfo {{ hasNextPage endCursor }}
+      edges {{
+        node {{
+          {COMMENT_FIELDS}
+          replies(first: $replies) {{
+            pageInfo {{ hasNextPage endCursor }}
+            edges {{ node {{ {REPLY_NODE} }} }}
+          }}
+        }}
+      }}
+    }}
+  }}
+}}
+""", ttl=300)
+
+REPLY_PAGE_SIZE = 20
+REPLIES_SELECTION = f"""
+    id
+    replies(first: {REPLY_PAGE_SIZE}, after: $after) {{
+      pageInfo {{ hasNextPage endCursor }}
+      edges {{ node {{ {REPLY_NODE} }} }}
+    }}
 """
 
 
+def attach_replies(parent: dict, connection: dict, index: dict, pending: list, store=None):
+    """Add a replies page to `parent`, queueing further pages and nested threads"""
+    for edge in (connection or {}).get("edges", []):
+        node = edge["node"]
+        if store:
+            store(node, parent["id"])
+        child = clean_comment(node)
+        child["replies"] = []
+        parent["replies"].append(child)
+        index[child["id"]] = child
+        if (node.get("replies") or {}).get("totalCount"):
+            pending.append((child["id"], None))
+    page_info = (connection or {}).get("pageInfo") or {}
+    if page_info.get("hasNextPage") and page_info.get("endCursor"):
+        pending.append((parent["id"], page_info["endCursor"]))
+
+
+def resolve_replies(index: dict, pending: list, store=None):
+    """Fetch outstanding reply pages in aliased batches until the tree is complete"""
+    while pending:
+        cursors = dict(pending)
+        pending.clear()
+        nodes = graphql_batch("comment", REPLIES_SELECTION, list(cursors),
+                              max_complexity=2000,
+                              variables={cid: {"after": after} for cid, after in cursors.items()},
+                              variable_types={"after": "String"}, ttl=300, id_type="ID!")
+        for cid, node in nodes.items():
+            if node:
+                attach_replies(index[cid], node.get("replies"), index, pending, store)
+
+
+def stream_thread(variables: dict, page_size: int, inline_replies: int, conn=None):
+    """Page every top-level comment, complete its reply tree, and emit NDJSON.
+
+    With `conn`, every comment is also upserted into the warehouse, one transaction per page.
+    """
+    variables = dict(variables, first=page_size, after=None, replies=inline_replies)
+    emitted = 0
+    while True:
+        data = graphql(THREAD_QUERY, variables)
+        post = data.get("post")
+        if not post:
+            return None
+        comments = post.get("comments") or {}
+        store = None
+        if conn:
+            upsert_post(conn, {"id": post["id"], "name": post.get("name"),
+                               "commentsCount": post.get("commentsCount")})
+            # Replies are stored as they are attached, so the node's own replies are skipped here
+            def store(node, parent_id):
+                upsert_comment(conn, dict(node, replies=None), post["id"], parent_id)
+
+        roots, index, pending = [], {}, []
+        for edge in comments.get("edges", []):
+            node = edge["node"]
+            if store:
+                store(node, None)
+            root = clean_comment(node)
+            root["replies"] = []
+            roots.append(root)
+            index[root["id"]] = root
+            attach_replies(root, node.get("replies"), index, pending, store)
+        resolve_replies(index, pending, store)
+        if conn:
+            conn.commit()
+
+        for root in roots:
+            sys.stdout.write(json.dumps(root) + "\n")
+        sys.stdout.flush()
+        emitted += len(roots)
+
+        page_info = comments.get("pageInfo") or {}
+        if not page_info.get("hasNextPage") or not page_info.get("endCursor"):
+            return emitted
+        variables["after"] = page_info["endCursor"]
+
+
 def main():
     parser = argparse.ArgumentParser(description="Get post comments")
     parser.add_argument("identifier", help="Post ID or slug")
     parser.add_argument("--limit", "-l", type=int, default=20, help="Max comments")
     parser.add_argument("--cursor", "-c", help="Pagination cursor")
+    parser.add_argument("--all", "-a", action="store_true",
+                        help="Fetch every comment with nested replies as NDJSON threads")
+    parser.add_argument("--db", help="Also upsert the comments into this SQLite warehouse")
     args = parser.parse_args()
+    conn = connect(args.db) if args.db else None
 
     variables = {"first": min(args.limit, 50), "after": args.cursor}
     if args.identifier.isdigit():
@@ -43,6 +166,12 @@ def main():
     else:
         variables["slug"] = args.identifier
 
+    if args.all:
+        lookup = {k: v for k, v in variables.items() if k in ("id", "slug")}
+        if stream_thread(lookup, page_size=20, inline_replies=5, conn=conn) is None:
+            print(f"Post not found: {args.identifier}", file=sys.stderr)
+        return
+
     data = graphql(QUERY, variables)
     post = data.get("post")
 
@@ -56,6 +185,12 @@ def main():
     comments_data = post.get("comments", {})
     edges = comments_data.get("edges", [])
     comments = [e["node"] for e in edges]
+    if conn:
+        with conn:
+            upsert_post(conn, {"id": post["id"], "name": post.get("name"),
+                               "commentsCount": post.get("commentsCount")})
+            for comment in comments:
+                upsert_comment(conn, comment, post["id"])
     
     print_comments_list(comments)
     print_pagination(comments_data.get("pageInfo"))
@@ -3,27 +3,21 @@
 Get posts with filters
 Usage: python3 scripts/get_posts.py --featured --limit 20
        python3 scripts/get_posts.py --topic ai --limit 10
+       python3 scripts/get_posts.py --featured --all --fields name,votes,featured_at
 """
 import argparse
 from datetime import datetime, timezone
-from producthunt_api import graphql, print_posts_list, print_pagination
+from producthunt_api import (graphql, register_query, follow_connection, parse_fields, build_selection,
+                             print_posts_list, print_pagination, POST_FIELDS, POST_LIST_FIELDS)
 
-QUERY = """
+QUERY_TEMPLATE = """
 query GetPosts($first: Int, $after: String, $featured: Boolean, $topic: String, $postedAfter: DateTime, $postedBefore: DateTime) {
   posts(first: $first, after: $after, featured: $featured, topic: $topic, postedAfter: $postedAfter, postedBefore: $postedBefore) {
     totalCount
     pageInfo { hasNextPage endCursor }
     edges {
       node {
-        id
-        name
-        tagline
-        slug
-        votesCount
-        commentsCount
-        url
-        website
-        featuredAt
+        FIELDS
       }
     }
   }
@@ -39,10 +33,23 @@ def main():
     parser.add_argument("--after", help="Posts after date (YYYY-MM-DD)")
     parser.add_argument("--before", help="Posts before date (YYYY-MM-DD)")
     parser.add_argument("--cursor", "-c", help="Pagination cursor")
+    parser.add_argument("--all", "-a", action="store_true", help="Follow pagination to the end")
+    parser.add_argument("--max-items", type=int, help="Stop after N items (implies --all)")
+    parser.add_argument("--fields", help=f"Comma-separated columns ({','.join(POST_FIELDS)})")
     args = parser.parse_args()
 
+    try:
+        fields = parse_fields(args.fields, POST_FIELDS)
+    except ValueError as e:
+        parser.error(str(e))
+
+    # Select only what gets printed
+    selection = build_selection(fields or POST_LIST_FIELDS)
+    query = register_query(QUERY_TEMPLATE.replace("FIELDS", selection), ttl=600)
+    follow = args.all or args.max_items is not None
+
     variables = {
-        "first": min(args.limit, 50),
+        "first": 50 if follow else min(args.limit, 50),
         "after": args.cursor,
         "featured": True if args.featured else None,
         "topic": args.topic,
@@ -53,10 +60,12 @@ def main():
     if args.before:
         variables["postedBefore"] = f"{args.before}T23:59:59Z"
 
-    data = graphql(QUERY, variables)
+    data = graphql(query, variables)
     posts_data = data.get("posts", {})
     edges = posts_data.get("edges", [])
     posts = [e["node"] for e in edges]
+    if follow:
+        posts = follow_connection(query, variables, ("posts",), posts_data, args.max_items)
 
     filters = []
     if args.featured:
@@ -67,8 +76,12 @@ def main():
         filters.append(f"after:{args.after}")
     
     label = f"posts({','.join(filters)})" if filters else "posts"
-    print_posts_list(posts, label)
-    print_pagination(posts_data.get("pageInfo"), posts_data.get("totalCount"))
+    print_posts_list(posts, label, fields)
+    if follow:
+        print(f"---")
+        print(f"total: {posts_data.get('totalCount')}")
+    else:
+        print_pagination(posts_data.get("pageInfo"), posts_data.get("totalCount"))
 
 
 if __name__ == "__main__":
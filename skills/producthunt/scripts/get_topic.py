@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
 """
-Get topic by ID or slug
-Usage: python3 scripts/get_topic.py artificial-intelligence
+Get topics by ID or slug
+Usage: python3 scripts/get_topic.py artificial-intelligence [SLUG ...]
 """
 import argparse
 import json
-from producthunt_api import graphql, clean_topic, print_topic
+import sys
+from producthunt_api import graphql_batch, clean_topic, print_topic
 
-QUERY = """
-query GetTopic($id: ID, $slug: String) {
-  topic(id: $id, slug: $slug) {
+FIELDS = """
     id
     name
     slug
@@ -17,35 +16,36 @@ query GetTopic($id: ID, $slug: String) {
     postsCount
     followersCount
     url
-  }
-}
 """
 
 
 def main():
     parser = argparse.ArgumentParser(description="Get ProductHunt topic")
-    parser.add_argument("identifier", help="Topic ID or slug")
+    parser.add_argument("identifiers", nargs="+", help="Topic IDs or slugs")
     parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
     args = parser.parse_args()
 
-    variables = {}
-    if args.identifier.isdigit():
-        variables["id"] = args.identifier
-    else:
-        variables["slug"] = args.identifier
+    topics = graphql_batch("topic", FIELDS, args.identifiers, ttl=86400)
 
-    data = graphql(QUERY, variables)
-    topic = data.get("topic")
-
-    if not topic:
-        print(f"Topic not found: {args.identifier}")
-        return
+    if len(topics) == 1 and not next(iter(topics.values())):
+        print(f"Topic not found: {args.identifiers[0]}")
+        sys.exit(1)
 
     if args.json:
-        print(json.dumps(topic, indent=2))
+        if len(topics) == 1:
+            print(json.dumps(next(iter(topics.values())), indent=2))
+        else:
+            print(json.dumps(topics, indent=2))
         return
 
-    print_topic(clean_topic(topic))
+    for i, (identifier, topic) in enumerate(topics.items()):
+        if i:
+            print(f"===")
+        if not topic:
+            print(f"Topic not found: {identifier}")
+            continue
+
+        print_topic(clean_topic(topic))
 
 
 if __name__ == "__main__":
@@ -4,9 +4,9 @@ Get topics with optional search
 Usage: python3 scripts/get_topics.py --query "AI" --limit 20
 """
 import argparse
-from producthunt_api import graphql, print_topics_list, print_pagination
+from producthunt_api import graphql, register_query, follow_connection, print_topics_list, print_pagination
 
-QUERY = """
+QUERY = register_query("""
 query GetTopics($first: Int, $after: String, $query: String) {
   topics(first: $first, after: $after, query: $query, order: FOLLOWERS_COUNT) {
     totalCount
@@ -23,7 +23,7 @@ query GetTopics($first: Int, $after: String, $query: String) {
     }
   }
 }
-"""
+""", ttl=86400)
 
 
 def main():
@@ -31,10 +31,13 @@ def main():
     parser.add_argument("--query", "-q", help="Search query")
     parser.add_argument("--limit", "-l", type=int, default=20, help="Max topics")
     parser.add_argument("--cursor", "-c", help="Pagination cursor")
+    parser.add_argument("--all", "-a", action="store_true", help="Follow pagination to the end")
+    parser.add_argument("--max-items", type=int, help="Stop after N items (implies --all)")
     args = parser.parse_args()
+    follow = args.all or args.max_items is not None
 
     variables = {
-        "first": min(args.limit, 50),
+        "first": 50 if follow else min(args.limit, 50),
         "after": args.cursor,
         "query": args.query,
     }
@@ -43,10 +46,16 @@ def main():
     topics_data = data.get("topics", {})
     edges = topics_data.get("edges", [])
     topics = [e["node"] for e in edges]
+    if follow:
+        topics = follow_connection(QUERY, variables, ("topics",), topics_data, args.max_items)
 
     label = f"topics(query:{args.query})" if args.query else "topics"
     print_topics_list(topics, label)
-    print_pagination(topics_data.get("pageInfo"), topics_data.get("totalCount"))
+    if follow:
+        print(f"---")
+        print(f"total: {topics_data.get('totalCount')}")
+    else:
+        print_pagination(topics_data.get("pageInfo"), topics_data.get("totalCount"))
 
 
 if __name__ == "__main__":
@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
 """
-Get user by username or ID
-Usage: python3 scripts/get_user.py rrhoover
+Get users by username or ID
+Usage: python3 scripts/get_user.py rrhoover [USERNAME ...]
 """
 import argparse
 import json
-from producthunt_api import graphql, clean_user, print_user
+import sys
+from producthunt_api import graphql_batch, clean_user, print_user
 
-QUERY = """
-query GetUser($id: ID, $username: String) {
-  user(id: $id, username: $username) {
+FIELDS = """
     id
     name
     username
@@ -20,37 +19,38 @@ query GetUser($id: ID, $username: String) {
     isMaker
     createdAt
     profileImage
-  }
-}
 """
 
 
 def main():
     parser = argparse.ArgumentParser(description="Get ProductHunt user")
-    parser.add_argument("identifier", help="Username or user ID")
+    parser.add_argument("identifiers", nargs="+", help="Usernames or user IDs")
     parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
     args = parser.parse_args()
 
-    variables = {}
-    if args.identifier.isdigit():
-        variables["id"] = args.identifier
-    else:
-        variables["username"] = args.identifier
+    users = graphql_batch("user", FIELDS, args.identifiers, name_arg="username", ttl=86400)
 
-    data = graphql(QUERY, variables)
-    user = data.get("user")
-
-    if not user:
-        print(f"User not found: {args.identifier}")
-        return
+    if len(users) == 1 and not next(iter(users.values())):
+        print(f"User not found: {args.identifiers[0]}")
+        sys.exit(1)
 
     if args.json:
-        print(json.dumps(user, indent=2))
+        if len(users) == 1:
+            print(json.dumps(next(iter(users.values())), indent=2))
+        else:
+            print(json.dumps(users, indent=2))
         return
 
-    print_user(clean_user(user))
-    if user.get("createdAt"):
-        print(f"joined: {user['createdAt']}")
+    for i, (identifier, user) in enumerate(users.items()):
+        if i:
+            print(f"===")
+        if not user:
+            print(f"User not found: {identifier}")
+            continue
+
+        print_user(clean_user(user))
+        if user.get("createdAt"):
+            print(f"joined: {user['createdAt']}")
 
 
 if __name__ == "__main__":
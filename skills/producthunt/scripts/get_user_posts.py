@@ -2,45 +2,25 @@
 """
 Get user's posts (submitted or made)
 Usage: python3 scripts/get_user_posts.py rrhoover --limit 20
+       python3 scripts/get_user_posts.py rrhoover --made --all
+       python3 scripts/get_user_posts.py rrhoover --made --fields name,votes,created_at
 """
 import argparse
-from producthunt_api import graphql, print_posts_list, print_pagination
+from producthunt_api import (graphql, register_query, follow_connection, parse_fields, build_selection,
+                             print_posts_list, print_pagination, POST_FIELDS, POST_LIST_FIELDS)
 
-QUERY = """
+QUERY_TEMPLATE = """
 query GetUserPosts($id: ID, $username: String, $first: Int, $after: String) {
   user(id: $id, username: $username) {
     id
     name
     username
-    submittedPosts(first: $first, after: $after) {
+    CONNECTION(first: $first, after: $after) {
       totalCount
       pageInfo { hasNextPage endCursor }
       edges {
         node {
-          id
-          name
-          tagline
-          slug
-          votesCount
-          commentsCount
-          url
-          featuredAt
-        }
-      }
-    }
-    madePosts(first: $first, after: $after) {
-      totalCount
-      pageInfo { hasNextPage endCursor }
-      edges {
-        node {
-          id
-          name
-          tagline
-          slug
-          votesCount
-          commentsCount
-          url
-          featuredAt
+          FIELDS
         }
       }
     }
@@ -55,15 +35,31 @@ def main():
     parser.add_argument("--limit", "-l", type=int, default=20, help="Max posts")
     parser.add_argument("--made", "-m", action="store_true", help="Show made posts instead of submitted")
     parser.add_argument("--cursor", "-c", help="Pagination cursor")
+    parser.add_argument("--all", "-a", action="store_true", help="Follow pagination to the end")
+    parser.add_argument("--max-items", type=int, help="Stop after N items (implies --all)")
+    parser.add_argument("--fields", help=f"Comma-separated columns ({','.join(POST_FIELDS)})")
     args = parser.parse_args()
 
-    variables = {"first": min(args.limit, 50), "after": args.cursor}
+    try:
+        fields = parse_fields(args.fields, POST_FIELDS)
+    except ValueError as e:
+        parser.error(str(e))
+
+    follow = args.all or args.max_items is not None
+
+    connection = "madePosts" if args.made else "submittedPosts"
+    label = "made_posts" if args.made else "submitted_posts"
+    # Select only what gets printed
+    selection = build_selection(fields or POST_LIST_FIELDS)
+    query = register_query(QUERY_TEMPLATE.replace("CONNECTION", connection).replace("FIELDS", selection), ttl=3600)
+
+    variables = {"first": 50 if follow else min(args.limit, 50), "after": args.cursor}
     if args.identifier.isdigit():
         variables["id"] = args.identifier
     else:
         variables["username"] = args.identifier
 
-    data = graphql(QUERY, variables)
+    data = graphql(query, variables)
     user = data.get("user")
 
     if not user:
@@ -72,17 +68,18 @@ def main():
 
     print(f"user: @{user.get('username')} ({user.get('name')})")
     
-    if args.made:
-        posts_data = user.get("madePosts", {})
-        label = "made_posts"
-    else:
-        posts_data = user.get("submittedPosts", {})
-        label = "submitted_posts"
-    
+    posts_data = user.get(connection, {})
     edges = posts_data.get("edges", [])
     posts = [e["node"] for e in edges]
-    
-    print_posts_list(posts, label)
+
+    if follow:
+        posts = follow_connection(query, variables, ("user", connection), posts_data, args.max_items)
+        print_posts_list(posts, label, fields)
+        print(f"---")
+        print(f"total: {posts_data.get('totalCount')}")
+        return
+
+    print_posts_list(posts, label, fields)
     print_pagination(posts_data.get("pageInfo"), posts_data.get("totalCount"))
 
 
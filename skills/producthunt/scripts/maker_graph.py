@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Compact maker <-> post graph with checkpoint/resume.
+
+Layout of a graph directory:
+  nodes.json   user and post IDs/labels; an edge's integers index these lists
+  edges.bin    (user, post) pairs as packed uint32, appended at each checkpoint
+  state.json   crawl progress: depth, frontier, expanded users, committed edge count
+"""
+import json
+import os
+from array import array
+
+DEFAULT_GRAPH = "./producthunt-makers"
+
+
+def _write_json(path: str, data):
+    """Write JSON atomically"""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+class MakerGraph:
+    """Bipartite maker/post graph with interned integer node IDs"""
+
+    def __init__(self, path: str = DEFAULT_GRAPH):
+        self.path = path
+        self.users, self.usernames, self.posts, self.post_names = [], [], [], []
+        self.user_index, self.post_index = {}, {}
+        self.edge_users, self.edge_posts = array("I"), array("I")
+        self.edge_set = set()
+        self.saved_edges = 0
+        self.state = {"depth": 0, "frontier": [], "expanded": []}
+
+    def user(self, node: dict) -> int:
+        """Integer ID of a user node, interning it if new"""
+        i = self.user_index.get(node["id"])
+        if i is None:
+            i = self.user_index[node["id"]] = len(self.users)
+            self.users.append(node["id"])
+            self.usernames.append(node.get("username"))
+        elif node.get("username") and not self.usernames[i]:
+            self.usernames[i] = node["username"]
+        return i
+
+    def post(self, node: dict) -> int:
+        """Integer ID of a post node, interning it if new"""
+        i = self.post_index.get(node["id"])
+        if i is None:
+            i = self.post_index[node["id"]] = len(self.posts)
+            self.posts.append(node["id"])
+            self.post_names.append(node.get("name"))
+        return i
+
+    def add_edge(self, user: int, post: int) -> bool:
+        """Record that `user` made `post`; False if already known"""
+        if (user, post) in self.edge_set:
+            return False
+        self.edge_set.add((user, post))
+        self.edge_users.append(user)
+        self.edge_posts.append(post)
+        return True
+
+    def add_post(self, post: dict) -> list:
+        """Record a post and all of its makers; returns the makers' integer IDs"""
+        p = self.post(post)
+        makers = [self.user(m) for m in post.get("makers") or [] if m.get("id")]
+        for u in makers:
+            self.add_edge(u, p)
+        return makers
+
+    def save(self):
+        """Checkpoint: append new edges, then rewrite nodes and state"""
+        os.makedirs(self.path, exist_ok=True)
+        pairs = array("I")
+        for u, p in zip(self.edge_users[self.saved_edges:], self.edge_posts[self.saved_edges:]):
+            pairs.extend((u, p))
+        with open(os.path.join(self.path, "edges.bin"), "ab") as f:
+            pairs.tofile(f)
+        self.saved_edges = len(self.edge_users)
+        _write_json(os.path.join(self.path, "nodes.json"), {
+            "users": self.users,
+            "usernames": self.usernames,
+            "posts": self.posts,
+            "post_names": self.post_names,
+        })
+        _write_json(os.path.join(self.path, "state.json"), dict(self.state, edges=self.saved_edges))
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_GRAPH) -> "MakerGraph":
+        """Load a graph directory (empty graph if it does not exist)"""
+        graph = cls(path)
+        try:
+            with open(os.path.join(path, "nodes.json")) as f:
+                nodes = json.load(f)
+            with open(os.path.join(path, "state.json")) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return graph
+        graph.users, graph.usernames = nodes["users"], nodes["usernames"]
+        graph.posts, graph.post_names = nodes["posts"], nodes["post_names"]
+        graph.user_index = {u: i for i, u in enumerate(graph.users)}
+        graph.post_index = {p: i for i, p in enumerate(graph.posts)}
+
+        # Edges past the committed count belong to an interrupted checkpoint
+        committed = state.pop("edges", 0)
+        pairs = array("I")
+        with open(os.path.join(path, "edges.bin"), "rb") as f:
+            pairs.frombytes(f.read(committed * 2 * pairs.itemsize))
+        if len(pairs) < committed * 2:
+            raise ValueError(f"{path}/edges.bin is shorter than its checkpoint")
+        with open(os.path.join(path, "edges.bin"), "r+b") as f:
+            f.truncate(committed * 2 * pairs.itemsize)
+        graph.edge_users, graph.edge_posts = pairs[0::2], pairs[1::2]
+        graph.edge_set = set(zip(graph.edge_users, graph.edge_posts))
+        graph.saved_edges = committed
+        graph.state = state
+        return graph
+
+
+class UnionFind:
+    """Disjoint sets over 0..n-1 with path halving and union by size"""
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int):
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Serial makers and co-maker clusters from a crawled maker graph
+Usage: python3 scripts/maker_report.py --limit 20
+       python3 scripts/maker_report.py --graph ./producthunt-makers --min-launches 3
+"""
+import argparse
+from collections import defaultdict
+from maker_graph import DEFAULT_GRAPH, MakerGraph, UnionFind
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serial makers and clusters from the maker graph")
+    parser.add_argument("--graph", "-g", default=DEFAULT_GRAPH, help=f"Graph directory (default: {DEFAULT_GRAPH})")
+    parser.add_argument("--limit", "-l", type=int, default=20, help="Rows per section")
+    parser.add_argument("--min-launches", type=int, default=2, help="Launches to count as a serial maker")
+    args = parser.parse_args()
+
+    graph = MakerGraph.load(args.graph)
+    if not graph.edge_users:
+        print(f"No graph found in {args.graph}")
+        return
+
+    n = len(graph.users)
+    launches = [0] * n
+    for u in graph.edge_users:
+        launches[u] += 1
+
+    # Makers of the same post share a cluster
+    uf = UnionFind(n)
+    first_maker = {}
+    for u, p in zip(graph.edge_users, graph.edge_posts):
+        if p in first_maker:
+            uf.union(u, first_maker[p])
+        else:
+            first_maker[p] = u
+    members = defaultdict(list)
+    for u in range(n):
+        if launches[u]:
+            members[uf.find(u)].append(u)
+    cluster_posts = defaultdict(int)
+    for p, u in first_maker.items():
+        cluster_posts[uf.find(u)] += 1
+
+    def label(u):
+        return f"@{graph.usernames[u]}" if graph.usernames[u] else graph.users[u]
+
+    serial = sorted((u for u in range(n) if launches[u] >= args.min_launches), key=lambda u: -launches[u])
+    clusters = sorted((r for r in members if len(members[r]) > 1),
+                      key=lambda r: (-len(members[r]), -cluster_posts[r]))
+
+    print(f"graph: {args.graph}")
+    print(f"makers: {sum(1 for c in launches if c)}")
+    print(f"posts: {len(graph.posts)}")
+    print(f"clusters: {len(clusters)}")
+    print(f"---")
+    print(f"serial_makers[{min(len(serial), args.limit)}]{{maker,launches}}:")
+    for u in serial[:args.limit]:
+        print(f"  {label(u)},{launches[u]}")
+    print(f"---")
+    print(f"clusters[{min(len(clusters), args.limit)}]{{makers,posts,top_makers}}:")
+    for root in clusters[:args.limit]:
+        top = sorted(members[root], key=lambda u: -launches[u])[:5]
+        print(f"  {len(members[root])},{cluster_posts[root]},{' '.join(label(u) for u in top)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Local store for backfilled ProductHunt posts.
+
+Layout of a store directory:
+  days/YYYY-MM-DD.json   {post_id: post} for posts created that day (UTC)
+  manifest.json          {day: {"posts": n, "completed_at": iso}} for finished days
+  filters.json           the query filters the store was built with
+"""
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+DEFAULT_STORE = "./producthunt-posts"
+
+_manifest_lock = threading.Lock()
+
+
+def _write_json(path: str, data):
+    """Write JSON atomically"""
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def load_manifest(store: str) -> dict:
+    """Load the per-day completion manifest"""
+    try:
+        with open(os.path.join(store, "manifest.json")) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def check_filters(store: str, filters: dict):
+    """Pin a store to one set of query filters; raises ValueError on a mismatch"""
+    path = os.path.join(store, "filters.json")
+    try:
+        with open(path) as f:
+            existing = json.load(f)
+    except FileNotFoundError:
+        os.makedirs(store, exist_ok=True)
+        _write_json(path, filters)
+        return
+    if existing != filters:
+        raise ValueError(f"store {store} was built with filters {existing}, not {filters}")
+
+
+def save_day(store: str, day: str, posts: dict, complete: bool = True):
+    """Store one day's posts keyed by ID and, if complete, record it in the manifest"""
+    os.makedirs(os.path.join(store, "days"), exist_ok=True)
+    _write_json(os.path.join(store, "days", f"{day}.json"), posts)
+    if not complete:
+        return
+    with _manifest_lock:
+        manifest = load_manifest(store)
+        manifest[day] = {
+            "posts": len(posts),
+            "completed_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        _write_json(os.path.join(store, "manifest.json"), dict(sorted(manifest.items())))
+
+
+def load_day(store: str, day: str) -> dict:
+    """Load one day's {post_id: post}"""
+    try:
+        with open(os.path.join(store, "days", f"{day}.json")) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def iter_posts(store: str, start: str = None, end: str = None):
+    """Yield stored posts (deduped by ID) for days in [start, end]"""
+    days_dir = os.path.join(store, "days")
+    if not os.path.isdir(days_dir):
+        return
+    seen = set()
+    for fname in sorted(os.listdir(days_dir)):
+        if not fname.endswith(".json"):
+            continue
+        day = fname[:-5]
+        if (start and day < start) or (end and day > end):
+            continue
+        for post_id, post in load_day(store, day).items():
+            if post_id not in seen:
+                seen.add(post_id)
+                yield post
@@ -3,41 +3,363 @@
 ProductHunt GraphQL API wrapper
 """
 import urllib.request
+import hashlib
 import json
+import os
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from credential import get_access_token
 
 API_URL = "https://api.producthunt.com/v2/api/graphql"
+MAX_QUERY_COMPLEXITY = 500  # Per-document budget for batched lookups (estimated)
+MAX_RETRIES = 3
+MAX_REGISTERED = 256
+CACHE_DIR = os.path.expanduser(os.environ.get("PRODUCTHUNT_CACHE_DIR", "~/.cache/opc-skills/producthunt"))
+CACHE_ENABLED = not os.environ.get("PRODUCTHUNT_NO_CACHE")
 
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|\$?[A-Za-z_][A-Za-z0-9_]*|-?\d+|[{}():]')
 
-def graphql(query: str, variables: dict = None) -> dict:
-    """Execute GraphQL query"""
+
+class Query:
+    """A registered GraphQL document: minified, hashed and pre-encoded once"""
+
+    def __init__(self, text: str, ttl: float = 0):
+        self.text = minify(text)
+        self.hash = hashlib.sha256(self.text.encode()).hexdigest()
+        self.ttl = ttl
+        self.tokens = _TOKEN.findall(self.text)
+        self.prefix = b'{"query": ' + json.dumps(self.text).encode() + b', "variables": '
+
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def minify(query: str) -> str:
+    """Collapse whitespace and drop it around punctuation"""
+    query = re.sub(r"\s+", " ", query).strip()
+    return re.sub(r" ?([{}():,!=\[\]]) ?", r"\1", query)
+
+
+def register_query(query: str, ttl: float = 0) -> Query:
+    """Register a document once; `ttl` seconds > 0 enables the response cache"""
+    with _registry_lock:
+        registered = _registry.get((query, ttl))
+        if registered is None:
+            if len(_registry) >= MAX_REGISTERED:
+                _registry.clear()  # generated batch documents can be unbounded
+            registered = _registry[(query, ttl)] = Query(query, ttl)
+        return registered
+
+
+def _cache_path(query: Query, variables: dict) -> str:
+    key = hashlib.sha256(
+        (query.hash + json.dumps(variables, sort_keys=True, separators=(",", ":"))).encode()
+    ).hexdigest()
+    return os.path.join(CACHE_DIR, key[:2], f"{key}.json")
+
+
+def _cache_read(path: str, ttl: float):
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path) as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _cache_write(path: str, data: dict):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+class ComplexityBudget:
+    """Process-wide scheduler for PH's complexity points over a rolling window.
+
+    Each query reserves its estimated complexity before it is sent; queries
+    that do not fit wait for the window to reset. The budget is re-synced
+    from the X-Rate-Limit-* response headers after every request.
+    """
+
+    def __init__(self, limit: int = 6250, window: float = 900.0):
+        self._cond = threading.Condition()
+        self._limit = limit
+        self._window = window
+        self._remaining = limit
+        self._reset_at = time.monotonic() + window
+
+    def acquire(self, cost: int):
+        """Block until `cost` points fit in the current window, then reserve them"""
+        cost = min(cost, self._limit)
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if now >= self._reset_at:
+                    self._remaining = self._limit
+                    self._reset_at = now + self._window
+                if self._remaining >= cost:
+                    self._remaining -= cost
+                    return
+                self._cond.wait(self._reset_at - now)
+
+    def update(self, headers):
+        """Sync with X-Rate-Limit-Limit/Remaining/Reset"""
+        try:
+            limit = headers.get("X-Rate-Limit-Limit")
+            remaining = headers.get("X-Rate-Limit-Remaining")
+            reset = headers.get("X-Rate-Limit-Reset")
+            with self._cond:
+                if limit is not None:
+                    self._limit = int(limit)
+                if remaining is not None and reset is not None:
+                    self._remaining = int(remaining)
+                    self._reset_at = time.monotonic() + float(reset)
+                self._cond.notify_all()
+        except ValueError:
+            pass
+
+    def exhausted(self, reset_in: float = None) -> float:
+        """Mark the budget spent after a rate-limit error; returns seconds to wait"""
+        wait = reset_in if reset_in is not None else self._window
+        with self._cond:
+            self._remaining = 0
+            self._reset_at = time.monotonic() + wait
+        return wait
+
+
+budget = ComplexityBudget()
+
+
+def _reset_in(headers, errors: list = None):
+    """Seconds until the window resets, from headers or a rate-limit error body"""
+    for err in errors or []:
+        reset = (err.get("details") or {}).get("reset_in")
+        if reset is not None:
+            return float(reset)
+    reset = headers.get("X-Rate-Limit-Reset") if headers else None
+    try:
+        return float(reset) if reset is not None else None
+    except ValueError:
+        return None
+
+
+def _is_rate_limited(errors: list) -> bool:
+    """True if a GraphQL error list reports an exhausted rate limit"""
+    for err in errors or []:
+        text = str(err.get("error") or err.get("message") or "").lower()
+        if "rate" in text and "limit" in text:
+            return True
+    return False
+
+
+def graphql(query, variables: dict = None, ttl: float = None) -> dict:
+    """Execute GraphQL query within the complexity budget, retrying after rate limits.
+
+    `query` is a registered Query or a string (registered on first use).
+    Responses are cached on disk by query hash plus variables for `ttl`
+    seconds (default: the query's registered TTL).
+    """
     token = get_access_token()
     if not token:
         print("error: PRODUCTHUNT_ACCESS_TOKEN not set", file=sys.stderr)
         sys.exit(1)
     
-    body = json.dumps({"query": query, "variables": variables or {}}).encode()
+    if not isinstance(query, Query):
+        query = register_query(query)
+    variables = variables or {}
+    ttl = query.ttl if ttl is None else ttl
+    cache_path = _cache_path(query, variables) if CACHE_ENABLED and ttl > 0 else None
+    if cache_path:
+        cached = _cache_read(cache_path, ttl)
+        if cached is not None:
+            return cached
+
+    body = query.prefix + json.dumps(variables).encode() + b"}"
     headers = {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
     }
+    cost = estimate_complexity(query, variables)
     
-    req = urllib.request.Request(API_URL, data=body, headers=headers, method="POST")
-    try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read().decode())
-            if "errors" in data:
-                print(f"error: {data['errors'][0]['message']}", file=sys.stderr)
-                sys.exit(1)
-            return data.get("data", {})
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode()
-        print(f"error: HTTP {e.code} - {error_body}", file=sys.stderr)
-        sys.exit(1)
-    except Exception as e:
-        print(f"error: {e}", file=sys.stderr)
-        sys.exit(1)
+    for attempt in range(MAX_RETRIES + 1):
+        budget.acquire(cost)
+        req = urllib.request.Request(API_URL, data=body, headers=headers, method="POST")
+        try:
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                budget.update(resp.headers)
+                data = json.loads(resp.read().decode())
+                errors = data.get("errors")
+                if errors and _is_rate_limited(errors) and attempt < MAX_RETRIES:
+                    wait = budget.exhausted(_reset_in(resp.headers, errors))
+                    print(f"warning: Rate limited, retrying in {wait:.0f}s", file=sys.stderr)
+                    continue
+                if errors:
+                    print(f"error: {errors[0]['message']}", file=sys.stderr)
+                    sys.exit(1)
+                result = data.get("data") or {}
+                if cache_path:
+                    _cache_write(cache_path, result)
+                return result
+        except urllib.error.HTTPError as e:
+            error_body = e.read().decode()
+            if e.code == 429 and attempt < MAX_RETRIES:
+                try:
+                    errors = json.loads(error_body).get("errors")
+                except ValueError:
+                    errors = None
+                wait = budget.exhausted(_reset_in(e.headers, errors))
+                print(f"warning: Rate limited, retrying in {wait:.0f}s", file=sys.stderr)
+                continue
+            print(f"error: HTTP {e.code} - {error_body}", file=sys.stderr)
+            sys.exit(1)
+        except Exception as e:
+            print(f"error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+
+def estimate_complexity(query, variables: dict = None) -> int:
+    """Estimate a query's complexity: one point per field, multiplied by the
+    `first`/`last` page size of every enclosing connection"""
+    variables = variables or {}
+    tokens = query.tokens if isinstance(query, Query) else _TOKEN.findall(query)
+    total = 0
+    stack = []    # multiplier of each open selection set
+    pending = 1   # page size of the field whose selection set opens next
+    in_args = page_arg = False
+    for token in tokens:
+        if in_args:
+            if token == ")":
+                in_args = False
+            elif token in ("first", "last"):
+                page_arg = True
+            elif page_arg and token != ":":
+                value = variables.get(token[1:]) if token.startswith("$") else token
+                pending = int(value) if str(value).isdigit() else 20
+                page_arg = False
+        elif token == "(":
+            in_args = True
+        elif token == "{":
+            stack.append((stack[-1] if stack else 1) * pending)
+            pending = 1
+        elif token == "}":
+            stack.pop()
+        elif token == ":" and stack:
+            total -= stack[-1]  # the previous name was an alias, not a field
+        elif stack and token[0].isalpha():
+            total += stack[-1]
+            pending = 1
+    return max(total, 1)
+
+
+def identifier_arg(identifier: str, name_arg: str = "slug", id_type: str = "ID") -> tuple:
+    """GraphQL (argument, type) for an identifier: numeric IDs use `id` typed `id_type`"""
+    if identifier.isdigit():
+        return "id", id_type
+    return name_arg, "String"
+
+
+def graphql_batch(field: str, selection: str, identifiers: list,
+                  name_arg: str = "slug", max_complexity: int = MAX_QUERY_COMPLEXITY,
+                  variables: dict = None, variable_types: dict = None, ttl: float = 0,
+                  id_type: str = "ID") -> dict:
+    """Look up many entities with aliased fields in as few documents as possible.
+
+    Builds `p0: post(slug: $v0) { ... } p1: post(id: $v1) { ... }`, chunked so
+    each document stays under `max_complexity`, and returns {identifier: node}
+    (None for entities that were not found).
+
+    `selection` may reference per-entity variables declared in `variable_types`
+    ({name: GraphQL type}); `variables` maps identifier -> {name: value}.
+    Responses are cached for `ttl` seconds. Pass `id_type="ID!"` for fields
+    whose `id` argument is non-null (e.g. `comment`).
+    """
+    variables = variables or {}
+    variable_types = variable_types or {}
+    unique = list(dict.fromkeys(identifiers))
+    per_entity = estimate_complexity(f"{{ {field} {{ {selection} }} }}")
+    chunk_size = max(1, max_complexity // per_entity)
+
+    results = {}
+    for start in range(0, len(unique), chunk_size):
+        chunk = unique[start:start + chunk_size]
+        definitions, fields, values = [], [], {}
+        for i, identifier in enumerate(chunk):
+            arg, arg_type = identifier_arg(identifier, name_arg, id_type)
+            definitions.append(f"$v{i}: {arg_type}")
+            values[f"v{i}"] = identifier
+            entity_selection = selection
+            for name, var_type in variable_types.items():
+                entity_selection = re.sub(rf"\${name}\b", f"${name}{i}", entity_selection)
+                definitions.append(f"${name}{i}: {var_type}")
+                values[f"{name}{i}"] = variables.get(identifier, {}).get(name)
+            fields.append(f"p{i}: {field}({arg}: $v{i}) {{ {entity_selection} }}")
+        query = f"query Batch({', '.join(definitions)}) {{ {' '.join(fields)} }}"
+        data = graphql(register_query(query, ttl), values)
+        for i, identifier in enumerate(chunk):
+            results[identifier] = data.get(f"p{i}")
+    return results
+
+
+def iter_connection(query, variables: dict, path: tuple, page_size: int = 50,
+                    max_items: int = None, ttl: float = None):
+    """Yield the nodes of the connection at `path` (e.g. ("user", "madePosts")).
+
+    Follows pageInfo.hasNextPage/endCursor, starting from variables["after"],
+    and fetches the next page in the background while the current one is
+    consumed. `query` must accept $first and $after for that connection.
+    """
+    variables = dict(variables or {})
+
+    def fetch(after, first):
+        data = graphql(query, dict(variables, first=first, after=after), ttl)
+        for key in path:
+            data = (data or {}).get(key)
+        return data or {}
+
+    def page_size_for(count):
+        return page_size if max_items is None else max(1, min(page_size, max_items - count))
+
+    count = 0
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(fetch, variables.get("after"), page_size_for(0))
+        while future:
+            connection = future.result()
+            edges = connection.get("edges") or []
+            page_info = connection.get("pageInfo") or {}
+            future = None
+            fetched = count + len(edges)
+            if (page_info.get("hasNextPage") and page_info.get("endCursor")
+                    and (max_items is None or fetched < max_items)):
+                future = pool.submit(fetch, page_info["endCursor"], page_size_for(fetched))
+            for edge in edges:
+                yield edge["node"]
+                count += 1
+                if max_items is not None and count >= max_items:
+                    if future:
+                        future.cancel()
+                    return
+
+
+def follow_connection(query, variables: dict, path: tuple, connection: dict,
+                      max_items: int = None) -> list:
+    """Nodes of an already-fetched first page plus every page after it"""
+    nodes = [e["node"] for e in (connection or {}).get("edges", [])]
+    if max_items is not None:
+        nodes = nodes[:max_items]
+    page_info = (connection or {}).get("pageInfo") or {}
+    if (page_info.get("hasNextPage") and page_info.get("endCursor")
+            and (max_items is None or len(nodes) < max_items)):
+        rest = None if max_items is None else max_items - len(nodes)
+        nodes.extend(iter_connection(query, dict(variables, after=page_info["endCursor"]),
+                                     path, max_items=rest))
+    return nodes
 
 
 def format_count(n) -> str:
@@ -52,15 +374,54 @@ def format_count(n) -> str:
     return str(n)
 
 
-def clean_post(p: dict) -> dict:
-    """Clean post object"""
+# Output field name -> GraphQL selection that produces it. Queries select only
+# the fields a caller prints, so each item costs fewer complexity points.
+POST_FIELDS = {
+    "id": "id",
+    "name": "name",
+    "tagline": "tagline",
+    "slug": "slug",
+    "description": "description",
+    "votes": "votesCount",
+    "comments": "commentsCount",
+    "url": "url",
+    "website": "website",
+    "featured_at": "featuredAt",
+    "created_at": "createdAt",
+    "makers": "makers { id name username }",
+    "topics": "topics(first: 5) { edges { node { id name slug } } }",
+}
+
+POST_LIST_FIELDS = ["name", "tagline", "votes"]
+
+
+def parse_fields(value: str, available: dict) -> list:
+    """Parse a comma-separated --fields value, rejecting unknown names"""
+    if not value:
+        return None
+    fields = [f.strip() for f in value.split(",") if f.strip()]
+    unknown = [f for f in fields if f not in available]
+    if unknown:
+        raise ValueError(f"unknown fields: {', '.join(unknown)} (available: {', '.join(available)})")
+    return fields
+
+
+def build_selection(fields: list, available: dict = POST_FIELDS, required: tuple = ("id",)) -> str:
+    """GraphQL selection set for the `required` plus requested output fields"""
+    names = list(dict.fromkeys([*required, *fields]))
+    return "\n".join(available[f] for f in names)
+
+
+def clean_post(p: dict, fields: list = None) -> dict:
+    """Clean post object, optionally projected to `fields`"""
     if not p:
         return None
-    return {
+    cleaned = {
         "id": p.get("id"),
         "name": p.get("name"),
         "tagline": p.get("tagline"),
         "slug": p.get("slug"),
+        "description": p.get("description"),
         "votes": p.get("votesCount"),
         "comments": p.get("commentsCount"),
         "url": p.get("url"),
@@ -68,7 +429,11 @@ def clean_post(p: dict) -> dict:
         "featured_at": p.get("featuredAt"),
         "created_at": p.get("createdAt"),
         "makers": [m.get("name") for m in (p.get("makers") or [])],
+        "topics": [e["node"].get("slug") for e in (p.get("topics") or {}).get("edges", [])],
     }
+    if fields:
+        return {f: cleaned[f] for f in fields}
+    return cleaned
 
 
 def clean_user(u: dict) -> dict:
@@ -181,8 +546,27 @@ def print_topic(t: dict):
         print(f"url: {t['url']}")
 
 
-def print_posts_list(posts: list, label: str = "posts"):
+def format_field(name: str, value) -> str:
+    """Format one projected post field for TOON output"""
+    if name in ("votes", "comments"):
+        return format_count(value)
+    if name in ("makers", "topics"):
+        return " ".join(value or [])
+    if value is None:
+        return ""
+    if name in ("tagline", "description"):
+        return str(value)[:60].replace("\n", " ")
+    return str(value)
+
+
+def print_posts_list(posts: list, label: str = "posts", fields: list = None):
     """Print list of posts"""
+    if fields:
+        cleaned = [clean_post(p, fields) for p in posts if p]
+        print(f"{label}[{len(cleaned)}]{{{','.join(fields)}}}:")
+        for p in cleaned:
+            print("  " + ",".join(format_field(f, p[f]) for f in fields))
+        return
     cleaned = [clean_post(p) for p in posts if p]
     print(f"{label}[{len(cleaned)}]{{name,tagline,votes}}:")
     for p in cleaned:
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Topic trend analytics: launch velocity, vote percentiles and week-over-week growth
+Usage: python3 scripts/topic_trends.py ai developer-tools --after 2026-01-01 --before 2026-03-31
+       python3 scripts/topic_trends.py ai productivity --db ./producthunt.db
+       python3 scripts/topic_trends.py ai --store ./producthunt-posts
+"""
+import argparse
+import sys
+from datetime import date, datetime, timezone
+from producthunt_api import register_query, iter_connection, format_count
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy required. Install with: pip install numpy")
+    sys.exit(1)
+
+QUERY = register_query("""
+query TopicPosts($first: Int, $after: String, $topic: String, $postedAfter: DateTime, $postedBefore: DateTime) {
+  posts(first: $first, after: $after, topic: $topic, postedAfter: $postedAfter, postedBefore: $postedBefore) {
+    pageInfo { hasNextPage endCursor }
+    edges {
+      node {
+        id
+        votesCount
+        commentsCount
+        featuredAt
+        createdAt
+      }
+    }
+  }
+}
+""", ttl=3600)
+
+PERCENTILES = (50, 90, 99)
+
+
+def rows_from_api(topics: list, after: str, before: str):
+    """Yield (topic, votes, comments, timestamp) from the posts API"""
+    for topic in topics:
+        variables = {
+            "topic": topic,
+            "postedAfter": f"{after}T00:00:00Z",
+            "postedBefore": f"{before}T23:59:59Z",
+        }
+        for p in iter_connection(QUERY, variables, ("posts",)):
+            yield topic, p.get("votesCount"), p.get("commentsCount"), p.get("featuredAt") or p.get("createdAt")
+
+
+def rows_from_db(path: str, topics: list, after: str, before: str):
+    """Yield (topic, votes, comments, timestamp) from the SQLite warehouse"""
+    from warehouse import connect
+    conn = connect(path)
+    sql = (
+        "SELECT t.slug, p.votes, p.comments, COALESCE(p.featured_at, p.created_at) AS ts"
+        " FROM posts p JOIN post_topics pt ON pt.post_id = p.id JOIN topics t ON t.id = pt.topic_id"
+        f" WHERE t.slug IN ({', '.join('?' * len(topics))})"
+        " AND COALESCE(p.featured_at, p.created_at) >= ? AND COALESCE(p.featured_at, p.created_at) < ?"
+    )
+    for row in conn.execute(sql, [*topics, after, f"{before}T23:59:59Z"]):
+        yield row["slug"], row["votes"], row["comments"], row["ts"]
+
+
+def rows_from_store(store: str, topics: list, after: str, before: str):
+    """Yield (topic, votes, comments, timestamp) from a backfill store"""
+    from post_store import iter_posts
+    wanted = set(topics)
+    for p in iter_posts(store, after, before):
+        for edge in (p.get("topics") or {}).get("edges", []):
+            slug = edge["node"].get("slug")
+            if slug in wanted:
+                yield slug, p.get("votesCount"), p.get("commentsCount"), p.get("featuredAt") or p.get("createdAt")
+
+
+def to_columns(rows, topics: list) -> dict:
+    """Pack row tuples into columnar arrays"""
+    index = {t: i for i, t in enumerate(topics)}
+    topic, votes, comments, stamps = [], [], [], []
+    for slug, v, c, ts in rows:
+        if not ts:
+            continue
+        topic.append(index[slug])
+        votes.append(v or 0)
+        comments.append(c or 0)
+        stamps.append(ts[:19])
+    return {
+        "topic": np.asarray(topic, dtype=np.int32),
+        "votes": np.asarray(votes, dtype=np.int64),
+        "comments": np.asarray(comments, dtype=np.int64),
+        "ts": np.asarray(stamps, dtype="datetime64[s]"),
+    }
+
+
+def group_percentiles(groups: np.ndarray, values: np.ndarray, n_groups: int, qs) -> np.ndarray:
+    """Nearest-rank percentiles of `values` per group -> array (n_groups, len(qs))"""
+    out = np.zeros((n_groups, len(qs)), dtype=np.float64)
+    if not len(values):
+        return out
+    order = np.lexsort((values, groups))
+    sorted_values = values[order]
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    has = counts > 0
+    for j, q in enumerate(qs):
+        idx = starts + np.floor((counts - 1).clip(min=0) * q / 100).astype(np.int64)
+        out[has, j] = sorted_values[idx[has]]
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ProductHunt topic trend analytics")
+    parser.add_argument("topics", nargs="+", help="Topic slugs")
+    parser.add_argument("--after", help="Start date (YYYY-MM-DD, default: 12 weeks ago)")
+    parser.add_argument("--before", help="End date (YYYY-MM-DD, default: today)")
+    parser.add_argument("--db", help="Read from this SQLite warehouse instead of the API")
+    parser.add_argument("--store", help="Read from this backfill store instead of the API")
+    args = parser.parse_args()
+
+    today = datetime.now(timezone.utc).date()
+    before = args.before or today.isoformat()
+    after = args.after or date.fromordinal(today.toordinal() - 84).isoformat()
+    try:
+        start, end = date.fromisoformat(after), date.fromisoformat(before)
+    except ValueError as e:
+        parser.error(f"invalid date: {e}")
+    if start > end:
+        parser.error(f"--after {after} is later than --before {before}")
+    topics = list(dict.fromkeys(args.topics))
+
+    if args.db:
+        rows = rows_from_db(args.db, topics, after, before)
+    elif args.store:
+        rows = rows_from_store(args.store, topics, after, before)
+    else:
+        rows = rows_from_api(topics, after, before)
+    cols = to_columns(rows, topics)
+    # Every source is filtered on the same timestamp the rows are bucketed by
+    days = cols["ts"].astype("datetime64[D]")
+    first_day, last_day = np.datetime64(after, "D"), np.datetime64(before, "D")
+    keep = (days >= first_day) & (days <= last_day)
+    cols = {k: v[keep] for k, v in cols.items()}
+    days = days[keep]
+
+    n = len(topics)
+    span_days = (end - start).days + 1
+    launches = np.bincount(cols["topic"], minlength=n)
+    votes_total = np.bincount(cols["topic"], weights=cols["votes"], minlength=n)
+    comments_total = np.bincount(cols["topic"], weights=cols["comments"], minlength=n)
+    velocity = launches / span_days
+    mean_votes = np.divide(votes_total, launches, out=np.zeros(n), where=launches > 0)
+    mean_comments = np.divide(comments_total, launches, out=np.zeros(n), where=launches > 0)
+    pct = group_percentiles(cols["topic"], cols["votes"], n, PERCENTILES)
+
+    # Launches per (topic, full 7-day week counted back from `before`) -> week-over-week growth;
+    # a partial week left over at the start of the range is not bucketed
+    n_weeks = max(1, span_days // 7)
+    weeks_back = (last_day - days).astype(np.int64) // 7
+    in_weeks = weeks_back < n_weeks
+    week = n_weeks - 1 - weeks_back[in_weeks]
+    weekly = np.bincount(cols["topic"][in_weeks] * n_weeks + week,
+                         minlength=n * n_weeks).reshape(n, n_weeks)
+    prev, last = (weekly[:, -2], weekly[:, -1]) if n_weeks > 1 else (weekly[:, -1], weekly[:, -1])
+    wow = np.divide((last - prev) * 100.0, prev, out=np.zeros(n), where=prev > 0)
+
+    print(f"range: {after}..{before} ({span_days} days, {n_weeks} full weeks ending {before})")
+    print(f"posts: {len(cols['topic'])}")
+    print(f"topics[{n}]{{topic,launches,per_day,mean_votes,p50,p90,p99,mean_comments,last_week,prev_week,wow}}:")
+    for i, topic in enumerate(topics):
+        print(f"  {topic},{launches[i]},{velocity[i]:.2f},{mean_votes[i]:.1f},"
+              f"{format_count(pct[i, 0])},{format_count(pct[i, 1])},{format_count(pct[i, 2])},"
+              f"{mean_comments[i]:.1f},{last[i]},{prev[i]},{wow[i]:+.1f}%")
+    print(f"---")
+    print(f"weekly_launches[{n}]{{topic,weeks}}:")
+    for i, topic in enumerate(topics):
+        print(f"  {topic},{' '.join(str(x) for x in weekly[i])}")
+
+
+if __name__ == "__main__":
+    main()
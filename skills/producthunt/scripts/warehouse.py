@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+SQLite warehouse for ProductHunt data.
+
+GraphQL nodes are normalized into posts, users, topics, collections and
+comments plus their join tables. Upserts are idempotent and never overwrite a
+stored value with a field the incoming node did not select.
+"""
+import sqlite3
+
+DEFAULT_DB = "./producthunt.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    tagline TEXT,
+    slug TEXT,
+    description TEXT,
+    votes INTEGER,
+    comments INTEGER,
+    url TEXT,
+    website TEXT,
+    featured_at TEXT,
+    created_at TEXT
+);
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    username TEXT,
+    name TEXT,
+    headline TEXT,
+    url TEXT,
+    twitter TEXT,
+    website TEXT,
+    is_maker INTEGER
+);
+CREATE TABLE IF NOT EXISTS topics (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    slug TEXT,
+    description TEXT,
+    posts_count INTEGER,
+    followers_count INTEGER,
+    url TEXT
+);
+CREATE TABLE IF NOT EXISTS collections (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    tagline TEXT,
+    url TEXT,
+    followers INTEGER,
+    featured_at TEXT,
+    user_id TEXT
+);
+CREATE TABLE IF NOT EXISTS comments (
+    id TEXT PRIMARY KEY,
+    post_id TEXT,
+    parent_id TEXT,
+    user_id TEXT,
+    body TEXT,
+    votes INTEGER,
+    created_at TEXT
+);
+CREATE TABLE IF NOT EXISTS post_makers (
+    post_id TEXT,
+    user_id TEXT,
+    PRIMARY KEY (post_id, user_id)
+);
+CREATE TABLE IF NOT EXISTS post_topics (
+    post_id TEXT,
+    topic_id TEXT,
+    PRIMARY KEY (post_id, topic_id)
+);
+CREATE TABLE IF NOT EXISTS collection_posts (
+    collection_id TEXT,
+    post_id TEXT,
+    PRIMARY KEY (collection_id, post_id)
+);
+CREATE INDEX IF NOT EXISTS idx_posts_featured_at ON posts (featured_at);
+CREATE INDEX IF NOT EXISTS idx_posts_created_at ON posts (created_at);
+CREATE INDEX IF NOT EXISTS idx_users_username ON users (username);
+CREATE INDEX IF NOT EXISTS idx_topics_slug ON topics (slug);
+CREATE INDEX IF NOT EXISTS idx_comments_post ON comments (post_id);
+CREATE INDEX IF NOT EXISTS idx_post_makers_user ON post_makers (user_id);
+CREATE INDEX IF NOT EXISTS idx_post_topics_topic ON post_topics (topic_id);
+"""
+
+
+def connect(path: str = DEFAULT_DB) -> sqlite3.Connection:
+    """Open the warehouse, creating tables and indexes if needed"""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _upsert(conn: sqlite3.Connection, table: str, row: dict):
+    """INSERT or merge by id; NULL (unselected) fields keep the stored value"""
+    cols = list(row)
+    updates = ", ".join(f"{c} = COALESCE(excluded.{c}, {c})" for c in cols if c != "id")
+    conn.execute(
+        f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))}) "
+        f"ON CONFLICT(id) DO UPDATE SET {updates}",
+        [row[c] for c in cols],
+    )
+
+
+def _link(conn: sqlite3.Connection, table: str, a: str, b: str, left, right):
+    conn.execute(f"INSERT OR IGNORE INTO {table} ({a}, {b}) VALUES (?, ?)", (left, right))
+
+
+def _unlink(conn: sqlite3.Connection, table: str, a: str, left):
+    """Drop every link of `left`, before re-adding the current set"""
+    conn.execute(f"DELETE FROM {table} WHERE {a} = ?", (left,))
+
+
+def _edges(connection) -> list:
+    """Nodes of a connection (or a plain list)"""
+    if isinstance(connection, list):
+        return connection
+    return [e["node"] for e in (connection or {}).get("edges", []) if e.get("node")]
+
+
+def upsert_user(conn: sqlite3.Connection, u: dict) -> str:
+    """Upsert a user node; returns its id (None if the node has no id)"""
+    if not u or not u.get("id"):
+        return None
+    is_maker = u.get("isMaker")
+    _upsert(conn, "users", {
+        "id": u["id"],
+        "username": u.get("username"),
+        "name": u.get("name"),
+        "headline": u.get("headline"),
+        "url": u.get("url"),
+        "twitter": u.get("twitterUsername"),
+        "website": u.get("websiteUrl"),
+        "is_maker": None if is_maker is None else int(is_maker),
+    })
+    return u["id"]
+
+
+def upsert_topic(conn: sqlite3.Connection, t: dict) -> str:
+    """Upsert a topic node; returns its id"""
+    if not t or not t.get("id"):
+        return None
+    _upsert(conn, "topics", {
+        "id": t["id"],
+        "name": t.get("name"),
+        "slug": t.get("slug"),
+        "description": t.get("description"),
+        "posts_count": t.get("postsCount"),
+        "followers_count": t.get("followersCount"),
+        "url": t.get("url"),
+    })
+    return t["id"]
+
+
+def upsert_comment(conn: sqlite3.Connection, c: dict, post_id: str = None, parent_id: str = None) -> str:
+    """Upsert a comment node and, recursively, its `replies`; returns its id"""
+    if not c or not c.get("id"):
+        return None
+    user_id = upsert_user(conn, c.get("user"))
+    _upsert(conn, "comments", {
+        "id": c["id"],
+        "post_id": post_id,
+        "parent_id": parent_id,
+        "user_id": user_id,
+        "body": c.get("body"),
+        "votes": c.get("votesCount"),
+        "created_at": c.get("createdAt"),
+    })
+    for reply in _edges(c.get("replies")):
+        upsert_comment(conn, reply, post_id, c["id"])
+    return c["id"]
+
+
+def upsert_post(conn: sqlite3.Connection, p: dict) -> str:
+    """Upsert a post node with its makers, topics and comments; returns its id.
+
+    Selected makers/topics replace the post's stored links; unselected ones keep them.
+    """
+    if not p or not p.get("id"):
+        return None
+    _upsert(conn, "posts", {
+        "id": p["id"],
+        "name": p.get("name"),
+        "tagline": p.get("tagline"),
+        "slug": p.get("slug"),
+        "description": p.get("description"),
+        "votes": p.get("votesCount"),
+        "comments": p.get("commentsCount"),
+        "url": p.get("url"),
+        "website": p.get("website"),
+        "featured_at": p.get("featuredAt"),
+        "created_at": p.get("createdAt"),
+    })
+    if "makers" in p:
+        _unlink(conn, "post_makers", "post_id", p["id"])
+    for maker in p.get("makers") or []:
+        user_id = upsert_user(conn, maker)
+        if user_id:
+            _link(conn, "post_makers", "post_id", "user_id", p["id"], user_id)
+    if "topics" in p:
+        _unlink(conn, "post_topics", "post_id", p["id"])
+    for topic in _edges(p.get("topics")):
+        topic_id = upsert_topic(conn, topic)
+        if topic_id:
+            _link(conn, "post_topics", "post_id", "topic_id", p["id"], topic_id)
+    for comment in _edges(p.get("comments")):
+        upsert_comment(conn, comment, p["id"])
+    return p["id"]
+
+
+def upsert_collection(conn: sqlite3.Connection, c: dict) -> str:
+    """Upsert a collection node with its curator and posts; returns its id"""
+    if not c or not c.get("id"):
+        return None
+    user_id = upsert_user(conn, c.get("user"))
+    _upsert(conn, "collections", {
+        "id": c["id"],
+        "name": c.get("name"),
+        "tagline": c.get("tagline"),
+        "url": c.get("url"),
+        "followers": c.get("followersCount"),
+        "featured_at": c.get("featuredAt"),
+        "user_id": user_id,
+    })
+    for post in _edges(c.get("posts")):
+        post_id = upsert_post(conn, post)
+        if post_id:
+            _link(conn, "collection_posts", "collection_id", "post_id", c["id"], post_id)
+    return c["id"]
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Batch get subreddit info as NDJSON
+Usage: python3 scripts/batch_get_subreddits.py python,rust,golang
+       python3 scripts/batch_get_subreddits.py --file subs.txt --workers 8
+"""
+import argparse
+import json
+import sys
+from reddit_api import bulk_get, clean_subreddit, read_names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch get subreddit info (NDJSON)")
+    parser.add_argument("subreddits", nargs="*", help="Subreddit names (comma or space separated)")
+    parser.add_argument("--file", "-f", help="File with one subreddit per line ('-' for stdin)")
+    parser.add_argument("--workers", "-w", type=int, default=8, help="Concurrent requests")
+    parser.add_argument("--ttl", type=float, default=86400, help="Cache TTL in seconds (0 disables)")
+    args = parser.parse_args()
+
+    names = read_names(args.subreddits, args.file, prefix="r/")
+    if not names:
+        parser.error("no subreddits given")
+
+    paths = {f"r/{name}/about": name for name in names}
+    for path, data, error in bulk_get(list(paths), args.workers, args.ttl):
+        if error:
+            record = {"name": paths[path], "error": error}
+        else:
+            record = clean_subreddit(data)
+        sys.stdout.write(json.dumps(record) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
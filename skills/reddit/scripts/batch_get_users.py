@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Batch get user profiles as NDJSON
+Usage: python3 scripts/batch_get_users.py spez,kn0thing
+       python3 scripts/batch_get_users.py --file authors.txt --workers 8
+       cat authors.txt | python3 scripts/batch_get_users.py --file -
+"""
+import argparse
+import json
+import sys
+from reddit_api import bulk_get, clean_user, read_names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch get Reddit user profiles (NDJSON)")
+    parser.add_argument("usernames", nargs="*", help="Usernames (comma or space separated)")
+    parser.add_argument("--file", "-f", help="File with one username per line ('-' for stdin)")
+    parser.add_argument("--workers", "-w", type=int, default=8, help="Concurrent requests")
+    parser.add_argument("--ttl", type=float, default=86400, help="Cache TTL in seconds (0 disables)")
+    args = parser.parse_args()
+
+    names = read_names(args.usernames, args.file, prefix="u/")
+    if not names:
+        parser.error("no usernames given")
+
+    paths = {f"user/{name}/about": name for name in names}
+    for path, data, error in bulk_get(list(paths), args.workers, args.ttl):
+        if error:
+            record = {"name": paths[path], "error": error}
+        else:
+            record = clean_user(data)
+        sys.stdout.write(json.dumps(record) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
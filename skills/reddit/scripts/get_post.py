@@ -5,27 +5,38 @@ Usage: python3 scripts/get_post.py POST_ID --comments 20
 """
 import argparse
 import json
-from reddit_api import api_get, clean_post, print_post, print_comments_list
+from reddit_api import api_get, write_raw, parse_fields, clean_post, print_post, print_comments_list, COMMENT_FIELDS
 
 
 def main():
     parser = argparse.ArgumentParser(description="Get Reddit post with comments")
     parser.add_argument("post_id", help="Post ID (e.g., abc123)")
     parser.add_argument("--comments", "-c", type=int, default=20, help="Max comments")
+    parser.add_argument("--fields", help=f"Comma-separated comment columns ({','.join(COMMENT_FIELDS)})")
     parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
+    parser.add_argument("--raw", action="store_true", help="Output the raw response bytes")
     args = parser.parse_args()
 
+    try:
+        fields = parse_fields(args.fields, COMMENT_FIELDS)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.raw:
+        write_raw(f"comments/{args.post_id}", {"limit": args.comments})
+        return
+
     # Reddit returns [post_listing, comments_listing]
     data = api_get(f"comments/{args.post_id}", {"limit": args.comments})
     
-    if not isinstance(data, list) or len(data) < 2:
-        print(f"Post not found: {args.post_id}")
-        return
-
     if args.json:
         print(json.dumps(data, indent=2))
         return
 
+    if not isinstance(data, list) or len(data) < 2:
+        print(f"Post not found: {args.post_id}")
+        return
+
     # First element is post listing
     post_listing = data[0].get("data", {}).get("children", [])
     if post_listing:
@@ -36,7 +47,7 @@ def main():
     comments_listing = data[1].get("data", {}).get("children", [])
     if comments_listing:
         print(f"---")
-        print_comments_list(comments_listing[:args.comments])
+        print_comments_list(comments_listing[:args.comments], fields=fields)
 
 
 if __name__ == "__main__":
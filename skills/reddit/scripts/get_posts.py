@@ -4,7 +4,8 @@ Get posts from a subreddit
 Usage: python3 scripts/get_posts.py python --sort hot --limit 20
 """
 import argparse
-from reddit_api import api_get, print_posts_list, print_pagination
+import json
+from reddit_api import api_get, write_raw, parse_fields, print_posts_list, print_pagination, POST_FIELDS
 
 
 def main():
@@ -16,8 +17,16 @@ def main():
                         help="Time filter for top/controversial")
     parser.add_argument("--limit", "-l", type=int, default=25, help="Max posts (max 100)")
     parser.add_argument("--after", "-a", help="Pagination cursor")
+    parser.add_argument("--fields", help=f"Comma-separated columns ({','.join(POST_FIELDS)})")
+    parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
+    parser.add_argument("--raw", action="store_true", help="Output the raw response bytes")
     args = parser.parse_args()
 
+    try:
+        fields = parse_fields(args.fields, POST_FIELDS)
+    except ValueError as e:
+        parser.error(str(e))
+
     path = f"r/{args.subreddit}/{args.sort}"
     params = {
         "limit": min(args.limit, 100),
@@ -26,14 +35,23 @@ def main():
     if args.time and args.sort in ["top", "controversial"]:
         params["t"] = args.time
 
+    if args.raw:
+        write_raw(path, params)
+        return
+
     data = api_get(path, params)
+
+    if args.json:
+        print(json.dumps(data, indent=2))
+        return
+
     listing = data.get("data", {})
     posts = listing.get("children", [])
 
     label = f"r/{args.subreddit}/{args.sort}"
     if args.time:
         label += f"/{args.time}"
-    print_posts_list(posts, label)
+    print_posts_list(posts, label, fields)
     print_pagination(listing)
 
 
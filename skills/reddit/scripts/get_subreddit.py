@@ -5,15 +5,20 @@ Usage: python3 scripts/get_subreddit.py python
 """
 import argparse
 import json
-from reddit_api import api_get, clean_subreddit, print_subreddit
+from reddit_api import api_get, write_raw, clean_subreddit, print_subreddit
 
 
 def main():
     parser = argparse.ArgumentParser(description="Get subreddit info")
     parser.add_argument("subreddit", help="Subreddit name (without r/)")
     parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
+    parser.add_argument("--raw", action="store_true", help="Output the raw response bytes")
     args = parser.parse_args()
 
+    if args.raw:
+        write_raw(f"r/{args.subreddit}/about")
+        return
+
     data = api_get(f"r/{args.subreddit}/about")
     
     if args.json:
@@ -5,7 +5,7 @@ Usage: python3 scripts/get_user.py spez --posts 10
 """
 import argparse
 import json
-from reddit_api import api_get, clean_user, print_user, print_posts_list
+from reddit_api import api_get, write_raw, clean_user, print_user, print_posts_list
 
 
 def main():
@@ -13,8 +13,13 @@ def main():
     parser.add_argument("username", help="Username (without u/)")
     parser.add_argument("--posts", "-p", type=int, default=0, help="Include N recent posts")
     parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
+    parser.add_argument("--raw", action="store_true", help="Output the raw response bytes")
     args = parser.parse_args()
 
+    if args.raw:
+        write_raw(f"user/{args.username}/about")
+        return
+
     data = api_get(f"user/{args.username}/about")
     
     if args.json:
@@ -5,15 +5,92 @@ No authentication required - just append .json to URLs
 """
 import urllib.request
 import urllib.parse
+import hashlib
 import json
+import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from credential import get_user_agent
 
 BASE_URL = "https://www.reddit.com"
+MAX_RETRIES = 3
+CACHE_DIR = os.path.expanduser(os.environ.get("REDDIT_CACHE_DIR", "~/.cache/opc-skills/reddit"))
 
 
-def api_get(path: str, params: dict = None) -> dict:
-    """Make GET request to Reddit JSON API"""
+class RateGovernor:
+    """Process-wide pacing based on Reddit's x-ratelimit-* headers.
+
+    Requests are spread evenly over the remaining budget until the window
+    resets, so concurrent callers never burst past the limit. Before the
+    first response arrives, the documented 100 requests/minute is assumed.
+    """
+
+    def __init__(self, requests: int = 100, window: float = 60.0):
+        self._lock = threading.Lock()
+        self._budget = float(requests)
+        self._remaining = float(requests)
+        self._reset_at = time.monotonic() + window
+        self._window = window
+        self._next_slot = 0.0
+
+    def acquire(self):
+        """Block until the caller may send its next request"""
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._reset_at:
+                # Window rolled over before fresh headers arrived
+                self._reset_at = now + self._window
+                self._remaining = self._budget
+            if self._remaining >= 1:
+                slot = max(now, self._next_slot)
+                interval = max(self._reset_at - slot, 0.0) / self._remaining
+            else:
+                # Budget spent: queue behind the reset at the next window's pace
+                interval = self._window / self._budget
+                slot = max(self._reset_at, self._next_slot)
+            self._next_slot = slot + interval
+            self._remaining -= 1
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def update(self, headers):
+        """Sync the budget with x-ratelimit-remaining/x-ratelimit-reset"""
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining, reset = float(remaining), float(reset)
+            used = float(headers.get("x-ratelimit-used") or 0)
+        except ValueError:
+            return
+        with self._lock:
+            self._remaining = remaining
+            self._reset_at = time.monotonic() + reset
+            if used + remaining > 0:
+                self._budget = used + remaining
+
+    def throttled(self, headers) -> float:
+        """Mark the budget exhausted after a 429; returns seconds to wait"""
+        reset = headers.get("x-ratelimit-reset") or headers.get("retry-after")
+        try:
+            wait = float(reset) if reset is not None else self._window
+        except ValueError:
+            wait = self._window
+        with self._lock:
+            self._remaining = 0.0
+            self._reset_at = max(self._reset_at, time.monotonic() + wait)
+        return wait
+
+
+governor = RateGovernor()
+
+
+def build_url(path: str, params: dict = None) -> str:
+    """Build a Reddit JSON API URL"""
     url = f"{BASE_URL}/{path}.json"
     if params:
         params["raw_json"] = "1"  # Avoid HTML entity encoding
@@ -22,13 +99,34 @@ def api_get(path: str, params: dict = None) -> dict:
             url += "?" + urllib.parse.urlencode(filtered)
     else:
         url += "?raw_json=1"
-    
+    return url
+
+
+def api_request(path: str, params: dict = None) -> bytes:
+    """GET raw response bytes, paced by the governor and retried on 429.
+
+    Raises urllib.error.HTTPError once retries are exhausted.
+    """
+    url = build_url(path, params)
     headers = {"User-Agent": get_user_agent()}
-    req = urllib.request.Request(url, headers=headers)
-    
+    for attempt in range(MAX_RETRIES + 1):
+        governor.acquire()
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                governor.update(resp.headers)
+                return resp.read()
+        except urllib.error.HTTPError as e:
+            if e.code != 429 or attempt == MAX_RETRIES:
+                raise
+            wait = governor.throttled(e.headers)
+            print(f"warning: Rate limited, retrying in {wait:.0f}s", file=sys.stderr)
+
+
+def api_get_raw(path: str, params: dict = None) -> bytes:
+    """Make GET request to Reddit JSON API, returning the undecoded body"""
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read().decode())
+        return api_request(path, params)
     except urllib.error.HTTPError as e:
         if e.code == 429:
             print("error: Rate limited. Wait a moment and try again.", file=sys.stderr)
@@ -42,6 +140,96 @@ def api_get(path: str, params: dict = None) -> dict:
         sys.exit(1)
 
 
+def api_get(path: str, params: dict = None) -> dict:
+    """Make GET request to Reddit JSON API"""
+    return json.loads(api_get_raw(path, params).decode())
+
+
+def write_raw(path: str, params: dict = None):
+    """Pass the response bytes straight to stdout without re-serializing"""
+    sys.stdout.buffer.write(api_get_raw(path, params))
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.flush()
+
+
+def cached_get(path: str, params: dict = None, ttl: float = 3600) -> dict:
+    """GET JSON through an on-disk cache; entries older than `ttl` seconds are refetched.
+
+    Raises urllib.error.HTTPError like api_request.
+    """
+    key = hashlib.sha256(build_url(path, dict(params or {})).encode()).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, key[:2], f"{key}.json")
+    try:
+        if ttl > 0 and time.time() - os.path.getmtime(cache_path) < ttl:
+            with open(cache_path, "rb") as f:
+                return json.loads(f.read())
+    except (OSError, ValueError):
+        pass
+
+    raw = api_request(path, params)
+    data = json.loads(raw.decode())
+    if ttl > 0:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(raw)
+        os.replace(tmp, cache_path)
+    return data
+
+
+def bulk_get(paths: list, workers: int = 8, ttl: float = 3600, params: dict = None):
+    """Fetch many paths (sharing `params`) concurrently under the shared governor.
+
+    Yields (path, data, error) in completion order; error is a message or None.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(cached_get, path, dict(params or {}), ttl): path for path in paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                yield path, future.result(), None
+            except urllib.error.HTTPError as e:
+                yield path, None, f"HTTP {e.code}"
+            except Exception as e:
+                yield path, None, str(e)
+
+
+def read_names(names: list = None, source: str = None, prefix: str = "") -> list:
+    """Collect names from args and a file ('-' for stdin), deduped case-insensitively.
+
+    A leading `prefix` (e.g. "u/" or "r/") and "/" are stripped from each name.
+    """
+    raw = []
+    for n in names or []:
+        raw.extend(n.split(","))
+    if source:
+        f = sys.stdin if source == "-" else open(source)
+        try:
+            raw.extend(f.read().split())
+        finally:
+            if f is not sys.stdin:
+                f.close()
+
+    result, seen = [], set()
+    for name in raw:
+        name = name.strip().lstrip("/")
+        if prefix and name.lower().startswith(prefix):
+            name = name[len(prefix):]
+        if name and name.lower() not in seen:
+            seen.add(name.lower())
+            result.append(name)
+    return result
+
+
+def posting_rate(children: list) -> float:
+    """Posts per second implied by the timestamps in a listing"""
+    stamps = [c["data"]["created_utc"] for c in children if c.get("data", {}).get("created_utc")]
+    if len(stamps) < 2:
+        return 0.0
+    span = max(stamps) - min(stamps)
+    return (len(stamps) - 1) / span if span > 0 else 0.0
+
+
 def format_count(n) -> str:
     """Format numbers (1234567 -> 1.2M)"""
     if n is None:
@@ -54,36 +242,57 @@ def format_count(n) -> str:
     return str(n)
 
 
-def clean_post(p: dict) -> dict:
-    """Clean post object from Reddit's data structure"""
+# Field name -> extractor over the raw `data` object. Cleaners only build the
+# fields a caller asks for, so list printers skip permalinks and text bodies.
+POST_FIELDS = {
+    "id": lambda d: d.get("id"),
+    "title": lambda d: d.get("title"),
+    "subreddit": lambda d: d.get("subreddit"),
+    "author": lambda d: d.get("author"),
+    "score": lambda d: d.get("score"),
+    "upvote_ratio": lambda d: d.get("upvote_ratio"),
+    "num_comments": lambda d: d.get("num_comments"),
+    "url": lambda d: d.get("url"),
+    "permalink": lambda d: f"https://reddit.com{d.get('permalink', '')}",
+    "selftext": lambda d: (d.get("selftext") or "")[:500],
+    "created_utc": lambda d: d.get("created_utc"),
+    "is_self": lambda d: d.get("is_self"),
+    "link_flair_text": lambda d: d.get("link_flair_text"),
+}
+
+COMMENT_FIELDS = {
+    "id": lambda d: d.get("id"),
+    "author": lambda d: d.get("author"),
+    "body": lambda d: (d.get("body") or "")[:300],
+    "score": lambda d: d.get("score"),
+    "created_utc": lambda d: d.get("created_utc"),
+}
+
+POST_LIST_FIELDS = ["title", "subreddit", "score", "num_comments"]
+COMMENT_LIST_FIELDS = ["author", "body", "score"]
+
+
+def parse_fields(value: str, available: dict) -> list:
+    """Parse a comma-separated --fields value, rejecting unknown names"""
+    if not value:
+        return None
+    fields = [f.strip() for f in value.split(",") if f.strip()]
+    unknown = [f for f in fields if f not in available]
+    if unknown:
+        raise ValueError(f"unknown fields: {', '.join(unknown)} (available: {', '.join(available)})")
+    return fields
+
+
+def clean_post(p: dict, fields: list = None) -> dict:
+    """Clean post object from Reddit's data structure, optionally projected to `fields`"""
     data = p.get("data", p)
-    return {
-        "id": data.get("id"),
-        "title": data.get("title"),
-        "subreddit": data.get("subreddit"),
-        "author": data.get("author"),
-        "score": data.get("score"),
-        "upvote_ratio": data.get("upvote_ratio"),
-        "num_comments": data.get("num_comments"),
-        "url": data.get("url"),
-        "permalink": f"https://reddit.com{data.get('permalink', '')}",
-        "selftext": (data.get("selftext") or "")[:500],
-        "created_utc": data.get("created_utc"),
-        "is_self": data.get("is_self"),
-        "link_flair_text": data.get("link_flair_text"),
-    }
+    return {f: POST_FIELDS[f](data) for f in (fields or POST_FIELDS)}
 
 
-def clean_comment(c: dict) -> dict:
-    """Clean comment object"""
+def clean_comment(c: dict, fields: list = None) -> dict:
+    """Clean comment object, optionally projected to `fields`"""
     data = c.get("data", c)
-    return {
-        "id": data.get("id"),
-        "author": data.get("author"),
-        "body": (data.get("body") or "")[:300],
-        "score": data.get("score"),
-        "created_utc": data.get("created_utc"),
-    }
+    return {f: COMMENT_FIELDS[f](data) for f in (fields or COMMENT_FIELDS)}
 
 
 def clean_subreddit(s: dict) -> dict:
@@ -157,18 +366,45 @@ def print_user(u: dict):
     print(f"is_mod: {u.get('is_mod', False)}")
 
 
-def print_posts_list(posts: list, label: str = "posts"):
+def format_field(name: str, value) -> str:
+    """Format one projected field for a TOON list row"""
+    if name in ("score", "num_comments"):
+        return format_count(value)
+    if name == "subreddit":
+        return f"r/{value}"
+    if name == "author":
+        return f"u/{value}"
+    if value is None:
+        return ""
+    if name in ("title", "selftext", "body"):
+        return str(value)[:60].replace("\n", " ")
+    return str(value)
+
+
+def print_posts_list(posts: list, label: str = "posts", fields: list = None):
     """Print list of posts"""
-    cleaned = [clean_post(p) for p in posts if p]
+    if fields:
+        cleaned = [clean_post(p, fields) for p in posts if p]
+        print(f"{label}[{len(cleaned)}]{{{','.join(fields)}}}:")
+        for p in cleaned:
+            print("  " + ",".join(format_field(f, p[f]) for f in fields))
+        return
+    cleaned = [clean_post(p, POST_LIST_FIELDS) for p in posts if p]
     print(f"{label}[{len(cleaned)}]{{title,subreddit,score,comments}}:")
     for p in cleaned:
         title = (p['title'] or '')[:60]
         print(f"  {title},r/{p['subreddit']},{format_count(p['score'])},{format_count(p['num_comments'])}")
 
 
-def print_comments_list(comments: list, label: str = "comments"):
+def print_comments_list(comments: list, label: str = "comments", fields: list = None):
     """Print list of comments"""
-    cleaned = [clean_comment(c) for c in comments if c.get("kind") == "t1"]
+    if fields:
+        cleaned = [clean_comment(c, fields) for c in comments if c.get("kind") == "t1"]
+        print(f"{label}[{len(cleaned)}]{{{','.join(fields)}}}:")
+        for c in cleaned:
+            print("  " + ",".join(format_field(f, c[f]) for f in fields))
+        return
+    cleaned = [clean_comment(c, COMMENT_LIST_FIELDS) for c in comments if c.get("kind") == "t1"]
     print(f"{label}[{len(cleaned)}]{{author,body,score}}:")
     for c in cleaned:
         body = (c['body'] or '')[:60].replace('\n', ' ')
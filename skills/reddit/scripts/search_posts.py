@@ -4,7 +4,8 @@ Search posts on Reddit
 Usage: python3 scripts/search_posts.py "AI agent" --subreddit ClaudeAI --limit 20
 """
 import argparse
-from reddit_api import api_get, print_posts_list, print_pagination
+import json
+from reddit_api import api_get, write_raw, parse_fields, print_posts_list, print_pagination, POST_FIELDS
 
 
 def main():
@@ -17,8 +18,16 @@ def main():
                         default="all", help="Time filter")
     parser.add_argument("--limit", "-l", type=int, default=25, help="Max posts")
     parser.add_argument("--after", "-a", help="Pagination cursor")
+    parser.add_argument("--fields", help=f"Comma-separated columns ({','.join(POST_FIELDS)})")
+    parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
+    parser.add_argument("--raw", action="store_true", help="Output the raw response bytes")
     args = parser.parse_args()
 
+    try:
+        fields = parse_fields(args.fields, POST_FIELDS)
+    except ValueError as e:
+        parser.error(str(e))
+
     if args.subreddit:
         path = f"r/{args.subreddit}/search"
         params = {
@@ -39,7 +48,16 @@ def main():
             "after": args.after,
         }
 
+    if args.raw:
+        write_raw(path, params)
+        return
+
     data = api_get(path, params)
+
+    if args.json:
+        print(json.dumps(data, indent=2))
+        return
+
     listing = data.get("data", {})
     posts = listing.get("children", [])
 
@@ -48,7 +66,7 @@ def main():
         label = f"r/{args.subreddit}/search({args.query})"
     print(f"query: {args.query}")
     print(f"sort: {args.sort}, time: {args.time}")
-    print_posts_list(posts, label)
+    print_posts_list(posts, label, fields)
     print_pagination(listing)
 
 
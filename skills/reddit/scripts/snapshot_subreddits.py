@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Record subscribers, active users and post velocity for subreddits
+Usage: python3 scripts/snapshot_subreddits.py python rust golang
+       python3 scripts/snapshot_subreddits.py --file subs.txt --store ./reddit-snapshots
+"""
+import argparse
+import sys
+import time
+from reddit_api import bulk_get, read_names, posting_rate, format_count
+from snapshots import DEFAULT_STORE, name_ids, append_chunk
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snapshot subreddit metrics")
+    parser.add_argument("subreddits", nargs="*", help="Subreddit names (comma or space separated)")
+    parser.add_argument("--file", "-f", help="File with one subreddit per line ('-' for stdin)")
+    parser.add_argument("--store", "-s", default=DEFAULT_STORE, help=f"Store directory (default: {DEFAULT_STORE})")
+    parser.add_argument("--workers", "-w", type=int, default=8, help="Concurrent requests")
+    args = parser.parse_args()
+
+    names = read_names(args.subreddits, args.file, prefix="r/")
+    if not names:
+        parser.error("no subreddits given")
+
+    about, velocity = {}, {}
+    # Metrics must be live, so bypass the cache (ttl=0)
+    for path, data, error in bulk_get([f"r/{n}/about" for n in names], args.workers, ttl=0):
+        name = path.split("/")[1]
+        if error:
+            print(f"warning: r/{name}: {error}", file=sys.stderr)
+            continue
+        about[name] = data.get("data", {})
+    new_paths = [f"r/{n}/new" for n in about]
+    for path, data, error in bulk_get(new_paths, args.workers, ttl=0, params={"limit": 100}):
+        name = path.split("/")[1]
+        if error:
+            print(f"warning: r/{name}/new: {error}", file=sys.stderr)
+            continue
+        velocity[name] = posting_rate(data.get("data", {}).get("children", [])) * 3600
+
+    captured = [n for n in names if n in about]
+    if not captured:
+        print("No snapshots recorded")
+        return
+
+    now = time.time()
+    rows = {"ts": [], "sub": [], "subscribers": [], "active": [], "velocity": []}
+    for name, sub_id in zip(captured, name_ids(args.store, captured)):
+        info = about[name]
+        active = info.get("accounts_active", info.get("active_user_count"))
+        rows["ts"].append(now)
+        rows["sub"].append(sub_id)
+        rows["subscribers"].append(info.get("subscribers") if info.get("subscribers") is not None else -1)
+        rows["active"].append(active if active is not None else -1)
+        # NaN marks a failed /new fetch, so it is not mistaken for a subreddit with no posts
+        rows["velocity"].append(velocity.get(name, float("nan")))
+    append_chunk(args.store, rows)
+
+    print(f"store: {args.store}")
+    print(f"snapshots[{len(captured)}]{{subreddit,subscribers,active,posts_per_hour}}:")
+    for i, name in enumerate(captured):
+        rate = rows["velocity"][i]
+        print(f"  r/{name},{format_count(max(rows['subscribers'][i], 0))},"
+              f"{format_count(max(rows['active'][i], 0))},{'-' if rate != rate else f'{rate:.2f}'}")
+
+
+if __name__ == "__main__":
+    main()
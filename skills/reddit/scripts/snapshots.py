@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Append-only columnar store for subreddit metric snapshots.
+
+Layout of a store directory:
+  names.json          subreddit names; a row's `sub` column indexes this list
+  chunk-<ts>.npz      one chunk per snapshot run, one array per column
+"""
+import json
+import os
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy required. Install with: pip install numpy")
+    sys.exit(1)
+
+DEFAULT_STORE = "./reddit-snapshots"
+
+# Column name -> dtype. Missing integer metrics are stored as -1.
+COLUMNS = {
+    "ts": np.float64,          # unix time of the snapshot
+    "sub": np.int32,           # index into names.json
+    "subscribers": np.int64,
+    "active": np.int64,        # accounts_active
+    "velocity": np.float64,    # posts/hour from the `new` listing
+}
+
+
+def load_names(store: str) -> list:
+    """Load the subreddit name dictionary"""
+    try:
+        with open(os.path.join(store, "names.json")) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def name_ids(store: str, names: list) -> list:
+    """Map names to stable integer IDs, appending unseen names to names.json"""
+    known = load_names(store)
+    index = {n.lower(): i for i, n in enumerate(known)}
+    ids = []
+    for name in names:
+        if name.lower() not in index:
+            index[name.lower()] = len(known)
+            known.append(name)
+        ids.append(index[name.lower()])
+    os.makedirs(store, exist_ok=True)
+    tmp = os.path.join(store, "names.json.tmp")
+    with open(tmp, "w") as f:
+        json.dump(known, f)
+    os.replace(tmp, os.path.join(store, "names.json"))
+    return ids
+
+
+def append_chunk(store: str, rows: dict) -> str:
+    """Write one chunk of rows (column name -> sequence) and return its path"""
+    arrays = {col: np.asarray(rows[col], dtype=dtype) for col, dtype in COLUMNS.items()}
+    path = os.path.join(store, f"chunk-{time.time_ns()}.npz")
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, path)
+    return path
+
+
+def load_chunks(store: str) -> dict:
+    """Concatenate every chunk into one array per column"""
+    parts = {col: [] for col in COLUMNS}
+    if os.path.isdir(store):
+        for fname in sorted(os.listdir(store)):
+            if not (fname.startswith("chunk-") and fname.endswith(".npz")):
+                continue
+            with np.load(os.path.join(store, fname)) as chunk:
+                for col in COLUMNS:
+                    parts[col].append(chunk[col])
+    return {
+        col: np.concatenate(parts[col]) if parts[col] else np.empty(0, dtype=dtype)
+        for col, dtype in COLUMNS.items()
+    }
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Growth rates from recorded subreddit snapshots
+Usage: python3 scripts/subreddit_growth.py --days 30
+       python3 scripts/subreddit_growth.py python rust --store ./reddit-snapshots
+"""
+import argparse
+import time
+from reddit_api import format_count, read_names
+from snapshots import DEFAULT_STORE, load_names, load_chunks
+import numpy as np
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Subreddit growth from snapshots")
+    parser.add_argument("subreddits", nargs="*", help="Only these subreddits (default: all)")
+    parser.add_argument("--store", "-s", default=DEFAULT_STORE, help=f"Store directory (default: {DEFAULT_STORE})")
+    parser.add_argument("--days", "-d", type=float, help="Only use snapshots from the last N days")
+    parser.add_argument("--sort", choices=["growth", "pct", "velocity", "subscribers"],
+                        default="pct", help="Sort order (default: pct)")
+    args = parser.parse_args()
+
+    names = load_names(args.store)
+    cols = load_chunks(args.store)
+    keep = np.ones(len(cols["ts"]), dtype=bool)
+    if args.days:
+        keep &= cols["ts"] >= time.time() - args.days * 86400
+    if args.subreddits:
+        wanted = {n.lower() for n in read_names(args.subreddits, prefix="r/")}
+        ids = [i for i, n in enumerate(names) if n.lower() in wanted]
+        keep &= np.isin(cols["sub"], ids)
+    cols = {k: v[keep] for k, v in cols.items()}
+    if not len(cols["ts"]):
+        print("No snapshots found")
+        return
+
+    # Group rows by subreddit in time order; first/last row of each group
+    order = np.lexsort((cols["ts"], cols["sub"]))
+    cols = {k: v[order] for k, v in cols.items()}
+    subs, first, counts = np.unique(cols["sub"], return_index=True, return_counts=True)
+    last = first + counts - 1
+
+    subs0, subs1 = cols["subscribers"][first], cols["subscribers"][last]
+    days = (cols["ts"][last] - cols["ts"][first]) / 86400
+    growth = np.where((subs0 >= 0) & (subs1 >= 0), subs1 - subs0, 0)
+    pct = np.divide(growth * 100.0, subs0, out=np.zeros(len(subs), dtype=np.float64), where=subs0 > 0)
+    per_day = np.divide(growth, days, out=np.zeros(len(subs), dtype=np.float64), where=days > 0)
+    # Mean over the snapshots whose /new fetch succeeded (NaN rows are skipped; NaN if none did)
+    group = np.repeat(np.arange(len(subs)), counts)
+    measured = ~np.isnan(cols["velocity"])
+    n_measured = np.bincount(group, weights=measured, minlength=len(subs))
+    velocity_sum = np.bincount(group, weights=np.where(measured, cols["velocity"], 0.0), minlength=len(subs))
+    velocity = np.divide(velocity_sum, n_measured, out=np.full(len(subs), np.nan), where=n_measured > 0)
+    active = cols["active"][last]
+
+    key = {"growth": growth, "pct": pct, "velocity": velocity, "subscribers": subs1}[args.sort]
+    rank = np.argsort(-key, kind="stable")  # NaN velocities sort last
+
+    print(f"store: {args.store}")
+    print(f"growth[{len(subs)}]{{subreddit,subscribers,growth,pct,per_day,posts_per_hour,active,snapshots}}:")
+    for i in rank:
+        print(f"  r/{names[subs[i]]},{format_count(max(subs1[i], 0))},{growth[i]:+d},{pct[i]:+.2f}%,"
+              f"{per_day[i]:+.1f},{'-' if np.isnan(velocity[i]) else f'{velocity[i]:.2f}'},"
+              f"{format_count(max(active[i], 0))},{counts[i]}")
+
+
+if __name__ == "__main__":
+    main()
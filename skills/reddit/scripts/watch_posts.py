@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Watch subreddits for new posts and stream matches as NDJSON
+Usage: python3 scripts/watch_posts.py python learnpython --keyword asyncio --output new.ndjson
+"""
+import argparse
+import hashlib
+import heapq
+import http.client
+import json
+import math
+import sys
+import time
+import urllib.error
+from collections import deque
+from reddit_api import api_request, clean_post, parse_fields, posting_rate, POST_FIELDS
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        # Optimal size m = -n*ln(p)/ln(2)^2 bits and k = m/n*ln(2) hashes
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class SeenSet:
+    """Bounded-memory dedupe: exact ring buffer backed by two Bloom filter generations.
+
+    The ring buffer answers exactly for the most recent fullnames; the Bloom
+    filters remember older ones. When the current filter has absorbed
+    `capacity` keys it becomes the previous generation and a fresh one takes
+    over, so at least the last `capacity` keys are always remembered and each
+    filter's error rate stays bounded.
+    """
+
+    def __init__(self, recent: int = 10_000, capacity: int = 200_000):
+        self.recent = deque(maxlen=recent)
+        self.recent_set = set()
+        self.capacity = capacity
+        self.bloom = BloomFilter(capacity)
+        self.previous = None
+        self.count = 0
+
+    def __contains__(self, key: str) -> bool:
+        return (key in self.recent_set or key in self.bloom
+                or (self.previous is not None and key in self.previous))
+
+    def add(self, key: str):
+        if len(self.recent) == self.recent.maxlen:
+            self.recent_set.discard(self.recent[0])
+        self.recent.append(key)
+        self.recent_set.add(key)
+        if self.count >= self.capacity:
+            self.previous = self.bloom
+            self.bloom = BloomFilter(self.capacity)
+            self.count = 0
+        self.bloom.add(key)
+        self.count += 1
+
+
+def next_interval(rate: float, limit: int, min_interval: float, max_interval: float) -> float:
+    """Poll often enough that a listing of `limit` is about half full"""
+    if rate <= 0:
+        return max_interval
+    return min(max(limit / 2 / rate, min_interval), max_interval)
+
+
+def matches(post: dict, keywords: list) -> bool:
+    """Case-insensitive keyword match on title and selftext"""
+    if not keywords:
+        return True
+    text = f"{post.get('title') or ''}\n{post.get('selftext') or ''}".lower()
+    return any(k in text for k in keywords)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch subreddits for new posts (NDJSON)")
+    parser.add_argument("subreddits", nargs="+", help="Subreddit names (without r/)")
+    parser.add_argument("--keyword", "-k", action="append", default=[],
+                        help="Only emit posts containing keyword (repeatable)")
+    parser.add_argument("--output", "-o", help="Append NDJSON to file (default: stdout)")
+    parser.add_argument("--limit", "-l", type=int, default=100, help="Posts per poll (max 100)")
+    parser.add_argument("--min-interval", type=float, default=30, help="Min seconds between polls")
+    parser.add_argument("--max-interval", type=float, default=900, help="Max seconds between polls")
+    parser.add_argument("--once", action="store_true", help="Poll each subreddit once and exit")
+    parser.add_argument("--fields", help=f"Comma-separated output fields ({','.join(POST_FIELDS)})")
+    args = parser.parse_args()
+
+    try:
+        fields = parse_fields(args.fields, POST_FIELDS)
+    except ValueError as e:
+        parser.error(str(e))
+
+    limit = min(args.limit, 100)
+    keywords = [k.lower() for k in args.keyword]
+    seen = SeenSet()
+    out = open(args.output, "a") if args.output else sys.stdout
+
+    # (due_time, subreddit) min-heap, one entry per subreddit
+    schedule = [(0.0, name) for name in args.subreddits]
+    intervals = {name: args.min_interval for name in args.subreddits}
+    try:
+        while schedule:
+            due, name = heapq.heappop(schedule)
+            wait = due - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+
+            try:
+                data = json.loads(api_request(f"r/{name}/new", {"limit": limit}).decode())
+            except urllib.error.HTTPError as e:
+                if e.code in (403, 404):
+                    # Private, banned or missing: it will not come back, so stop polling it
+                    print(f"error: r/{name}: HTTP {e.code}, no longer watched", file=sys.stderr)
+                    continue
+                print(f"warning: r/{name}: {e}", file=sys.stderr)
+                if not args.once:
+                    heapq.heappush(schedule, (time.monotonic() + intervals[name], name))
+                continue
+            except (OSError, http.client.HTTPException, ValueError) as e:
+                # Transient failure (network, timeout, truncated body): keep watching and retry this
+                # subreddit at its current interval rather than backing off as if it were quiet
+                print(f"warning: r/{name}: {e}", file=sys.stderr)
+                if not args.once:
+                    heapq.heappush(schedule, (time.monotonic() + intervals[name], name))
+                continue
+            children = data.get("data", {}).get("children", [])
+            for child in reversed(children):
+                fullname = child.get("data", {}).get("name")
+                if not fullname or fullname in seen:
+                    continue
+                seen.add(fullname)
+                post = clean_post(child)
+                if matches(post, keywords):
+                    if fields:
+                        post = {f: post[f] for f in fields}
+                    out.write(json.dumps(post) + "\n")
+            out.flush()
+
+            if not args.once:
+                intervals[name] = next_interval(posting_rate(children), limit,
+                                                args.min_interval, args.max_interval)
+                heapq.heappush(schedule, (time.monotonic() + intervals[name], name))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
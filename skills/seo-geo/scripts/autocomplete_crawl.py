@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Expand seed keywords into long-tail lists via Google Autocomplete ("alphabet soup")
+Queries each seed with letter/digit/preposition suffixes and question-word prefixes,
+then re-expands new suggestions down to --depth, until --max-requests or --budget.
+
+Usage: python3 scripts/autocomplete_crawl.py "seo tools"
+       python3 scripts/autocomplete_crawl.py "seo tools" --depth 2 --max-requests 2000 -o longtail.txt
+"""
+import argparse
+import string
+import sys
+import dataforseo_api
+from dataforseo_api import BudgetExceeded, api_post_bulk, read_lines, add_api_args, apply_api_args
+from locations import add_location_args, apply_location_args
+from autocomplete_ideas import extract_suggestions
+
+ENDPOINT = "serp/google/autocomplete/live/advanced"
+
+MODIFIERS = {
+    "letters": [f"{{}} {c}" for c in string.ascii_lowercase],
+    "digits": [f"{{}} {c}" for c in string.digits],
+    "prepositions": [f"{{}} {w}" for w in ("for", "vs", "with", "without", "near", "like", "to")],
+    "questions": [f"{w} {{}}" for w in
+                  ("what", "how", "why", "when", "where", "who", "which", "can", "is", "are")],
+}
+
+
+def normalize(phrase: str) -> str:
+    return " ".join(phrase.lower().split())
+
+
+class SuggestionTrie:
+    """Word-level trie of normalized phrases: dedupes suggestions and lists them in prefix order"""
+
+    END = ""
+
+    def __init__(self):
+        self.root = {}
+
+    def insert(self, phrase: str) -> bool:
+        """Add a phrase; False if it was already present"""
+        node = self.root
+        for word in phrase.split():
+            node = node.setdefault(word, {})
+        if self.END in node:
+            return False
+        node[self.END] = {}
+        return True
+
+    def __iter__(self):
+        stack = [(self.root, [])]
+        while stack:
+            node, words = stack.pop()
+            if self.END in node:
+                yield " ".join(words)
+            for word in sorted((w for w in node if w != self.END), reverse=True):
+                stack.append((node[word], words + [word]))
+
+
+def expand(phrase: str, modifiers: list) -> list:
+    return [phrase] + [m.format(phrase) for m in modifiers]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk Google Autocomplete expansion")
+    parser.add_argument("seeds", nargs="*", help="Seed keywords")
+    parser.add_argument("--file", "-f", help="File with one seed per line ('-' for stdin)")
+    add_location_args(parser)
+    parser.add_argument("--depth", "-d", type=int, default=1,
+                        help="Expansion rounds; each round re-expands the previous round's new suggestions "
+                             "(default: 1)")
+    parser.add_argument("--modifiers", "-m", default="letters,digits,prepositions,questions",
+                        help=f"Comma-separated modifier sets from: {', '.join(MODIFIERS)} (default: all)")
+    parser.add_argument("--max-requests", type=int, default=500,
+                        help="Stop after this many autocomplete requests (default: 500)")
+    parser.add_argument("--batch", type=int, default=50, help="Requests between stop checks (default: 50)")
+    parser.add_argument("--limit", "-l", type=int, default=200, help="Max suggestions printed (default: 200)")
+    parser.add_argument("--output", "-o", help="Write every suggestion to this file, one per line")
+    parser.add_argument("--workers", "-w", type=int, default=8, help="Concurrent requests")
+    add_api_args(parser)
+    args = parser.parse_args()
+    apply_api_args(args)
+    apply_location_args(parser, args)
+
+    seeds = read_lines(args.seeds, args.file)
+    if not seeds:
+        parser.error("no seeds given")
+    names = [m.strip() for m in args.modifiers.split(",") if m.strip()]
+    unknown = [m for m in names if m not in MODIFIERS]
+    if unknown:
+        parser.error(f"unknown modifier set: {', '.join(unknown)}")
+    modifiers = [m for name in names for m in MODIFIERS[name]]
+
+    found = SuggestionTrie()
+    queried = set()
+    requests, errors = 0, 0
+    stop = None
+    frontier = [normalize(s) for s in seeds]
+    for phrase in frontier:
+        found.insert(phrase)
+
+    for depth in range(1, args.depth + 1):
+        queries = [q for phrase in frontier for q in expand(phrase, modifiers)]
+        queries = [q for q in dict.fromkeys(queries) if q not in queried]
+        new = []
+        print(f"  depth {depth}: {len(queries)} queries", file=sys.stderr)
+        for start in range(0, len(queries), args.batch):
+            remaining = args.max_requests - requests
+            if remaining <= 0:
+                stop = f"--max-requests {args.max_requests}"
+                break
+            if dataforseo_api.budget is not None and dataforseo_api.total_cost() >= dataforseo_api.budget:
+                stop = f"--budget ${dataforseo_api.budget:.2f}"
+                break
+            batch = queries[start:start + min(args.batch, remaining)]
+            data = [{"keyword": q, "location_code": args.location, "language_code": args.language}
+                    for q in batch]
+            outcomes = api_post_bulk(ENDPOINT, data, args.workers)
+            for query, (results, error) in zip(batch, outcomes):
+                if isinstance(error, BudgetExceeded):
+                    # Refused before sending; not counted as a request
+                    stop = f"--budget ${dataforseo_api.budget:.2f}"
+                    continue
+                queried.add(query)
+                requests += 1
+                if error:
+                    errors += 1
+                    print(f"error: {query}: {error}", file=sys.stderr)
+                    continue
+                for suggestion in extract_suggestions(results):
+                    suggestion = normalize(suggestion)
+                    if found.insert(suggestion):
+                        new.append(suggestion)
+            if stop:
+                break
+        frontier = new
+        if stop or not frontier:
+            break
+
+    if stop:
+        print(f"note: stopped at {stop}", file=sys.stderr)
+
+    suggestions = list(found)
+    print(f"seeds: {', '.join(seeds)}")
+    print(f"location: {args.location_name}")
+    print(f"requests: {requests}" + (f" ({errors} failed)" if errors else ""))
+    print(f"suggestions: {len(suggestions)}")
+    print(f"---")
+    shown = suggestions[:args.limit]
+    print(f"suggestions[{len(shown)}]:")
+    for suggestion in shown:
+        print(f"  {suggestion}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.writelines(s + "\n" for s in suggestions)
+        print(f"output: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
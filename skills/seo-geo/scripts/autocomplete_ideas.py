@@ -6,53 +6,62 @@ Get real-time search suggestions from Google Autocomplete
 Usage: python3 scripts/autocomplete_ideas.py "Claude Code"
 """
 import argparse
-from dataforseo_api import api_post, get_result
+from dataforseo_api import api_post, get_result, add_api_args, apply_api_args
+from locations import add_location_args, apply_location_args
+
+
+def extract_suggestions(results: list) -> list:
+    """Suggestion strings from autocomplete task results"""
+    suggestions = []
+    for result in results:
+        items = result.get("items", [])
+        
+        # Try different possible field names if items is empty
+        if not items:
+            items = result.get("autocomplete", [])
+            if not items:
+                items = result.get("suggestions", [])
+        
+        for item in items:
+            # Handle different response formats
+            suggestion = None
+            if isinstance(item, dict):
+                if item.get("type") == "autocomplete_item":
+                    suggestion = item.get("title", "").strip()
+                elif "value" in item:
+                    suggestion = item.get("value", "").strip()
+            elif isinstance(item, str):
+                suggestion = item.strip()
+            
+            if suggestion:
+                suggestions.append(suggestion)
+    return suggestions
 
 
 def main():
     parser = argparse.ArgumentParser(description="Google Autocomplete keyword suggestions")
     parser.add_argument("keyword", help="Seed keyword for autocomplete")
-    parser.add_argument("--location", "-loc", type=int, default=2840,
-                        help="Location code (default: 2840 = US)")
+    add_location_args(parser)
+    add_api_args(parser)
     args = parser.parse_args()
+    apply_api_args(args)
+    apply_location_args(parser, args)
 
     data = [{
         "keyword": args.keyword,
         "location_code": args.location,
-        "language_code": "en"
+        "language_code": args.language
     }]
     
     response = api_post("serp/google/autocomplete/live/advanced", data)
     results = get_result(response)
     
     print(f"keyword: {args.keyword}")
-    print(f"location: {args.location}")
+    print(f"location: {args.location_name}")
     print()
     
     if results:
-        suggestions = []
-        for result in results:
-            items = result.get("items", [])
-            
-            # Try different possible field names if items is empty
-            if not items:
-                items = result.get("autocomplete", [])
-                if not items:
-                    items = result.get("suggestions", [])
-            
-            for item in items:
-                # Handle different response formats
-                suggestion = None
-                if isinstance(item, dict):
-                    if item.get("type") == "autocomplete_item":
-                        suggestion = item.get("title", "").strip()
-                    elif "value" in item:
-                        suggestion = item.get("value", "").strip()
-                elif isinstance(item, str):
-                    suggestion = item.strip()
-                
-                if suggestion:
-                    suggestions.append(suggestion)
+        suggestions = extract_suggestions(results)
         
         if suggestions:
             print(f"autocomplete_suggestions[{len(suggestions)}]:")
@@ -2,35 +2,50 @@
 """
 Backlinks analysis using DataForSEO API
 Usage: python3 scripts/backlinks.py "example.com" --limit 20
+       python3 scripts/backlinks.py --file domains.txt --limit 10
 """
 import argparse
-from dataforseo_api import api_post, get_result, print_backlinks_list, format_count
+import sys
+from dataforseo_api import (api_post_bulk, read_lines, print_backlinks_list, format_count,
+                            add_api_args, apply_api_args)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Backlinks analysis")
-    parser.add_argument("target", help="Target domain")
+    parser.add_argument("targets", nargs="*", help="Target domains")
+    parser.add_argument("--file", "-f", help="File with one domain per line ('-' for stdin)")
     parser.add_argument("--limit", "-l", type=int, default=20, help="Max results")
+    parser.add_argument("--workers", "-w", type=int, default=4, help="Concurrent requests")
+    add_api_args(parser)
     args = parser.parse_args()
+    apply_api_args(args)
+
+    targets = read_lines(args.targets, args.file)
+    if not targets:
+        parser.error("no targets given")
 
     data = [{
-        "target": args.target,
+        "target": target,
         "limit": args.limit,
         "order_by": ["rank,desc"]
-    }]
-    
-    response = api_post("backlinks/backlinks/live", data)
-    results = get_result(response)
+    } for target in targets]
     
-    print(f"target: {args.target}")
-    
-    if results:
-        result = results[0]
-        print(f"total_backlinks: {format_count(result.get('total_count'))}")
-        items = result.get("items", [])
-        print_backlinks_list(items[:args.limit])
-    else:
-        print("No results found")
+    # Up to 100 domains per POST
+    outcomes = api_post_bulk("backlinks/backlinks/live", data, args.workers)
+
+    for i, (target, (results, error)) in enumerate(zip(targets, outcomes)):
+        if i:
+            print(f"===")
+        print(f"target: {target}")
+        if error:
+            print(f"error: {target}: {error}", file=sys.stderr)
+        if results:
+            result = results[0]
+            print(f"total_backlinks: {format_count(result.get('total_count'))}")
+            items = result.get("items") or []
+            print_backlinks_list(items[:args.limit])
+        else:
+            print("No results found")
 
 
 if __name__ == "__main__":
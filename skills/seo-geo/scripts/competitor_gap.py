@@ -6,24 +6,27 @@ Finds keywords where competitor ranks but you don't
 Usage: python3 scripts/competitor_gap.py "opc.dev" "claudemarketplaces.com" --limit 50
 """
 import argparse
-from dataforseo_api import api_post, get_result, format_count
+from dataforseo_api import api_post, get_result, format_count, add_api_args, apply_api_args
+from locations import add_location_args, apply_location_args
 
 
 def main():
     parser = argparse.ArgumentParser(description="Competitor keyword gap analysis")
     parser.add_argument("my_domain", help="Your domain (without https://)")
     parser.add_argument("competitor_domain", help="Competitor domain (without https://)")
-    parser.add_argument("--location", "-loc", type=int, default=2840,
-                        help="Location code (default: 2840 = US)")
+    add_location_args(parser)
     parser.add_argument("--limit", "-l", type=int, default=50, 
                         help="Max results (default: 50)")
+    add_api_args(parser)
     args = parser.parse_args()
+    apply_api_args(args)
+    apply_location_args(parser, args)
 
     data = [{
         "target1": args.my_domain,
         "target2": args.competitor_domain,
         "location_code": args.location,
-        "language_code": "en",
+        "language_code": args.language,
         "intersections": False,  # Only show keywords where target2 ranks but target1 doesn't
         "limit": args.limit
     }]
@@ -33,7 +36,7 @@ def main():
     
     print(f"my_domain: {args.my_domain}")
     print(f"competitor_domain: {args.competitor_domain}")
-    print(f"location: {args.location}")
+    print(f"location: {args.location_name}")
     print()
     
     if results:
@@ -4,16 +4,283 @@ DataForSEO API wrapper
 """
 import urllib.request
 import urllib.parse
+import atexit
+import hashlib
 import json
 import base64
+import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from credential import get_dataforseo_credentials
 
 API_BASE = "https://api.dataforseo.com/v3"
+CACHE_DIR = os.environ.get("DATAFORSEO_CACHE_DIR", os.path.expanduser("~/.cache/opc-skills/dataforseo"))
+# task_post accepts up to 100 tasks per POST; every /live endpoint takes exactly one
+MAX_TASKS_PER_REQUEST = 100
 
 
-def api_post(endpoint: str, data: list) -> dict:
-    """Make POST request to DataForSEO API"""
+def _parse_ttls(value: str) -> dict:
+    """Parse "family=seconds,..." TTL overrides"""
+    pairs = (item.split("=", 1) for item in value.split(",") if "=" in item)
+    return {family.strip(): int(ttl) for family, ttl in pairs}
+
+
+# Response cache TTL (seconds) per endpoint family; override with
+# DATAFORSEO_CACHE_TTLS="serp=3600,keywords_data=604800"
+CACHE_TTLS = {
+    "keywords_data": 7 * 86400,
+    "dataforseo_labs": 3 * 86400,
+    "backlinks": 86400,
+    "serp": 6 * 3600,
+    **_parse_ttls(os.environ.get("DATAFORSEO_CACHE_TTLS", "")),
+}
+DEFAULT_CACHE_TTL = 3600
+CACHE_MAX_BYTES = int(float(os.environ.get("DATAFORSEO_CACHE_MAX_MB", "200")) * 1024 * 1024)
+
+# "off": no cache, "refresh": write only, "on": read and write
+cache_mode = "off" if os.environ.get("DATAFORSEO_NO_CACHE") else "on"
+cache_stats = {"hits": 0, "misses": 0, "saved_cost": 0.0}
+_cache_lock = threading.Lock()
+# Eviction scans the whole cache, so it runs every CACHE_EVICT_EVERY writes and once at exit
+CACHE_EVICT_EVERY = 500
+_cache_writes = [0]
+
+
+def _cache_path(endpoint: str, task: dict) -> str:
+    """Cache file for one live task: endpoint + canonical task body (tag excluded)"""
+    body = {k: v for k, v in task.items() if k != "tag"}
+    digest = hashlib.sha256(json.dumps([endpoint, body], sort_keys=True,
+                                       separators=(",", ":")).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, "responses", digest[:2], f"{digest}.json")
+
+
+def _cacheable(endpoint: str) -> bool:
+    """Only live results are cached; queue endpoints create or collect tasks"""
+    return cache_mode != "off" and ("/live" in endpoint)
+
+
+def cache_get(endpoint: str, task: dict, record: bool = True) -> dict:
+    """A fresh cached task response, or None; with `record`, counts the hit
+    (and its saved cost) or miss right away"""
+    if cache_mode != "on" or not _cacheable(endpoint):
+        return None
+    path = _cache_path(endpoint, task)
+    ttl = CACHE_TTLS.get(endpoint.split("/", 1)[0], DEFAULT_CACHE_TTL)
+    try:
+        with open(path) as f:
+            entry = json.load(f)
+    except (FileNotFoundError, ValueError):
+        entry = None
+    if entry and time.time() - entry["ts"] <= ttl:
+        try:
+            os.utime(path)  # mtime doubles as LRU recency
+        except OSError:
+            entry = None  # evicted by another thread since the read
+    else:
+        entry = None
+    if not entry:
+        if record:
+            record_cache([], 1)
+        return None
+    if record:
+        record_cache([entry["task"]], 0)
+    return entry["task"]
+
+
+def record_cache(served: list, missed: int):
+    """Count task responses actually served from the cache, and tasks that were sent"""
+    with _cache_lock:
+        cache_stats["hits"] += len(served)
+        cache_stats["saved_cost"] += sum(t.get("cost") or 0 for t in served)
+        cache_stats["misses"] += missed
+
+
+def cache_put(endpoint: str, task: dict, response_task: dict):
+    """Store a successful task response"""
+    if not _cacheable(endpoint) or response_task.get("status_code") != 20000:
+        return
+    path = _cache_path(endpoint, task)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"ts": time.time(), "endpoint": endpoint, "task": response_task}, f)
+    os.replace(tmp, path)
+    with _cache_lock:
+        _cache_writes[0] += 1
+        writes = _cache_writes[0]
+    if writes == 1:
+        atexit.register(cache_evict)
+    elif writes % CACHE_EVICT_EVERY == 0:
+        cache_evict()
+
+
+def cache_evict(max_bytes: int = None):
+    """Delete least recently used responses until the cache fits `max_bytes`"""
+    max_bytes = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    root = os.path.join(CACHE_DIR, "responses")
+    if not os.path.isdir(root):
+        return
+    files = []
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+    total = sum(size for _, size, _ in files)
+    if total <= max_bytes:
+        return
+    # Evict down to 90% so every write does not trigger another scan
+    for _, size, path in sorted(files):
+        if total <= max_bytes * 0.9:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+class BudgetExceeded(Exception):
+    """Raised before a request that would push spend past the --budget cap"""
+
+
+LEDGER_PATH = os.environ.get("DATAFORSEO_LEDGER", os.path.join(CACHE_DIR, "ledger.jsonl"))
+budget = float(os.environ["DATAFORSEO_BUDGET"]) if os.environ.get("DATAFORSEO_BUDGET") else None
+# endpoint -> {"requests", "tasks", "cost", "api_time", "net_time", "errors": {code: n}}
+metrics = {}
+_reserved = [0.0]  # expected cost of requests in flight
+# Conservative $ per task by endpoint family, reserved against --budget until a
+# request to that endpoint has reported its real cost
+TASK_COST_PRIORS = {
+    "serp/": 0.004,
+    "keywords_data/": 0.075,
+    "dataforseo_labs/": 0.11,
+    "backlinks/": 0.05,
+}
+DEFAULT_TASK_COST = 0.1
+_metrics_lock = threading.Lock()
+
+
+def _metrics_key(endpoint: str) -> str:
+    """Endpoint without a trailing task ID (task_get/<id>)"""
+    head = endpoint.rpartition("/")[0]
+    return head if "/task_get" in head else endpoint
+
+
+def total_cost() -> float:
+    """Dollars spent by this process"""
+    with _metrics_lock:
+        return sum(m["cost"] for m in metrics.values())
+
+
+def _task_cost_prior(endpoint: str) -> float:
+    for prefix, cost in TASK_COST_PRIORS.items():
+        if endpoint.startswith(prefix):
+            return cost
+    return DEFAULT_TASK_COST
+
+
+def _check_budget(endpoint: str, n_tasks: int) -> float:
+    """Reserve a request's expected cost (mean cost per task so far, or the
+    endpoint's price prior before any response); raises BudgetExceeded if spend
+    plus in-flight reservations would pass the budget"""
+    if budget is None or not n_tasks:
+        return 0.0
+    with _metrics_lock:
+        spent = sum(m["cost"] for m in metrics.values())
+        m = metrics.get(_metrics_key(endpoint))
+        # Failed requests record tasks at no cost, so only a nonzero history replaces the prior
+        per_task = m["cost"] / m["tasks"] if m and m["cost"] else _task_cost_prior(endpoint)
+        expected = per_task * n_tasks
+        if spent + _reserved[0] + expected > budget:
+            raise BudgetExceeded(f"budget ${budget:.2f} reached (spent ${spent:.4f}, "
+                                 f"next request ~${expected:.4f})")
+        _reserved[0] += expected
+    return expected
+
+
+def _record(endpoint: str, n_tasks: int, elapsed: float, reserved: float,
+            response: dict = None, error: str = None):
+    """Accumulate cost, API vs network time and error codes; append to the ledger"""
+    response = response or {}
+    api_time = 0.0
+    try:
+        api_time = float(str(response.get("time", "0")).split()[0])
+    except ValueError:
+        pass
+    codes = [error] if error else []
+    if response and response.get("status_code") != 20000:
+        codes.append(str(response.get("status_code")))
+    codes.extend(str(t.get("status_code")) for t in response.get("tasks") or []
+                 if t.get("status_code") not in (20000, 20100))
+    cost = response.get("cost") or 0
+    key = _metrics_key(endpoint)
+    with _metrics_lock:
+        m = metrics.setdefault(key, {"requests": 0, "tasks": 0, "cost": 0.0,
+                                     "api_time": 0.0, "net_time": 0.0, "errors": {}})
+        _reserved[0] -= reserved
+        m["requests"] += 1
+        m["tasks"] += n_tasks
+        m["cost"] += cost
+        m["api_time"] += api_time
+        m["net_time"] += max(elapsed - api_time, 0)
+        for code in codes:
+            m["errors"][code] = m["errors"].get(code, 0) + 1
+        os.makedirs(os.path.dirname(LEDGER_PATH) or ".", exist_ok=True)
+        with open(LEDGER_PATH, "a") as f:
+            f.write(json.dumps({
+                "ts": round(time.time(), 3), "endpoint": key, "tasks": n_tasks, "cost": cost,
+                "api_time": round(api_time, 4), "elapsed": round(elapsed, 4), "errors": codes,
+            }) + "\n")
+
+
+def print_stats():
+    """Print per-endpoint spend and latency to stderr"""
+    with _metrics_lock:
+        rows = sorted(metrics.items(), key=lambda kv: -kv[1]["cost"])
+    print(f"stats[{len(rows)}]{{endpoint,requests,tasks,cost,api_time,network_time,errors}}:", file=sys.stderr)
+    for endpoint, m in rows:
+        errors = " ".join(f"{code}x{n}" for code, n in m["errors"].items())
+        print(f"  {endpoint},{m['requests']},{m['tasks']},${m['cost']:.4f},"
+              f"{m['api_time']:.2f}s,{m['net_time']:.2f}s,{errors}", file=sys.stderr)
+    print(f"total_cost: ${sum(m['cost'] for _, m in rows):.4f}", file=sys.stderr)
+    if cache_stats["hits"]:
+        print(f"cached_tasks: {cache_stats['hits']} (${cache_stats['saved_cost']:.4f} saved)", file=sys.stderr)
+
+
+def add_api_args(parser):
+    """Add the shared DataForSEO options to a script's argument parser"""
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the response cache")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached responses and re-fetch")
+    parser.add_argument("--stats", action="store_true", help="Print spend and latency per endpoint")
+    parser.add_argument("--budget", type=float, help="Stop before spending more than this many dollars")
+
+
+def apply_api_args(args):
+    """Apply the shared options parsed by `add_api_args`"""
+    global cache_mode, budget
+    if args.no_cache:
+        cache_mode = "off"
+    elif args.refresh and cache_mode != "off":
+        cache_mode = "refresh"
+    if args.budget is not None:
+        budget = args.budget
+    atexit.register(print_stats if args.stats else _print_cache_summary)
+
+
+def _print_cache_summary():
+    if cache_stats["hits"]:
+        print(f"cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+              f"${cache_stats['saved_cost']:.4f} saved", file=sys.stderr)
+
+
+def _request(endpoint: str, data: list = None) -> dict:
+    """POST a task list (GET without one); raises urllib errors"""
     login, password = get_dataforseo_credentials()
     if not login or not password:
         print("error: DATAFORSEO_LOGIN and DATAFORSEO_PASSWORD not set", file=sys.stderr)
@@ -30,14 +297,39 @@ def api_post(endpoint: str, data: list) -> dict:
     
     req = urllib.request.Request(
         url,
-        data=json.dumps(data).encode(),
+        data=None if data is None else json.dumps(data).encode(),
         headers=headers,
-        method="POST"
+        method="GET" if data is None else "POST"
     )
-    
+    n_tasks = len(data) if data else 0
+    reserved = _check_budget(endpoint, n_tasks)
+    start = time.monotonic()
     try:
         with urllib.request.urlopen(req, timeout=60) as resp:
-            return json.loads(resp.read().decode())
+            response = json.loads(resp.read().decode())
+    except urllib.error.HTTPError as e:
+        _record(endpoint, n_tasks, time.monotonic() - start, reserved, error=f"HTTP {e.code}")
+        raise
+    except Exception as e:
+        _record(endpoint, n_tasks, time.monotonic() - start, reserved, error=type(e).__name__)
+        raise
+    _record(endpoint, n_tasks, time.monotonic() - start, reserved, response)
+    return response
+
+
+def api_post(endpoint: str, data: list) -> dict:
+    """Make POST request to DataForSEO API (live tasks are served from the cache when fresh)"""
+    cached = [cache_get(endpoint, task, record=False) for task in data]
+    if data and all(cached):
+        record_cache(cached, 0)
+        return {"status_code": 20000, "status_message": "Ok. (cached)", "cost": 0, "tasks": cached}
+    if cache_mode == "on" and _cacheable(endpoint):
+        record_cache([], len(data))  # a partial hit still sends every task
+    try:
+        response = _request(endpoint, data)
+        for task, response_task in zip(data, response.get("tasks") or []):
+            cache_put(endpoint, task, response_task)
+        return response
     except urllib.error.HTTPError as e:
         error_body = e.read().decode()
         print(f"error: HTTP {e.code} - {error_body}", file=sys.stderr)
@@ -72,6 +364,207 @@ def get_result(response: dict) -> list:
     return task.get("result", [])
 
 
+def task_result(task: dict) -> tuple:
+    """(result, error message) of one entry in a response's tasks[]"""
+    if task.get("status_code") != 20000:
+        return [], f"{task.get('status_code')} {task.get('status_message', 'Unknown error')}"
+    return task.get("result") or [], None
+
+
+def get_task_result(response: dict) -> tuple:
+    """(result, error) of the first task in a response"""
+    if response.get("status_code") != 20000:
+        return [], f"{response.get('status_code')} {response.get('status_message', 'Unknown error')}"
+    if not response.get("tasks"):
+        return [], "no task in response"
+    return task_result(response["tasks"][0])
+
+
+def tasks_per_request(endpoint: str) -> int:
+    """How many tasks one POST to `endpoint` may carry"""
+    if endpoint.endswith("/live") or "/live/" in endpoint:
+        return 1
+    return MAX_TASKS_PER_REQUEST
+
+
+def _post_tasks(endpoint: str, tasks: list, workers: int = 4) -> list:
+    """POST tasks packed per request; returns one (raw task, error) per input task"""
+    size = tasks_per_request(endpoint)
+    outcomes = [(None, "no task in response")] * len(tasks)
+    tagged = []
+    for i, task in enumerate(tasks):
+        cached = cache_get(endpoint, task)
+        if cached:
+            outcomes[i] = (cached, None)
+        else:
+            tagged.append(dict(task, tag=str(i)))
+    chunks = [tagged[i:i + size] for i in range(0, len(tagged), size)]
+
+    def run(chunk):
+        try:
+            response = _request(endpoint, chunk)
+        except urllib.error.HTTPError as e:
+            return chunk, None, f"HTTP {e.code} - {e.read().decode()[:200]}"
+        except BudgetExceeded as e:
+            return chunk, None, e  # kept typed so callers can stop instead of retrying
+        except Exception as e:
+            return chunk, None, str(e)
+        return chunk, response, None
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for chunk, response, error in pool.map(run, chunks):
+            if error is None and response.get("status_code") != 20000:
+                error = f"{response.get('status_code')} {response.get('status_message', 'Unknown error')}"
+            if error:
+                for task in chunk:
+                    outcomes[int(task["tag"])] = (None, error)
+                continue
+            for task in response.get("tasks") or []:
+                tag = (task.get("data") or {}).get("tag")
+                if tag is not None and tag.isdigit() and int(tag) < len(tasks):
+                    outcomes[int(tag)] = (task, None)
+                    cache_put(endpoint, tasks[int(tag)], task)
+    return outcomes
+
+
+def api_post_bulk(endpoint: str, tasks: list, workers: int = 4) -> list:
+    """Run many tasks in as few POSTs as the endpoint allows.
+
+    Tasks are packed up to the per-request limit, requests run `workers` at a
+    time, and tasks[] results are matched back by `tag`. Returns one
+    (result, error) pair per input task, in input order; a failed task or
+    request sets `error` instead of exiting. `error` is a message, or the
+    BudgetExceeded exception for tasks the --budget cap kept from being sent.
+    """
+    return [task_result(task) if task else ([], error)
+            for task, error in _post_tasks(endpoint, tasks, workers)]
+
+
+def _journal_path(base: str, tasks: list) -> str:
+    """Default journal for a task list: keyed by endpoint and task bodies"""
+    digest = hashlib.sha256(json.dumps([base, tasks], sort_keys=True).encode()).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, "jobs", f"{digest}.json")
+
+
+def _write_json(path: str, data):
+    """Write JSON atomically"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def api_queue_bulk(base: str, tasks: list, get_path: str = "task_get", journal: str = None,
+                   workers: int = 4, poll_min: float = 5, poll_max: float = 120,
+                   timeout: float = 3600) -> list:
+    """Run tasks through the Standard queue instead of `/live`.
+
+    POSTs to `{base}/task_post`, polls `{base}/tasks_ready` (backing off from
+    `poll_min` to `poll_max` seconds while nothing new finishes) and fetches
+    ready tasks concurrently from `{base}/{get_path}/{id}`. Task IDs are kept in
+    a journal file, so an interrupted run re-invoked with the same tasks
+    resumes without posting (and paying for) them again. The journal is
+    removed once every task has been fetched, and a journal whose tasks were
+    all fetched is never resumed, so a repeated job always posts fresh tasks.
+    Returns one (result, error) pair per input task, like `api_post_bulk`.
+    """
+    path = journal or _journal_path(base, tasks)
+    try:
+        with open(path) as f:
+            entries = json.load(f)["tasks"]
+    except FileNotFoundError:
+        entries = None
+    if entries and all(e.get("fetched") for e in entries):
+        print(f"note: journal {path} is from a finished run; posting fresh tasks", file=sys.stderr)
+        entries = None
+    if entries is None:
+        entries = [{"id": None, "ready": False} for _ in tasks]
+    if len(entries) != len(tasks):
+        raise ValueError(f"journal {path} holds {len(entries)} tasks, not {len(tasks)}")
+
+    def save():
+        _write_json(path, {"base": base, "tasks": entries})
+
+    outcomes = [([], "not ready before timeout")] * len(tasks)
+    unposted = [i for i, e in enumerate(entries) if not e["id"]]
+    if unposted:
+        posted = _post_tasks(f"{base}/task_post", [tasks[i] for i in unposted], workers)
+        for i, (task, error) in zip(unposted, posted):
+            if task and task.get("status_code") == 20100:
+                entries[i]["id"] = task["id"]
+            else:
+                outcomes[i] = ([], error or f"{task.get('status_code')} {task.get('status_message')}")
+        save()
+    by_id = {e["id"]: i for i, e in enumerate(entries) if e["id"]}
+    print(f"queue: {len(by_id)} tasks ({len(unposted)} posted now), journal {path}", file=sys.stderr)
+
+    def fetch(i):
+        try:
+            response = _request(f"{base}/{get_path}/{entries[i]['id']}")
+        except Exception as e:
+            return i, ([], str(e))
+        return i, get_task_result(response)
+
+    waiting = {i for i in by_id.values() if not entries[i]["ready"]}
+    deadline = time.monotonic() + timeout
+    interval = poll_min
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(fetch, i) for i in by_id.values() if entries[i]["ready"]]
+        while waiting and time.monotonic() < deadline:
+            try:
+                ready, error = get_task_result(_request(f"{base}/tasks_ready"))
+            except Exception as e:
+                ready, error = [], str(e)
+            if error:
+                print(f"warning: tasks_ready: {error}", file=sys.stderr)
+            newly = [by_id[r["id"]] for r in ready if r.get("id") in by_id and by_id[r["id"]] in waiting]
+            for i in newly:
+                waiting.discard(i)
+                entries[i]["ready"] = True
+                futures.append(pool.submit(fetch, i))
+            if newly:
+                save()
+                interval = poll_min
+            else:
+                interval = min(interval * 2, poll_max)
+            if waiting:
+                print(f"  {len(by_id) - len(waiting)}/{len(by_id)} ready", file=sys.stderr)
+                time.sleep(min(interval, max(0, deadline - time.monotonic())))
+        for future in futures:
+            i, outcome = future.result()
+            outcomes[i] = outcome
+            entries[i]["fetched"] = outcome[1] is None
+    if all(e.get("fetched") for e in entries):
+        # Finished: a later run of the same tasks must post them again, not re-read these results
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    else:
+        # Keep unposted, queued and failed fetches so a rerun retries them without paying twice
+        save()
+        if waiting:
+            print(f"note: {len(waiting)} tasks still queued; rerun to resume from {path}", file=sys.stderr)
+        unfetched = sum(1 for e in entries if not e.get("fetched")) - len(waiting)
+        if unfetched:
+            print(f"note: {unfetched} tasks failed; rerun to retry from {path}", file=sys.stderr)
+    return outcomes
+
+
+def read_lines(values: list = None, source: str = None) -> list:
+    """Collect keywords/domains from args and a file ('-' for stdin), one per line, deduped"""
+    raw = list(values or [])
+    if source:
+        f = sys.stdin if source == "-" else open(source)
+        try:
+            raw.extend(line for line in f.read().splitlines() if not line.startswith("#"))
+        finally:
+            if f is not sys.stdin:
+                f.close()
+    return list(dict.fromkeys(v.strip() for v in raw if v.strip()))
+
+
 def print_keywords_list(keywords: list):
     """Print list of keywords"""
     print(f"keywords[{len(keywords)}]{{keyword,volume,difficulty}}:")
@@ -4,20 +4,23 @@ Domain overview using DataForSEO API
 Usage: python3 scripts/domain_overview.py "example.com"
 """
 import argparse
-from dataforseo_api import api_post, get_result, format_count
+from dataforseo_api import api_post, get_result, format_count, add_api_args, apply_api_args
+from locations import add_location_args, apply_location_args
 
 
 def main():
     parser = argparse.ArgumentParser(description="Domain overview")
     parser.add_argument("domain", help="Target domain")
-    parser.add_argument("--location", "-loc", type=int, default=2840,
-                        help="Location code (default: 2840 = US)")
+    add_location_args(parser)
+    add_api_args(parser)
     args = parser.parse_args()
+    apply_api_args(args)
+    apply_location_args(parser, args)
 
     data = [{
         "target": args.domain,
         "location_code": args.location,
-        "language_code": "en",
+        "language_code": args.language,
         "limit": 1  # We only need overview metrics
     }]
     
@@ -25,7 +28,7 @@ def main():
     results = get_result(response)
     
     print(f"domain: {args.domain}")
-    print(f"location: {args.location}")
+    print(f"location: {args.location_name}")
     
     if results:
         for result in results:
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Multi-competitor keyword gap analysis using DataForSEO ranked keywords
+Fetches every domain's ranked keywords (paginated, concurrently) and runs set
+algebra over a keyword x domain membership matrix.
+
+Usage: python3 scripts/keyword_gap.py opc.dev competitor1.com competitor2.com competitor3.com
+       python3 scripts/keyword_gap.py opc.dev comp1.com comp2.com --set gap --min-competitors 2
+       python3 scripts/keyword_gap.py opc.dev comp1.com comp2.com --set intersection --sort volume
+"""
+import argparse
+import sys
+from dataforseo_api import api_post_bulk, format_count, add_api_args, apply_api_args
+from locations import add_location_args, apply_location_args
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy required. Install with: pip install numpy")
+    sys.exit(1)
+
+ENDPOINT = "dataforseo_labs/google/ranked_keywords/live"
+PAGE_SIZE = 1000  # API maximum per task
+
+
+def ranked_task(domain: str, location: int, language: str, offset: int = 0) -> dict:
+    return {
+        "target": domain,
+        "location_code": location,
+        "language_code": language,
+        "limit": PAGE_SIZE,
+        "offset": offset,
+        "order_by": ["keyword_data.keyword_info.search_volume,desc"],
+    }
+
+
+def fetch_ranked(domains: list, location: int, language: str, max_keywords: int, workers: int) -> list:
+    """Ranked keyword items per domain: first pages together, then every remaining offset together"""
+    items = [[] for _ in domains]
+    totals = [0] * len(domains)
+    first_pages = [ranked_task(d, location, language) for d in domains]
+    for i, (results, error) in enumerate(api_post_bulk(ENDPOINT, first_pages, workers)):
+        if error:
+            print(f"error: {domains[i]}: {error}", file=sys.stderr)
+        for result in results or []:
+            totals[i] = result.get("total_count") or 0
+            items[i].extend(result.get("items") or [])
+
+    pages = [(i, offset) for i in range(len(domains))
+             for offset in range(PAGE_SIZE, min(totals[i], max_keywords), PAGE_SIZE)]
+    if pages:
+        print(f"fetching {len(pages)} more pages", file=sys.stderr)
+        tasks = [ranked_task(domains[i], location, language, offset) for i, offset in pages]
+        for (i, offset), (results, error) in zip(pages, api_post_bulk(ENDPOINT, tasks, workers)):
+            if error:
+                print(f"error: {domains[i]} offset {offset}: {error}", file=sys.stderr)
+            for result in results or []:
+                items[i].extend(result.get("items") or [])
+    return [domain_items[:max_keywords] for domain_items in items]
+
+
+def build_matrix(items: list) -> tuple:
+    """(keywords, volume, difficulty, positions): positions[k, d] is domain d's rank (0 = not ranked)"""
+    index, keywords, volume, difficulty = {}, [], [], []
+    rows, cols, ranks = [], [], []
+    for d, domain_items in enumerate(items):
+        for item in domain_items:
+            kw_data = item.get("keyword_data") or {}
+            keyword = kw_data.get("keyword")
+            if not keyword:
+                continue
+            k = index.get(keyword)
+            if k is None:
+                k = index[keyword] = len(keywords)
+                keywords.append(keyword)
+                volume.append((kw_data.get("keyword_info") or {}).get("search_volume") or 0)
+                difficulty.append((kw_data.get("keyword_properties") or {}).get("keyword_difficulty") or 0)
+            serp_item = (item.get("ranked_serp_element") or {}).get("serp_item") or {}
+            rows.append(k)
+            cols.append(d)
+            ranks.append(serp_item.get("rank_absolute") or serp_item.get("rank_group") or 1)
+
+    # Keep the best position when a domain ranks several URLs for one keyword: minimum.at is
+    # unbuffered, so repeated (keyword, domain) pairs all take part; unranked cells go back to 0
+    unranked = np.iinfo(np.int32).max
+    positions = np.full((len(keywords), len(items)), unranked, dtype=np.int32)
+    if rows:
+        np.minimum.at(positions, (np.array(rows), np.array(cols)), np.array(ranks, dtype=np.int32))
+    positions[positions == unranked] = 0
+    return keywords, np.array(volume, dtype=np.int64), np.array(difficulty, dtype=np.float64), positions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-competitor keyword gap analysis")
+    parser.add_argument("my_domain", help="Your domain (without https://)")
+    parser.add_argument("competitors", nargs="+", help="Competitor domains")
+    add_location_args(parser)
+    parser.add_argument("--set", "-s", choices=["gap", "intersection", "union", "shared"], default="gap",
+                        help="gap: ranked by >=k competitors but not you; intersection: every competitor; "
+                             "union: anyone; shared: you and >=k competitors (default: gap)")
+    parser.add_argument("--min-competitors", "-k", type=int,
+                        help="k for gap/shared (default: 2, or 1 with a single competitor)")
+    parser.add_argument("--sort", choices=["score", "volume", "difficulty", "competitors"], default="score",
+                        help="score = volume discounted by difficulty (default: score)")
+    parser.add_argument("--max-keywords", type=int, default=5000,
+                        help="Ranked keywords fetched per domain (default: 5000)")
+    parser.add_argument("--limit", "-l", type=int, default=50, help="Max results (default: 50)")
+    parser.add_argument("--workers", "-w", type=int, default=4, help="Concurrent requests")
+    add_api_args(parser)
+    args = parser.parse_args()
+    apply_api_args(args)
+    apply_location_args(parser, args)
+
+    domains = [args.my_domain] + list(dict.fromkeys(c for c in args.competitors if c != args.my_domain))
+    k = args.min_competitors or min(2, len(domains) - 1)
+
+    items = fetch_ranked(domains, args.location, args.language, args.max_keywords, args.workers)
+    keywords, volume, difficulty, positions = build_matrix(items)
+
+    ranked = positions > 0
+    ours = ranked[:, 0]
+    theirs = ranked[:, 1:]
+    n_theirs = theirs.sum(axis=1)
+    sets = {
+        "gap": ~ours & (n_theirs >= k),
+        "intersection": theirs.all(axis=1),
+        "union": ranked.any(axis=1),
+        "shared": ours & (n_theirs >= k),
+    }
+    selected = np.flatnonzero(sets[args.set])
+
+    score = volume * (1 - np.clip(difficulty, 0, 100) / 100)
+    key = {
+        "score": -score,
+        "volume": -volume,
+        "difficulty": difficulty,
+        "competitors": -n_theirs,
+    }[args.sort][selected]
+    selected = selected[np.lexsort((-volume[selected], key))][:args.limit]
+
+    print(f"my_domain: {args.my_domain}")
+    print(f"competitors: {', '.join(domains[1:])}")
+    print(f"location: {args.location_name}")
+    print(f"ranked_keywords: {', '.join(f'{d}={len(i)}' for d, i in zip(domains, items))}")
+    print(f"union: {int(sets['union'].sum())}")
+    print(f"intersection: {int(sets['intersection'].sum())}")
+    print(f"gap(k={k}): {int(sets['gap'].sum())}")
+    print(f"shared(k={k}): {int(sets['shared'].sum())}")
+    print(f"---")
+    print(f"{args.set}[{len(selected)}]{{keyword,volume,difficulty,score,competitors,my_position,positions}}:")
+    for i in selected:
+        comp = " ".join(f"{domains[d + 1]}:{p}" for d, p in enumerate(positions[i, 1:]) if p)
+        mine = positions[i, 0] or "-"
+        print(f"  {keywords[i]},{format_count(volume[i])},{difficulty[i]:.0f},{format_count(score[i])},"
+              f"{n_theirs[i]},{mine},{comp}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,36 +2,68 @@
 """
 Keyword research using DataForSEO API
 Usage: python3 scripts/keyword_research.py "seo tools" --limit 20
+       python3 scripts/keyword_research.py "seo tools" "rank tracker" --file seeds.txt
+       python3 scripts/keyword_research.py --file seeds.txt --pack 20     # One merged list per 20 seeds
 """
 import argparse
-from dataforseo_api import api_post, get_result, print_keywords_list
+import sys
+from dataforseo_api import (api_post_bulk, api_queue_bulk, read_lines, print_keywords_list,
+                            add_api_args, apply_api_args)
+from locations import add_location_args, apply_location_args
+
+MAX_SEEDS_PER_TASK = 20  # keywords_for_keywords limit
 
 
 def main():
     parser = argparse.ArgumentParser(description="Keyword research")
-    parser.add_argument("keyword", help="Seed keyword")
-    parser.add_argument("--location", "-loc", type=int, default=2840,
-                        help="Location code (default: 2840 = US)")
+    parser.add_argument("keywords", nargs="*", help="Seed keywords")
+    parser.add_argument("--file", "-f", help="File with one seed keyword per line ('-' for stdin)")
+    add_location_args(parser, multiple=True)
     parser.add_argument("--limit", "-l", type=int, default=20, help="Max results")
+    parser.add_argument("--pack", "-p", type=int, default=1,
+                        help=f"Seeds per task (1-{MAX_SEEDS_PER_TASK}, default: 1); a task returns one "
+                             "combined idea list, so packing trades per-seed ideas for fewer tasks")
+    parser.add_argument("--workers", "-w", type=int, default=4, help="Concurrent requests")
+    parser.add_argument("--queue", "-q", action="store_true",
+                        help="Use the cheaper Standard queue (task_post/task_get) instead of live")
+    add_api_args(parser)
     args = parser.parse_args()
+    apply_api_args(args)
+    apply_location_args(parser, args)
+
+    keywords = read_lines(args.keywords, args.file)
+    if not keywords:
+        parser.error("no keywords given")
+    if not 1 <= args.pack <= MAX_SEEDS_PER_TASK:
+        parser.error(f"--pack must be between 1 and {MAX_SEEDS_PER_TASK}")
 
+    # One task per seed (or group of --pack seeds) and location
+    groups = [keywords[i:i + args.pack] for i in range(0, len(keywords), args.pack)]
+    queries = [(group, code, name) for code, name in args.locations for group in groups]
     data = [{
-        "keywords": [args.keyword],  # API requires 'keywords' array (up to 20)
-        "location_code": args.location,
-        "language_code": "en",
+        "keywords": group,
+        "location_code": code,
+        "language_code": args.language,
         "limit": args.limit
-    }]
-    
-    response = api_post("keywords_data/google_ads/keywords_for_keywords/live", data)
-    results = get_result(response)
+    } for group, code, _ in queries]
     
-    print(f"keyword: {args.keyword}")
-    print(f"location: {args.location}")
-    
-    if results:
-        print_keywords_list(results[:args.limit])
+    if args.queue:
+        outcomes = api_queue_bulk("keywords_data/google_ads/keywords_for_keywords", data, workers=args.workers)
     else:
-        print("No results found")
+        outcomes = api_post_bulk("keywords_data/google_ads/keywords_for_keywords/live", data, args.workers)
+
+    for i, ((group, _, name), (results, error)) in enumerate(zip(queries, outcomes)):
+        seeds = ", ".join(group)
+        if i:
+            print(f"===")
+        print(f"keyword: {seeds}" if len(group) == 1 else f"keywords: {seeds}")
+        print(f"location: {name}")
+        if error:
+            print(f"error: {seeds} ({name}): {error}", file=sys.stderr)
+        if results:
+            print_keywords_list(results[:args.limit])
+        else:
+            print("No results found")
 
 
 if __name__ == "__main__":
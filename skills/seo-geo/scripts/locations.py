@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Local index of DataForSEO location and language codes.
+
+Fetched once from serp/google/locations and serp/google/languages into
+CACHE_DIR/locations.tsv.gz and resolved offline: names are kept sorted
+(lowercased) so lookups bisect to the matching prefix range.
+"""
+import bisect
+import gzip
+import os
+import sys
+import urllib.error
+from dataforseo_api import CACHE_DIR, _request, get_task_result
+
+INDEX_PATH = os.path.join(CACHE_DIR, "locations.tsv.gz")
+DEFAULT_LOCATION = 2840  # United States
+DEFAULT_LANGUAGE = "en"
+
+
+def _key(name: str) -> str:
+    """Lookup key: lowercased, no spaces around commas ("Berlin, Germany" -> "berlin,germany")"""
+    return ",".join(" ".join(part.split()) for part in name.lower().split(","))
+
+
+class LocationIndex:
+    """Sorted location names (code, name, type, country) and languages (code, name)"""
+
+    def __init__(self, locations: list, languages: list):
+        self.locations = sorted(locations, key=lambda row: _key(row[1]))
+        self.keys = [_key(row[1]) for row in self.locations]
+        self.languages = languages
+        self.language_keys = {}
+        for code, name in languages:
+            self.language_keys[code.lower()] = code
+            self.language_keys[name.lower()] = code
+
+    @classmethod
+    def read(cls, path: str = INDEX_PATH) -> "LocationIndex":
+        locations, languages = [], []
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                kind, *fields = line.rstrip("\n").split("\t")
+                if kind == "L":
+                    code, name, location_type, country = fields
+                    locations.append((int(code), name, location_type, country))
+                elif kind == "G":
+                    languages.append(tuple(fields))
+        return cls(locations, languages)
+
+    def write(self, path: str = INDEX_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            for code, name, location_type, country in self.locations:
+                f.write(f"L\t{code}\t{name}\t{location_type}\t{country}\n")
+            for code, name in self.languages:
+                f.write(f"G\t{code}\t{name}\n")
+        os.replace(tmp, path)
+
+    def prefix(self, text: str) -> list:
+        """Locations whose name starts with `text`, in name order"""
+        key = _key(text)
+        start = bisect.bisect_left(self.keys, key)
+        end = bisect.bisect_left(self.keys, key + "\uffff", start)
+        return self.locations[start:end]
+
+    def find(self, query: str) -> tuple:
+        """(code, name) for "Germany", "Berlin,Germany" or a full "Berlin,Berlin,Germany".
+
+        Query parts must match the first name component and then appear in order
+        among the rest; the shortest name wins. Raises LookupError when nothing
+        or several equally specific locations match.
+        """
+        key = _key(query)
+        i = bisect.bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            return self.locations[i][:2]
+        head, *rest = key.split(",")
+        matches = []
+        for row in self.prefix(head + ","):
+            parts = _key(row[1]).split(",")[1:]
+            it = iter(parts)
+            if all(part in it for part in rest):
+                matches.append((len(parts), row))
+        if not matches:
+            close = ", ".join(row[1] for row in self.prefix(head[:4])[:5])
+            raise LookupError(f"unknown location '{query}'" + (f" (did you mean: {close})" if close else ""))
+        matches.sort(key=lambda m: m[0])
+        best = [row for n, row in matches if n == matches[0][0]]
+        if len(best) > 1:
+            names = "; ".join(row[1] for row in best[:5])
+            raise LookupError(f"ambiguous location '{query}': {names}" + (" ..." if len(best) > 5 else ""))
+        return best[0][:2]
+
+    def language(self, query: str) -> str:
+        """Language code for a code ("de") or name ("German")"""
+        code = self.language_keys.get(query.strip().lower())
+        if code is None:
+            raise LookupError(f"unknown language '{query}'")
+        return code
+
+
+def _fetch(endpoint: str) -> list:
+    try:
+        response = _request(endpoint)
+    except urllib.error.HTTPError as e:
+        print(f"error: HTTP {e.code} - {e.read().decode()[:200]}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"error: {e}", file=sys.stderr)
+        sys.exit(1)
+    result, error = get_task_result(response)
+    if error:
+        print(f"error: {endpoint}: {error}", file=sys.stderr)
+        sys.exit(1)
+    return result
+
+
+def update(path: str = INDEX_PATH) -> LocationIndex:
+    """Download every location and language (two GET requests) and rewrite the index"""
+    locations = [(row["location_code"], row["location_name"], row.get("location_type") or "",
+                  row.get("country_iso_code") or "")
+                 for row in _fetch("serp/google/locations") if row.get("location_code")]
+    languages = [(row["language_code"], row["language_name"])
+                 for row in _fetch("serp/google/languages") if row.get("language_code")]
+    index = LocationIndex(locations, languages)
+    index.write(path)
+    return index
+
+
+_index = None
+
+
+def load_index() -> LocationIndex:
+    """The cached index, downloading it on first use"""
+    global _index
+    if _index is None:
+        if os.path.exists(INDEX_PATH):
+            _index = LocationIndex.read(INDEX_PATH)
+        else:
+            print(f"note: downloading the location index to {INDEX_PATH}", file=sys.stderr)
+            _index = update(INDEX_PATH)
+    return _index
+
+
+def resolve_location(value) -> tuple:
+    """(code, label) for a location code or name; codes never touch the index"""
+    text = str(value).strip()
+    if text.isdigit():
+        return int(text), text
+    return load_index().find(text)
+
+
+def resolve_language(value: str) -> str:
+    """Language code for a code or name; short codes are used as given while no index is cached"""
+    text = value.strip()
+    if _index is None and not os.path.exists(INDEX_PATH) and len(text) <= 3:
+        return text.lower()
+    return load_index().language(text)
+
+
+def add_location_args(parser, multiple: bool = False):
+    """Add --location (code or name; repeatable when `multiple`) and --language"""
+    if multiple:
+        parser.add_argument("--location", "-loc", action="append",
+                            help='Location code or name, e.g. 2840, "Germany", "Berlin,Germany"; '
+                                 'repeat for one task per location (default: 2840 = US)')
+    else:
+        parser.add_argument("--location", "-loc", default=str(DEFAULT_LOCATION),
+                            help='Location code or name, e.g. 2840, "Germany", "Berlin,Germany" '
+                                 '(default: 2840 = US)')
+    parser.add_argument("--language", "-lang", default=DEFAULT_LANGUAGE,
+                        help=f"Language code or name (default: {DEFAULT_LANGUAGE})")
+
+
+def apply_location_args(parser, args):
+    """Resolve the options added by `add_location_args`, once, before any task is built.
+
+    Sets args.location / args.location_name (the first location), args.locations
+    ([(code, label)]) and args.language (code).
+    """
+    values = args.location if isinstance(args.location, list) else [args.location or DEFAULT_LOCATION]
+    try:
+        resolved = {}
+        for value in values:
+            code, label = resolve_location(value)
+            resolved.setdefault(code, (code, label))
+        args.locations = list(resolved.values())
+        args.language = resolve_language(args.language)
+    except LookupError as e:
+        parser.error(str(e))
+    args.location, args.location_name = args.locations[0]
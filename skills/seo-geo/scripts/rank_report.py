@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Movers, volatility and visibility from the rank tracking store
+Usage: python3 scripts/rank_report.py
+       python3 scripts/rank_report.py --days 30 --domain opc.dev --trend
+"""
+import argparse
+import sys
+import time
+import warnings
+from rank_store import DEFAULT_STORE, NOT_TRACKED, load_index, load_history
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy required. Install with: pip install numpy")
+    sys.exit(1)
+
+# Approximate organic CTR by position; positions 11-20 share the page-two rate
+CTR = [0.28, 0.15, 0.11, 0.08, 0.07, 0.05, 0.04, 0.03, 0.03, 0.02] + [0.01] * 10
+
+
+def format_time(ts: float) -> str:
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(ts))
+
+
+def last_tracked(tracked: np.ndarray) -> np.ndarray:
+    """Index of the last run tracking each (query, domain), -1 if none"""
+    runs = len(tracked)
+    last = runs - 1 - np.argmax(tracked[::-1], axis=0)
+    return np.where(tracked.any(axis=0), last, -1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report on tracked rankings")
+    parser.add_argument("--store", "-s", default=DEFAULT_STORE, help=f"Store directory (default: {DEFAULT_STORE})")
+    parser.add_argument("--days", type=float, help="Only use runs from the last N days")
+    parser.add_argument("--domain", "-d", action="append", help="Only report these domains (repeatable)")
+    parser.add_argument("--location", "-loc", type=int, action="append", help="Only these location codes")
+    parser.add_argument("--depth", type=int, default=100,
+                        help="Depth used when tracking; not ranked counts as depth+1 (default: 100)")
+    parser.add_argument("--trend", action="store_true", help="Print visibility for every run")
+    parser.add_argument("--limit", "-l", type=int, default=30, help="Max movers (default: 30)")
+    args = parser.parse_args()
+
+    index = load_index(args.store)
+    ts, history = load_history(args.store)
+    if args.days is not None:
+        keep = ts >= time.time() - args.days * 86400
+        ts, history = ts[keep], history[keep]
+    if len(ts) == 0:
+        print(f"No runs in {args.store}")
+        return
+
+    queries = index["queries"]
+    domains = index["domains"]
+    q_sel = np.arange(len(queries))
+    d_sel = np.arange(len(domains))
+    if args.location:
+        q_sel = np.array([i for i, (_, loc) in enumerate(queries) if loc in args.location], dtype=np.int64)
+    if args.domain:
+        wanted = {d.lower().removeprefix("www.") for d in args.domain}
+        d_sel = np.array([i for i, d in enumerate(domains) if d in wanted], dtype=np.int64)
+    history = history[:, q_sel][:, :, d_sel]
+
+    tracked = history != NOT_TRACKED
+    not_ranked = args.depth + 1
+    # Positions as floats: not ranked -> depth+1, not tracked -> NaN
+    pos = np.where(history > 0, history, not_ranked).astype(np.float64)
+    pos[~tracked] = np.nan
+
+    # Latest, previous and first tracked position per (query, domain)
+    last = last_tracked(tracked)
+    earlier = tracked.copy()
+    q_idx, d_idx = np.nonzero(last >= 0)
+    earlier[last[q_idx, d_idx], q_idx, d_idx] = False
+    previous = last_tracked(earlier)
+    first = np.where(tracked.any(axis=0), np.argmax(tracked, axis=0), -1)
+
+    def take(run_idx):
+        values = np.take_along_axis(pos, np.maximum(run_idx, 0)[None], axis=0)[0]
+        return np.where(run_idx >= 0, values, np.nan)
+
+    current, prior, initial = take(last), take(previous), take(first)
+    change = prior - current  # positive = moved up
+    since_first = initial - current
+    # Volatility: std of run-to-run moves between consecutive tracked runs
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # pairs with no consecutive tracked runs -> NaN
+        volatility = np.nanstd(np.diff(pos, axis=0), axis=0) if len(ts) > 1 else np.full(current.shape, np.nan)
+
+    # Visibility: expected CTR averaged over the tracked queries of each run
+    ctr = np.zeros(max(not_ranked, len(CTR)) + 1)
+    ctr[1:len(CTR) + 1] = CTR
+    weights = ctr[np.where(history > 0, history, 0).clip(0, len(ctr) - 1)]
+    weights[~tracked] = 0
+    n_tracked = tracked.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        visibility = np.where(n_tracked > 0, weights.sum(axis=1) / n_tracked * 100, np.nan)
+
+    print(f"store: {args.store}")
+    print(f"runs: {len(ts)} ({format_time(ts[0])} .. {format_time(ts[-1])})")
+    print(f"queries: {len(q_sel)}")
+    print(f"---")
+    print(f"domains[{len(d_sel)}]{{domain,ranked,top3,top10,avg_position,visibility,visibility_change}}:")
+    for j, d in enumerate(d_sel):
+        col = current[:, j]
+        ranked = col[col < not_ranked]
+        avg = f"{ranked.mean():.1f}" if len(ranked) else "-"
+        vis = visibility[:, j]
+        seen = vis[~np.isnan(vis)]
+        delta = f"{seen[-1] - seen[-2]:+.2f}" if len(seen) > 1 else "-"
+        latest = f"{seen[-1]:.2f}" if len(seen) else "-"
+        print(f"  {domains[d]},{len(ranked)},{int((ranked <= 3).sum())},{int((ranked <= 10).sum())},"
+              f"{avg},{latest},{delta}")
+
+    if args.trend:
+        print(f"---")
+        print(f"visibility[{len(ts)}]{{time,{','.join(domains[d] for d in d_sel)}}}:")
+        for r in range(len(ts)):
+            cells = ",".join("-" if np.isnan(v) else f"{v:.2f}" for v in visibility[r])
+            print(f"  {format_time(ts[r])},{cells}")
+
+    moved = np.nan_to_num(np.abs(change), nan=0.0)
+    q_idx, d_idx = np.nonzero(moved > 0)
+    order = np.lexsort((-np.nan_to_num(volatility[q_idx, d_idx]), -moved[q_idx, d_idx]))[:args.limit]
+
+    def fmt(p):
+        return "-" if np.isnan(p) else ("nr" if p >= not_ranked else f"{p:.0f}")
+
+    print(f"---")
+    print(f"movers[{len(order)}]{{keyword,location,domain,position,previous,change,since_first,volatility}}:")
+    for i in order:
+        q, j = q_idx[i], d_idx[i]
+        keyword, location = queries[q_sel[q]]
+        vol = volatility[q, j]
+        print(f"  {keyword},{location},{domains[d_sel[j]]},{fmt(current[q, j])},{fmt(prior[q, j])},"
+              f"{change[q, j]:+.0f},{since_first[q, j]:+.0f},{'-' if np.isnan(vol) else f'{vol:.1f}'}")
+
+
+if __name__ == "__main__":
+    main()
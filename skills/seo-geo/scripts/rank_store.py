@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Time-indexed store of tracked SERP positions.
+
+Layout of a store directory:
+  index.json        {"queries": [[keyword, location], ...], "domains": [...]}
+  run-<ts>.npz      one file per tracking run: ts, query ids, domain ids and an
+                    int16 position matrix (query x domain, 0 = not in the checked depth)
+"""
+import json
+import os
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy required. Install with: pip install numpy")
+    sys.exit(1)
+
+DEFAULT_STORE = "./seo-ranks"
+NOT_TRACKED = -1  # query/domain absent from a run
+
+
+def load_index(store: str) -> dict:
+    """Load the query/domain dictionaries"""
+    try:
+        with open(os.path.join(store, "index.json")) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"queries": [], "domains": []}
+
+
+def intern(store: str, queries: list, domains: list) -> tuple:
+    """Stable integer IDs for (keyword, location) queries and domains, appending unseen ones"""
+    index = load_index(store)
+    query_ids = {(k, loc): i for i, (k, loc) in enumerate(index["queries"])}
+    domain_ids = {d: i for i, d in enumerate(index["domains"])}
+    for q in queries:
+        if q not in query_ids:
+            query_ids[q] = len(index["queries"])
+            index["queries"].append(list(q))
+    for d in domains:
+        if d not in domain_ids:
+            domain_ids[d] = len(index["domains"])
+            index["domains"].append(d)
+    os.makedirs(store, exist_ok=True)
+    tmp = os.path.join(store, "index.json.tmp")
+    with open(tmp, "w") as f:
+        json.dump(index, f)
+    os.replace(tmp, os.path.join(store, "index.json"))
+    return [query_ids[q] for q in queries], [domain_ids[d] for d in domains]
+
+
+def save_run(store: str, query_ids: list, domain_ids: list, positions, ts: float = None) -> str:
+    """Write one run's position matrix and return its path"""
+    ts = time.time() if ts is None else ts
+    path = os.path.join(store, f"run-{int(ts * 1e9)}.npz")
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        np.savez(f, ts=np.float64(ts), query=np.asarray(query_ids, dtype=np.int32),
+                 domain=np.asarray(domain_ids, dtype=np.int32),
+                 position=np.asarray(positions, dtype=np.int16))
+    os.replace(tmp, path)
+    return path
+
+
+def load_history(store: str) -> tuple:
+    """(ts[R], positions[R, Q, D]) over every run, NOT_TRACKED where a run lacked a query/domain"""
+    index = load_index(store)
+    runs = []
+    if os.path.isdir(store):
+        for fname in sorted(os.listdir(store)):
+            if fname.startswith("run-") and fname.endswith(".npz"):
+                with np.load(os.path.join(store, fname)) as run:
+                    runs.append({k: run[k] for k in ("ts", "query", "domain", "position")})
+    history = np.full((len(runs), len(index["queries"]), len(index["domains"])), NOT_TRACKED, dtype=np.int16)
+    for r, run in enumerate(runs):
+        history[r][np.ix_(run["query"], run["domain"])] = run["position"]
+    return np.array([run["ts"] for run in runs], dtype=np.float64), history
@@ -4,74 +4,153 @@ Related keywords from Google "searches related to" using DataForSEO API
 Get up to 4,680 keyword ideas from Google's related searches
 
 Usage: python3 scripts/related_keywords.py "AI agent" --depth 2 --limit 50
+       python3 scripts/related_keywords.py "AI agent" --depth 3 --output related.ndjson
 """
 import argparse
-from dataforseo_api import api_post, get_result, format_count
+import csv
+import heapq
+import json
+import sys
+from dataforseo_api import api_post_bulk, format_count, add_api_args, apply_api_args
+from locations import add_location_args, apply_location_args
+
+ENDPOINT = "dataforseo_labs/google/related_keywords/live"
+PAGE_SIZE = 1000  # API maximum per task
+OUTPUT_COLUMNS = ["keyword", "volume", "difficulty", "depth"]
+
+
+def item_row(item: dict) -> dict:
+    """Flatten one related_keywords item"""
+    kw_data = item.get("keyword_data", {})
+    info = kw_data.get("keyword_info") or {}
+    props = kw_data.get("keyword_properties") or {}
+    volume = kw_data.get("search_volume", info.get("search_volume", item.get("search_volume", 0)))
+    difficulty = kw_data.get("keyword_difficulty",
+                             props.get("keyword_difficulty", item.get("keyword_difficulty", "N/A")))
+    return {
+        "keyword": kw_data.get("keyword", item.get("keyword", "")),
+        "volume": volume if volume is not None else 0,
+        "difficulty": difficulty,
+        "depth": item.get("depth"),
+    }
+
+
+def iter_pages(task: dict, max_items: int, workers: int):
+    """Yield result pages one at a time: offset_token when the API returns one, otherwise
+    concurrent offsets, `workers` pages per round so only a round is held in memory"""
+    results, error = api_post_bulk(ENDPOINT, [dict(task, limit=PAGE_SIZE)])[0]
+    if error:
+        print(f"error: {error}", file=sys.stderr)
+    if not results:
+        return
+    first = results[0]
+    yield first
+    total = min(first.get("total_count") or 0, max_items)
+    fetched = first.get("items_count") or len(first.get("items") or [])
+
+    token = first.get("offset_token")
+    while token and fetched < total:
+        results, error = api_post_bulk(ENDPOINT, [dict(task, limit=PAGE_SIZE, offset_token=token)])[0]
+        if error or not results or not results[0].get("items"):
+            if error:
+                print(f"error: {error}", file=sys.stderr)
+            return
+        yield results[0]
+        fetched += len(results[0]["items"])
+        token = results[0].get("offset_token")
+    if token:
+        return
+
+    offsets = list(range(fetched, total, PAGE_SIZE))
+    for start in range(0, len(offsets), max(1, workers)):
+        batch = offsets[start:start + max(1, workers)]
+        tasks = [dict(task, limit=PAGE_SIZE, offset=offset) for offset in batch]
+        for offset, (results, error) in zip(batch, api_post_bulk(ENDPOINT, tasks, workers)):
+            if error:
+                print(f"error: offset {offset}: {error}", file=sys.stderr)
+            for result in results or []:
+                yield result
 
 
 def main():
     parser = argparse.ArgumentParser(description="Related keywords from Google")
     parser.add_argument("keyword", help="Seed keyword")
-    parser.add_argument("--location", "-loc", type=int, default=2840,
-                        help="Location code (default: 2840 = US)")
+    add_location_args(parser)
     parser.add_argument("--depth", "-d", type=int, default=1,
                         help="Search depth 1-3 (default: 1, max keywords: depth^3 * 10)")
     parser.add_argument("--limit", "-l", type=int, default=50, 
                         help="Max results to display (default: 50)")
+    parser.add_argument("--max-items", type=int, default=10000,
+                        help="Max keywords fetched across pages (default: 10000)")
+    parser.add_argument("--output", "-o", help="Write every keyword to this file (.csv, otherwise NDJSON)")
+    parser.add_argument("--workers", "-w", type=int, default=4, help="Concurrent page requests")
+    add_api_args(parser)
     args = parser.parse_args()
+    if args.limit < 1:
+        parser.error("--limit must be at least 1")
+    apply_api_args(args)
+    apply_location_args(parser, args)
 
     # Validate depth
     if args.depth < 1 or args.depth > 3:
         print("Error: depth must be between 1 and 3")
         return
 
-    data = [{
+    task = {
         "keyword": args.keyword,
         "location_code": args.location,
-        "language_code": "en",
+        "language_code": args.language,
         "depth": args.depth,
-        "limit": 1000  # API limit, we'll filter in display
-    }]
-    
-    response = api_post("dataforseo_labs/google/related_keywords/live", data)
-    results = get_result(response)
+    }
     
     print(f"keyword: {args.keyword}")
-    print(f"location: {args.location}")
+    print(f"location: {args.location_name}")
     print(f"depth: {args.depth}")
     print()
-    
-    if results:
-        keywords = []
-        for result in results:
-            items = result.get("items", [])
-            for item in items:
-                kw_data = item.get("keyword_data", {})
-                keyword = kw_data.get("keyword", item.get("keyword", ""))
-                volume = kw_data.get("search_volume", item.get("search_volume", 0))
-                difficulty = kw_data.get("keyword_difficulty", item.get("keyword_difficulty", "N/A"))
-                
-                if keyword:
-                    keywords.append({
-                        "keyword": keyword,
-                        "volume": volume if volume is not None else 0,
-                        "difficulty": difficulty
-                    })
-        
-        # Sort by volume desc
-        keywords.sort(key=lambda x: x["volume"], reverse=True)
-        
-        # Display limited results
-        display_keywords = keywords[:args.limit]
-        print(f"related_keywords[{len(display_keywords)} of {len(keywords)}]{{keyword,volume,difficulty}}:")
+
+    out = open(args.output, "w", newline="") if args.output else None
+    writer = None
+    if out and args.output.endswith(".csv"):
+        writer = csv.DictWriter(out, fieldnames=OUTPUT_COLUMNS)
+        writer.writeheader()
+
+    # Top-k by volume in a min-heap; pages are discarded once consumed
+    top, seen, total = [], set(), 0
+    try:
+        for result in iter_pages(task, args.max_items, args.workers):
+            for item in result.get("items") or []:
+                row = item_row(item)
+                if not row["keyword"] or row["keyword"] in seen:
+                    continue
+                seen.add(row["keyword"])
+                total += 1
+                if writer:
+                    writer.writerow(row)
+                elif out:
+                    out.write(json.dumps(row) + "\n")
+                entry = (row["volume"], -total, row)
+                if len(top) < args.limit:
+                    heapq.heappush(top, entry)
+                elif entry > top[0]:
+                    heapq.heapreplace(top, entry)
+    finally:
+        if out:
+            out.close()
+
+    if total:
+        display_keywords = [row for _, _, row in sorted(top, reverse=True)]
+        print(f"related_keywords[{len(display_keywords)} of {total}]{{keyword,volume,difficulty}}:")
         for kw in display_keywords:
             keyword = kw["keyword"]
             volume = format_count(kw["volume"])
             difficulty = kw["difficulty"]
             print(f"  {keyword},{volume},{difficulty}")
         
-        if len(keywords) > args.limit:
-            print(f"\n... and {len(keywords) - args.limit} more keywords (use --limit to show more)")
+        if total > args.limit:
+            if args.output:
+                print(f"\n... and {total - args.limit} more keywords (all {total} written to {args.output})")
+            else:
+                print(f"\n... and {total - args.limit} more keywords (use --limit or --output to see more)")
     else:
         print("No related keywords found")
     
@@ -2,39 +2,62 @@
 """
 SERP analysis using DataForSEO API
 Usage: python3 scripts/serp_analysis.py "best seo tools" --depth 20
+       python3 scripts/serp_analysis.py --file keywords.txt --workers 8
+       python3 scripts/serp_analysis.py --file keywords.txt --queue
 """
 import argparse
-from dataforseo_api import api_post, get_result, print_serp_list, format_count
+import sys
+from dataforseo_api import (api_post_bulk, api_queue_bulk, read_lines, print_serp_list, format_count,
+                            add_api_args, apply_api_args)
+from locations import add_location_args, apply_location_args
 
 
 def main():
     parser = argparse.ArgumentParser(description="SERP analysis")
-    parser.add_argument("keyword", help="Search keyword")
-    parser.add_argument("--location", "-loc", type=int, default=2840,
-                        help="Location code (default: 2840 = US)")
+    parser.add_argument("keywords", nargs="*", help="Search keywords")
+    parser.add_argument("--file", "-f", help="File with one keyword per line ('-' for stdin)")
+    add_location_args(parser, multiple=True)
     parser.add_argument("--depth", "-d", type=int, default=20, help="Search depth")
+    parser.add_argument("--workers", "-w", type=int, default=4, help="Concurrent requests")
+    parser.add_argument("--queue", "-q", action="store_true",
+                        help="Use the cheaper Standard queue (task_post/task_get) instead of live")
+    add_api_args(parser)
     args = parser.parse_args()
+    apply_api_args(args)
+    apply_location_args(parser, args)
 
+    keywords = read_lines(args.keywords, args.file)
+    if not keywords:
+        parser.error("no keywords given")
+
+    # One task per keyword and location
+    queries = [(keyword, code, name) for code, name in args.locations for keyword in keywords]
     data = [{
-        "keyword": args.keyword,
-        "location_code": args.location,
-        "language_code": "en",
+        "keyword": keyword,
+        "location_code": code,
+        "language_code": args.language,
         "depth": args.depth
-    }]
-    
-    response = api_post("serp/google/organic/live/advanced", data)
-    results = get_result(response)
+    } for keyword, code, _ in queries]
     
-    print(f"keyword: {args.keyword}")
-    print(f"location: {args.location}")
-    
-    if results:
-        result = results[0]
-        print(f"total_results: {format_count(result.get('se_results_count'))}")
-        items = result.get("items", [])
-        print_serp_list(items)
+    if args.queue:
+        outcomes = api_queue_bulk("serp/google/organic", data, get_path="task_get/advanced", workers=args.workers)
     else:
-        print("No results found")
+        outcomes = api_post_bulk("serp/google/organic/live/advanced", data, args.workers)
+
+    for i, ((keyword, _, name), (results, error)) in enumerate(zip(queries, outcomes)):
+        if i:
+            print(f"===")
+        print(f"keyword: {keyword}")
+        print(f"location: {name}")
+        if error:
+            print(f"error: {keyword} ({name}): {error}", file=sys.stderr)
+        if results:
+            result = results[0]
+            print(f"total_results: {format_count(result.get('se_results_count'))}")
+            items = result.get("items") or []
+            print_serp_list(items)
+        else:
+            print("No results found")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Cluster keywords by shared top-10 organic URLs (SERP overlap) using DataForSEO
+Usage: python3 scripts/serp_clusters.py --file keywords.txt --threshold 3
+       python3 scripts/serp_clusters.py --file keywords.txt --method seed --queue --output clusters.csv
+"""
+import argparse
+import csv
+import sys
+from urllib.parse import urlsplit
+from dataforseo_api import api_post_bulk, api_queue_bulk, read_lines, add_api_args, apply_api_args
+from locations import add_location_args, apply_location_args
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy required. Install with: pip install numpy")
+    sys.exit(1)
+
+TOP_N = 10
+
+
+def normalize_url(url: str) -> str:
+    """host/path without scheme, www., query-less trailing slash or fragment"""
+    parts = urlsplit(url)
+    host = parts.netloc.lower().removeprefix("www.")
+    path = parts.path.rstrip("/")
+    return f"{host}{path}?{parts.query}" if parts.query else f"{host}{path}"
+
+
+def top_urls(results: list) -> list:
+    """Top organic URLs of one SERP task result"""
+    items = (results[0].get("items") or []) if results else []
+    organic = [i for i in items if i.get("type") == "organic" and i.get("url")]
+    return [normalize_url(i["url"]) for i in organic[:TOP_N]]
+
+
+def incidence(serps: list) -> tuple:
+    """Sparse keyword x URL incidence as parallel (keyword, url) index arrays"""
+    url_index, rows, cols = {}, [], []
+    for k, urls in enumerate(serps):
+        for url in dict.fromkeys(urls):
+            rows.append(k)
+            cols.append(url_index.setdefault(url, len(url_index)))
+    return np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64), len(url_index)
+
+
+def overlaps(rows: np.ndarray, cols: np.ndarray, n_keywords: int) -> tuple:
+    """Off-diagonal nonzeros of A @ A.T: (a, b, shared URLs) for keyword pairs a < b.
+
+    Walks the inverted index (URL -> keywords), so the cost is the number of
+    co-ranking pairs rather than n^2.
+    """
+    order = np.lexsort((rows, cols))
+    rows, cols = rows[order], cols[order]
+    _, starts, counts = np.unique(cols, return_index=True, return_counts=True)
+    pair_a, pair_b = [], []
+    triu = {}
+    for start, count in zip(starts[counts > 1], counts[counts > 1]):
+        if count not in triu:
+            triu[count] = np.triu_indices(count, 1)
+        i, j = triu[count]
+        members = rows[start:start + count]
+        pair_a.append(members[i])
+        pair_b.append(members[j])
+    if not pair_a:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, empty
+    pair_keys = np.concatenate(pair_a) * n_keywords + np.concatenate(pair_b)
+    keys, shared = np.unique(pair_keys, return_counts=True)
+    return keys // n_keywords, keys % n_keywords, shared
+
+
+def components(a: np.ndarray, b: np.ndarray, n: int) -> np.ndarray:
+    """Connected-component labels via vectorized min-label propagation with pointer jumping"""
+    labels = np.arange(n)
+    while True:
+        previous = labels.copy()
+        low = np.minimum(labels[a], labels[b])
+        np.minimum.at(labels, a, low)
+        np.minimum.at(labels, b, low)
+        labels = labels[labels]
+        if np.array_equal(labels, previous):
+            return labels
+
+
+def seed_clusters(a: np.ndarray, b: np.ndarray, n: int) -> np.ndarray:
+    """Each unassigned keyword with the most qualifying neighbours seeds a cluster of
+    its unassigned neighbours; every member then shares the threshold with the seed"""
+    src, dst = np.concatenate([a, b]), np.concatenate([b, a])
+    order = np.argsort(src, kind="stable")
+    src, dst = src[order], dst[order]
+    offsets = np.searchsorted(src, np.arange(n + 1))
+    degree = np.diff(offsets)
+    labels = np.full(n, -1)
+    for seed in np.argsort(-degree, kind="stable"):
+        if labels[seed] >= 0:
+            continue
+        labels[seed] = seed
+        neighbours = dst[offsets[seed]:offsets[seed + 1]]
+        labels[neighbours[labels[neighbours] < 0]] = seed
+    return labels
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cluster keywords by SERP overlap")
+    parser.add_argument("keywords", nargs="*", help="Keywords")
+    parser.add_argument("--file", "-f", help="File with one keyword per line ('-' for stdin)")
+    add_location_args(parser)
+    parser.add_argument("--threshold", "-t", type=int, default=3,
+                        help=f"Shared top-{TOP_N} URLs that link two keywords (default: 3)")
+    parser.add_argument("--method", "-m", choices=["components", "seed"], default="components",
+                        help="components: transitive groups; seed: every member overlaps its seed "
+                             "(default: components)")
+    parser.add_argument("--limit", "-l", type=int, default=50, help="Max clusters to print")
+    parser.add_argument("--output", "-o", help="Write keyword,cluster,head,size rows to this CSV")
+    parser.add_argument("--workers", "-w", type=int, default=8, help="Concurrent requests")
+    parser.add_argument("--queue", "-q", action="store_true",
+                        help="Use the cheaper Standard queue (task_post/task_get) instead of live")
+    add_api_args(parser)
+    args = parser.parse_args()
+    apply_api_args(args)
+    apply_location_args(parser, args)
+
+    keywords = read_lines(args.keywords, args.file)
+    if not keywords:
+        parser.error("no keywords given")
+
+    data = [{
+        "keyword": keyword,
+        "location_code": args.location,
+        "language_code": args.language,
+        "depth": TOP_N,
+    } for keyword in keywords]
+    if args.queue:
+        outcomes = api_queue_bulk("serp/google/organic", data, get_path="task_get/advanced",
+                                  workers=args.workers)
+    else:
+        outcomes = api_post_bulk("serp/google/organic/live/advanced", data, args.workers)
+
+    serps = []
+    for keyword, (results, error) in zip(keywords, outcomes):
+        if error:
+            print(f"error: {keyword}: {error}", file=sys.stderr)
+        serps.append(top_urls(results))
+
+    n = len(keywords)
+    rows, cols, n_urls = incidence(serps)
+    a, b, shared = overlaps(rows, cols, n)
+    linked = shared >= args.threshold
+    a, b = a[linked], b[linked]
+    labels = components(a, b, n) if args.method == "components" else seed_clusters(a, b, n)
+
+    cluster_ids, inverse, sizes = np.unique(labels, return_inverse=True, return_counts=True)
+    # Label each cluster by its best-connected keyword
+    degree = np.bincount(np.concatenate([a, b]), minlength=n)
+    if args.method == "seed":
+        heads = cluster_ids
+    else:
+        order = np.lexsort((-degree, inverse))
+        heads = order[np.searchsorted(inverse[order], np.arange(len(cluster_ids)))]
+    ranked = np.argsort(-sizes, kind="stable")
+    multi = int((sizes > 1).sum())
+
+    print(f"keywords: {n}")
+    print(f"urls: {n_urls}")
+    print(f"linked_pairs: {len(a)} (threshold {args.threshold})")
+    print(f"clusters: {multi} (+{int((sizes == 1).sum())} singletons)")
+    print(f"---")
+    shown = [c for c in ranked if sizes[c] > 1][:args.limit]
+    print(f"clusters[{len(shown)}]{{size,head,keywords}}:")
+    for c in shown:
+        members = np.flatnonzero(inverse == c)
+        print(f"  {sizes[c]},{keywords[heads[c]]},{' | '.join(keywords[m] for m in members)}")
+
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["keyword", "cluster", "head", "size"])
+            for k, keyword in enumerate(keywords):
+                c = inverse[k]
+                writer.writerow([keyword, int(c), keywords[heads[c]], int(sizes[c])])
+        print(f"output: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
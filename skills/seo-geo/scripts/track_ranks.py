@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Record tracked domains' organic positions for a keyword x location set
+Usage: python3 scripts/track_ranks.py --file keywords.txt --domain opc.dev --domain competitor.com
+       python3 scripts/track_ranks.py "seo tools" -d opc.dev -loc 2840 -loc "United Kingdom" --queue
+
+Schedule with cron, e.g. daily at 06:00:
+  0 6 * * * cd <skill_directory> && python3 scripts/track_ranks.py --file keywords.txt -d opc.dev --queue
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+import dataforseo_api
+from dataforseo_api import CACHE_DIR, api_post_bulk, api_queue_bulk, read_lines, add_api_args, apply_api_args
+from locations import add_location_args, apply_location_args
+from rank_store import DEFAULT_STORE, intern, save_run
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy required. Install with: pip install numpy")
+    sys.exit(1)
+
+MAX_RESULT_AGE = 86400  # SERPs older than this are not recorded as a new run
+
+
+def run_journal(data: list) -> str:
+    """Queue journal scoped to the task list and the UTC day, so a scheduled run can resume an
+    interrupted job from the same day but never picks up an earlier day's tasks"""
+    digest = hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()[:16]
+    day = time.strftime("%Y%m%d", time.gmtime())
+    return os.path.join(CACHE_DIR, "jobs", f"track-{digest}-{day}.json")
+
+
+def result_age(results: list) -> float:
+    """Seconds since the SERP was collected (0 when the result carries no datetime)"""
+    stamp = results[0].get("datetime") if results else None
+    if not stamp:
+        return 0
+    try:
+        collected = datetime.strptime(stamp, "%Y-%m-%d %H:%M:%S %z")
+    except ValueError:
+        return 0
+    return (datetime.now(timezone.utc) - collected).total_seconds()
+
+
+def domain_positions(results: list, domains: list) -> list:
+    """Best organic rank_absolute of each domain (0 = not found)"""
+    items = (results[0].get("items") or []) if results else []
+    best = [0] * len(domains)
+    for item in items:
+        if item.get("type") != "organic":
+            continue
+        host = (item.get("domain") or "").lower().removeprefix("www.")
+        rank = item.get("rank_absolute") or 0
+        for d, domain in enumerate(domains):
+            if rank and (host == domain or host.endswith("." + domain)) and (not best[d] or rank < best[d]):
+                best[d] = rank
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Track organic positions over time")
+    parser.add_argument("keywords", nargs="*", help="Keywords")
+    parser.add_argument("--file", "-f", help="File with one keyword per line ('-' for stdin)")
+    parser.add_argument("--domain", "-d", action="append", required=True, help="Domain to track (repeatable)")
+    add_location_args(parser, multiple=True)
+    parser.add_argument("--depth", type=int, default=100, help="SERP depth checked (default: 100)")
+    parser.add_argument("--store", "-s", default=DEFAULT_STORE, help=f"Store directory (default: {DEFAULT_STORE})")
+    parser.add_argument("--workers", "-w", type=int, default=8, help="Concurrent requests")
+    parser.add_argument("--queue", "-q", action="store_true",
+                        help="Use the cheaper Standard queue (task_post/task_get) instead of live")
+    add_api_args(parser)
+    args = parser.parse_args()
+    apply_api_args(args)
+    apply_location_args(parser, args)
+    # Every run must record a live SERP: never read the response cache, only refresh it
+    if dataforseo_api.cache_mode == "on":
+        dataforseo_api.cache_mode = "refresh"
+
+    keywords = read_lines(args.keywords, args.file)
+    if not keywords:
+        parser.error("no keywords given")
+    domains = list(dict.fromkeys(d.lower().removeprefix("www.") for d in args.domain))
+    locations = [code for code, _ in args.locations]
+    queries = [(keyword, location) for location in locations for keyword in keywords]
+
+    data = [{
+        "keyword": keyword,
+        "location_code": location,
+        "language_code": args.language,
+        "depth": args.depth,
+    } for keyword, location in queries]
+    if args.queue:
+        outcomes = api_queue_bulk("serp/google/organic", data, get_path="task_get/advanced",
+                                  journal=run_journal(data), workers=args.workers)
+    else:
+        outcomes = api_post_bulk("serp/google/organic/live/advanced", data, args.workers)
+
+    # Failed tasks are left out of the run rather than recorded as "not ranked"
+    done, positions = [], []
+    for query, (results, error) in zip(queries, outcomes):
+        if error or not results:
+            print(f"error: {query[0]} ({query[1]}): {error or 'no result'}", file=sys.stderr)
+            continue
+        if result_age(results) > MAX_RESULT_AGE:
+            print(f"error: {query[0]} ({query[1]}): stale SERP from {results[0]['datetime']}, "
+                  f"not recorded", file=sys.stderr)
+            continue
+        done.append(query)
+        positions.append(domain_positions(results, domains))
+    if not done:
+        print("No results recorded")
+        return
+
+    query_ids, domain_ids = intern(args.store, done, domains)
+    matrix = np.array(positions, dtype=np.int16)
+    path = save_run(args.store, query_ids, domain_ids, matrix)
+
+    print(f"store: {args.store}")
+    print(f"run: {path}")
+    print(f"queries: {len(done)} of {len(queries)}")
+    print(f"domains[{len(domains)}]{{domain,ranked,top3,top10,avg_position}}:")
+    for d, domain in enumerate(domains):
+        col = matrix[:, d]
+        ranked = col[col > 0]
+        avg = f"{ranked.mean():.1f}" if len(ranked) else "-"
+        print(f"  {domain},{len(ranked)},{int((ranked <= 3).sum())},{int((ranked <= 10).sum())},{avg}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Download or search the local DataForSEO location/language index
+Usage: python3 scripts/update_locations.py                 # (Re)download the index
+       python3 scripts/update_locations.py --search "Berlin"
+       python3 scripts/update_locations.py --languages
+"""
+import argparse
+from locations import INDEX_PATH, load_index, update
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the local location/language index")
+    parser.add_argument("--search", "-s", help="List locations whose name starts with this text (offline)")
+    parser.add_argument("--languages", action="store_true", help="List languages (offline)")
+    parser.add_argument("--limit", "-l", type=int, default=50, help="Max rows (default: 50)")
+    args = parser.parse_args()
+
+    if args.search is None and not args.languages:
+        index = update(INDEX_PATH)
+        print(f"index: {INDEX_PATH}")
+        print(f"locations: {len(index.locations)}")
+        print(f"languages: {len(index.languages)}")
+        return
+
+    index = load_index()
+    if args.search is not None:
+        rows = index.prefix(args.search)
+        print(f"locations[{min(len(rows), args.limit)}]{{code,name,type,country}}:")
+        for code, name, location_type, country in rows[:args.limit]:
+            print(f"  {code},\"{name}\",{location_type},{country}")
+        if len(rows) > args.limit:
+            print(f"  ... {len(rows) - args.limit} more")
+    if args.languages:
+        print(f"languages[{len(index.languages)}]{{code,name}}:")
+        for code, name in sorted(index.languages, key=lambda lang: lang[1]):
+            print(f"  {code},{name}")
+
+
+if __name__ == "__main__":
+    main()